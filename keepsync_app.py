@@ -5,6 +5,7 @@ from pathlib import Path
 from tkinter import filedialog, messagebox
 from typing import Any, Dict, List, Optional
 import json
+import queue
 import threading
 import time
 import uuid
@@ -76,6 +77,16 @@ except ImportError:
 class KeepSyncNotesApp(ctk.CTk):
     """Main application window"""
 
+    # Typing pause before the search box re-queries and rebuilds the note list
+    SEARCH_DEBOUNCE_MS = 200
+    # Note cards built per page; the next page is built when scrolling nears the end of the list
+    NOTE_CARD_PAGE_SIZE = 40
+    NOTE_CARD_PAGE_THRESHOLD = 0.85
+    # Without the scroll hook, cards built per idle callback until the whole list is shown
+    NOTE_CARD_CHUNK_SIZE = 25
+    # Window in which pin/archive clicks are coalesced into one save and one list refresh
+    MUTATION_FLUSH_MS = 100
+
     def __init__(self):
         super().__init__()
 
@@ -119,6 +130,10 @@ class KeepSyncNotesApp(ctk.CTk):
         # State
         self.current_filter = "all"  # all, archived, trash, label:<name>
         self.search_query = ""
+        self._search_after_id = None
+        self._rendered_labels: Optional[tuple] = None
+        self._pending_mutations: Dict[str, Note] = {}
+        self._mutation_flush_id = None
         self.advanced_filters = default_advanced_filters()
         self.pending_delete_undo_note_id: Optional[str] = None
         self.saved_searches = self.db.get_setting("saved_searches", [])
@@ -128,6 +143,13 @@ class KeepSyncNotesApp(ctk.CTk):
         self._reminder_after_id = None
         self._takeout_watch_after_id = None
         self._takeout_watch_in_progress = False
+        # Sync and auto-import jobs run one at a time on a single worker, so repeated clicks queue
+        # up behind a running sync instead of racing it on the database and remote session
+        self._background_queue: queue.Queue = queue.Queue()
+        self._background_thread = threading.Thread(
+            target=self._background_loop, name="keepsync-background", daemon=True
+        )
+        self._background_thread.start()
 
         # Build UI
         self._build_ui()
@@ -138,8 +160,10 @@ class KeepSyncNotesApp(ctk.CTk):
         # Try to restore cloud sync
         self.after(1500, self._try_restore_cloud_sync)
 
-        # Load notes
-        self._refresh_notes_list()
+        # Load labels, folders and notes once the window has been drawn; Tk draws in idle
+        # callbacks queued while building, so these run after the first paint
+        self.after_idle(self._refresh_labels)
+        self.after_idle(self._refresh_notes_list)
         self._schedule_reminder_check(delay_ms=1000)
         self._schedule_takeout_watch_check(delay_ms=5000)
 
@@ -400,8 +424,6 @@ class KeepSyncNotesApp(ctk.CTk):
 
         # Set initial nav state
         self._update_nav_state()
-        self._refresh_folders()
-        self._refresh_labels()
         self._refresh_saved_searches()
 
     def _build_notes_list(self):
@@ -485,6 +507,17 @@ class KeepSyncNotesApp(ctk.CTk):
         self.notes_scroll.pack(fill="both", expand=True, padx=8)
 
         self.note_cards: List[NoteCard] = []
+        self._spare_note_cards: List[NoteCard] = []
+        self._listed_notes: List[Note] = []
+        self._note_page_after_id = None
+        self._note_card_page_size: Optional[int] = None
+        # CTkScrollableFrame has no scroll callback of its own, so watch its canvas's yscrollcommand;
+        # without one every card is still built, a chunk per idle callback
+        canvas = getattr(self.notes_scroll, "_parent_canvas", None)
+        scrollbar = getattr(self.notes_scroll, "_scrollbar", None)
+        if canvas is not None and scrollbar is not None:
+            canvas.configure(yscrollcommand=lambda first, last: self._on_notes_scrolled(scrollbar, first, last))
+            self._note_card_page_size = self.NOTE_CARD_PAGE_SIZE
 
     def _build_editor(self):
         """Build the editor panel"""
@@ -560,72 +593,119 @@ class KeepSyncNotesApp(ctk.CTk):
         """Return notes for the active sidebar/search/filter state."""
         advanced_active = advanced_filters_active(self.advanced_filters)
         include_archived = bool(self.advanced_filters.get("is_archived"))
-        used_indexed_search = False
 
         if self.current_filter == "all" and self.search_query:
             notes = self.db.search_notes(self.search_query, include_archived=include_archived)
-            used_indexed_search = True
         elif self.current_filter == "all":
             notes = self.db.get_all_notes(include_archived=include_archived)
+        elif self.current_filter == "archived" and self.search_query:
+            notes = [n for n in self.db.search_notes(self.search_query, include_archived=True) if n.archived]
         elif self.current_filter == "archived":
-            notes = self.db.get_all_notes(include_archived=True)
-            notes = [n for n in notes if n.archived]
+            notes = self.db.get_archived_notes()
         elif self.current_filter == "trash":
-            notes = self.db.get_all_notes(include_trashed=True)
-            notes = [n for n in notes if n.trashed]
+            # Trashed notes are dropped from the search index, so a trash search matches in SQL
+            notes = self.db.get_trashed_notes(self.search_query)
         elif self.current_filter.startswith("label:"):
             label = self.current_filter[6:]
-            notes = self.db.get_notes_by_label(label)
+            notes = self.db.get_notes_by_label(label, self.search_query)
         elif self.current_filter.startswith("folder:"):
             folder_path = self.current_filter[7:]
-            notes = [
-                note
-                for note in self.db.get_all_notes(include_archived=include_archived)
-                if note_matches_folder(note, folder_path)
-            ]
+            if self.search_query:
+                candidates = self.db.search_notes(self.search_query, include_archived=include_archived)
+            else:
+                candidates = self.db.get_all_notes(include_archived=include_archived)
+            notes = [note for note in candidates if note_matches_folder(note, folder_path)]
         elif self.current_filter.startswith("saved:") and self.search_query:
             notes = self.db.search_notes(self.search_query, include_archived=include_archived)
-            used_indexed_search = True
         elif self.current_filter.startswith("saved:"):
             notes = self.db.get_all_notes(include_archived=include_archived)
+        elif self.search_query:
+            notes = self.db.search_notes(self.search_query)
         else:
             notes = self.db.get_all_notes()
 
-        if self.search_query and not (self.current_filter == "all") and not used_indexed_search:
-            query_lower = self.search_query.lower()
-            notes = [n for n in notes if
-                     query_lower in n.title.lower() or
-                     query_lower in n.content.lower()]
-
         if advanced_active:
             notes = [note for note in notes if note_matches_advanced_filters(note, self.advanced_filters)]
         return notes
 
     def _refresh_notes_list(self):
         """Refresh the notes list based on current filter"""
-        # Clear existing cards
-        for card in self.note_cards:
-            card.destroy()
-        self.note_cards.clear()
-
+        self._save_note_mutations()
         notes = self._get_filtered_notes_for_current_view()
         self._update_filter_summary()
 
         # Update count
         self.notes_count_label.configure(text=f"{len(notes)} note{'s' if len(notes) != 1 else ''}")
 
-        # Create cards
+        self._listed_notes = notes
+        if self._note_card_page_size is None:
+            # Show the top of the list now and stream the rest in between events
+            self._render_note_cards(max(self.NOTE_CARD_CHUNK_SIZE, len(self.note_cards)))
+            self._stream_note_cards()
+        else:
+            # Keep at least as many cards as were already scrolled into view
+            self._render_note_cards(max(self._note_card_page_size, len(self.note_cards)))
+
+    def _on_notes_scrolled(self, scrollbar, first, last):
+        scrollbar.set(first, last)
+        if (
+            float(last) >= self.NOTE_CARD_PAGE_THRESHOLD
+            and len(self.note_cards) < len(self._listed_notes)
+            and not self._note_page_after_id
+        ):
+            self._note_page_after_id = self.after_idle(self._show_next_note_page)
+
+    def _show_next_note_page(self):
+        self._note_page_after_id = None
+        if self._note_card_page_size is None:
+            self._render_note_cards(len(self.note_cards) + self.NOTE_CARD_CHUNK_SIZE)
+            self._stream_note_cards()
+        else:
+            self._render_note_cards(len(self.note_cards) + self._note_card_page_size)
+
+    def _stream_note_cards(self):
+        if len(self.note_cards) < len(self._listed_notes) and not self._note_page_after_id:
+            self._note_page_after_id = self.after_idle(self._show_next_note_page)
+
+    def _render_note_cards(self, limit: int):
+        """Show cards for the first limit listed notes."""
+        notes = self._listed_notes[:limit]
+        # Reuse cards: a note still listed keeps its own card, other notes refill cards from
+        # the hidden pool, and only the shortfall is built new
+        previous = self.note_cards
+        shown_ids = {note.id for note in notes}
+        cards_by_id = {card.note.id: card for card in previous if card.note.id in shown_ids}
+        spare = self._spare_note_cards + [card for card in previous if card.note.id not in shown_ids]
+        cards = []
         for note in notes:
-            card = NoteCard(
-                self.notes_scroll,
-                note,
-                on_click=self._open_note,
-                on_pin=self._toggle_pin,
-                on_delete=self._delete_note,
-                on_archive=self._archive_note
-            )
+            card = cards_by_id.pop(note.id, None)
+            if card is None and spare:
+                card = spare.pop()
+            if card is None:
+                card = NoteCard(
+                    self.notes_scroll,
+                    note,
+                    on_click=self._open_note,
+                    on_pin=self._toggle_pin,
+                    on_delete=self._delete_note,
+                    on_archive=self._archive_note
+                )
+            else:
+                card.update_from_note(note)
+            cards.append(card)
+
+        # Cards that lead both sequences stay packed; only the rest is repacked in order
+        kept = 0
+        for card, old in zip(cards, previous):
+            if card is not old:
+                break
+            kept += 1
+        for card in previous[kept:]:
+            card.pack_forget()
+        for card in cards[kept:]:
             card.pack(fill="x", pady=4, padx=4)
-            self.note_cards.append(card)
+        self.note_cards = cards
+        self._spare_note_cards = spare
 
     def _refresh_folders(self):
         """Refresh the hierarchical folders list in the sidebar."""
@@ -659,10 +739,15 @@ class KeepSyncNotesApp(ctk.CTk):
 
     def _refresh_labels(self):
         """Refresh the labels list in sidebar"""
+        labels = self.db.get_all_labels()
+        # Folders are derived from label names too, so an unchanged list leaves both sidebars as they are
+        names = tuple(label.name for label in labels)
+        if names == self._rendered_labels:
+            return
+        self._rendered_labels = names
         for widget in self.labels_frame.winfo_children():
             widget.destroy()
 
-        labels = self.db.get_all_labels()
         for label in labels:
             btn = ctk.CTkButton(
                 self.labels_frame,
@@ -700,15 +785,25 @@ class KeepSyncNotesApp(ctk.CTk):
             btn.pack(fill="x", pady=1)
 
     def _on_search(self, event=None):
-        """Handle search input"""
-        self.search_query = self.search_entry.get()
+        """Handle search input once typing pauses"""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(self.SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self):
+        self._search_after_id = None
+        query = self.search_entry.get()
+        # Arrow, modifier and other keys that leave the text alone need no refresh
+        if query == self.search_query:
+            return
+        self.search_query = query
         self._refresh_notes_list()
 
     def _open_advanced_filters(self):
         AdvancedFilterDialog(self, self.advanced_filters, self._apply_advanced_filters)
 
     def _open_tag_graph(self):
-        graph = build_tag_graph(self.db.get_all_notes(include_archived=True))
+        graph = build_tag_graph(self.db.get_all_note_summaries(include_archived=True))
         dialog = ctk.CTkToplevel(self)
         dialog.title("Tag Graph")
         dialog.geometry("520x560")
@@ -992,23 +1087,71 @@ class KeepSyncNotesApp(ctk.CTk):
     def _toggle_pin(self, note: Note):
         """Toggle note pinned status"""
         note.pinned = not note.pinned
-        note.local_modified = datetime.now(timezone.utc)
-        if note.keep_id:
-            note.sync_status = SyncStatus.PENDING_PUSH
-        self.db.save_note(note)
-        self._refresh_notes_list()
+        self._queue_note_mutation(note)
 
     def _archive_note(self, note: Note):
         """Archive a note"""
         note.archived = True
+        self._queue_note_mutation(note)
+
+    def _queue_note_mutation(self, note: Note):
+        """Show a pin/archive change on its card now and save it with the rest of its batch."""
         note.local_modified = datetime.now(timezone.utc)
         if note.keep_id:
             note.sync_status = SyncStatus.PENDING_PUSH
-        self.db.save_note(note)
+        self._pending_mutations[note.id] = note
+        for card in self.note_cards:
+            if card.note.id != note.id:
+                continue
+            if note.archived:
+                card.pack_forget()
+            else:
+                pin_btn = getattr(card, "pin_btn", None)
+                if pin_btn is not None:
+                    pin_btn.configure(text="Unpin" if note.pinned else "Pin")
+                card.sync_badge.update_status(note.sync_status)
+            break
+        if not self._mutation_flush_id:
+            self._mutation_flush_id = self.after(self.MUTATION_FLUSH_MS, self._flush_note_mutations)
+
+    def _flush_note_mutations(self):
+        self._mutation_flush_id = None
         self._refresh_notes_list()
 
+    def _save_note_mutations(self):
+        """Write queued pin/archive changes in one transaction."""
+        if self._mutation_flush_id:
+            self.after_cancel(self._mutation_flush_id)
+            self._mutation_flush_id = None
+        if self._pending_mutations:
+            notes = list(self._pending_mutations.values())
+            self._pending_mutations.clear()
+            if not self.db.save_notes(notes):
+                self._revert_note_mutations(notes)
+
+    def _revert_note_mutations(self, notes: List[Note]):
+        """Put unsaved pin/archive changes back to what is stored and say the save failed.
+
+        The objects are shared with the list and the editor, so they are reset in place; the
+        list refresh that follows every save re-reads the rows and redraws the cards.
+        """
+        stored = self.db.get_notes_by_ids(note.id for note in notes)
+        for note in notes:
+            current = stored.get(note.id)
+            if current:
+                note.pinned = current.pinned
+                note.archived = current.archived
+                note.sync_status = current.sync_status
+                note.local_modified = current.local_modified
+                note.updated_at = current.updated_at
+                note.content_hash = current.content_hash
+        log_diagnostic_event("error", f"Failed to save pin/archive changes for {len(notes)} notes")
+        self.sync_status_label.configure(text="Changes not saved", text_color=COLORS["accent_red"])
+
     def _delete_note(self, note: Note):
         """Delete a note (move to trash)"""
+        # A queued pin/archive save must not land after the delete and resurrect the note
+        self._save_note_mutations()
         if note.trashed:
             try:
                 LocalBackupManager(self.db, APP_NAME, APP_VERSION).create_backup("before permanent delete")
@@ -1088,16 +1231,30 @@ class KeepSyncNotesApp(ctk.CTk):
             success, message, stats = self.sync_engine.sync()
             self.after(0, lambda: self._on_sync_complete(success, message, stats))
 
-        threading.Thread(target=do_sync, daemon=True).start()
+        self._run_in_background(do_sync)
+
+    def _run_in_background(self, job):
+        """Queue job for the background worker; it reports back to the UI with self.after."""
+        self._background_queue.put(job)
+
+    def _background_loop(self):
+        while True:
+            job = self._background_queue.get()
+            if job is None:
+                return
+            try:
+                job()
+            except Exception as e:
+                log_diagnostic_exception("background task", e)
 
     def _on_sync_complete(self, success: bool, message: str, stats: dict):
         """Handle sync completion"""
         self.sync_btn.configure(state="normal")
         if success:
-            self.sync_status_label.configure(
-                text=f"Synced ↓{stats.get('pulled', 0)} ↑{stats.get('pushed', 0)}",
-                text_color=COLORS["accent_green"]
-            )
+            text = f"Synced ↓{stats.get('pulled', 0)} ↑{stats.get('pushed', 0)}"
+            if stats.get("unlinked"):
+                text += f" · {stats['unlinked']} unlinked"
+            self.sync_status_label.configure(text=text, text_color=COLORS["accent_green"])
         else:
             log_diagnostic_event("error", f"Keep sync failed: {message}")
             self.sync_status_label.configure(
@@ -1225,16 +1382,15 @@ class KeepSyncNotesApp(ctk.CTk):
         """Update the cloud sync status in the sidebar"""
         if self.cloud_sync.is_connected():
             status = self.cloud_sync.get_status()
-            provider = status.get("provider", "Cloud")
-            self.sync_status_label.configure(
-                text=f"☁️ {provider}",
-                text_color=COLORS["accent_green"]
-            )
+            text, color = f"☁️ {status.get('provider', 'Cloud')}", COLORS["accent_green"]
+        elif self.sync_engine.is_authenticated:
+            text, color = "Connected", COLORS["accent_green"]
         else:
-            if self.sync_engine.is_authenticated:
-                self.sync_status_label.configure(text="Connected", text_color=COLORS["accent_green"])
-            else:
-                self.sync_status_label.configure(text="Local only", text_color=COLORS["text_muted"])
+            text, color = "Local only", COLORS["text_muted"]
+        # Other actions write to this label too, so compare with what it shows rather than a cached value
+        label = self.sync_status_label
+        if label.cget("text") != text or label.cget("text_color") != color:
+            label.configure(text=text, text_color=color)
 
     def _cloud_sync_now(self):
         """Manually trigger cloud sync"""
@@ -1245,7 +1401,7 @@ class KeepSyncNotesApp(ctk.CTk):
                 success, message, stats = self.cloud_sync.sync()
                 self.after(0, lambda: self._on_cloud_sync_complete(success, message, stats))
 
-            threading.Thread(target=do_sync, daemon=True).start()
+            self._run_in_background(do_sync)
         else:
             self._manual_sync()  # Fall back to Keep sync
 
@@ -1374,7 +1530,7 @@ class KeepSyncNotesApp(ctk.CTk):
             self.db.set_setting("takeout_processed_imports", updated_processed)
             self.after(0, lambda: self._on_takeout_watch_complete(imported, errors))
 
-        threading.Thread(target=do_import, daemon=True).start()
+        self._run_in_background(do_import)
 
     def _on_takeout_watch_complete(self, imported: int, errors: int):
         self._takeout_watch_in_progress = False
@@ -1447,5 +1603,7 @@ class KeepSyncNotesApp(ctk.CTk):
             self._tray = None
         self.sync_engine.stop_auto_sync()
         self.cloud_sync.stop_auto_sync()
+        self._background_queue.put(None)
+        self._save_note_mutations()
         self.db.close()
         self.destroy()
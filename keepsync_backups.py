@@ -42,7 +42,7 @@ class LocalBackupManager:
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_db = Path(temp_dir) / "notes.db"
             if self.db.conn:
-                self.db.conn.commit()
+                self.db.flush_writes()
                 target = sqlite3.connect(temp_db)
                 try:
                     self.db.conn.backup(target)
@@ -105,6 +105,8 @@ class LocalBackupManager:
             restored_db = temp_root / "notes.db"
             if self.db.conn:
                 self.db.close()
+            for suffix in ("-wal", "-shm"):
+                Path(f"{self.db_path}{suffix}").unlink(missing_ok=True)
             shutil.copy2(restored_db, self.db_path)
 
             restored_attachments = temp_root / "attachments"
@@ -3,14 +3,37 @@
 import hashlib
 import json
 import uuid
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from keepsync_models import Note, SyncStatus
+from keepsync_models import CONTENT_HASH_DIGEST_SIZE, Attachment, ChecklistItem, Note, NoteType, SyncStatus
+
+
+# Stands in for created_at/updated_at, which the content hash ignores, so hashing skips datetime.now().
+_UNHASHED_TIMESTAMP = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 
 def note_data_hash(data: Dict[str, Any]) -> str:
     try:
-        note = Note.from_dict(data)
+        # Only the hashed fields are decoded: no sync-state enum or bookkeeping timestamps per remote note.
+        note = Note(
+            id=data["id"],
+            title=data.get("title", ""),
+            content=data.get("content", ""),
+            note_type=NoteType(data.get("note_type", "note")),
+            checklist_items=[ChecklistItem.from_dict(i) for i in data.get("checklist_items", [])],
+            labels=data.get("labels", []),
+            pinned=data.get("pinned", False),
+            archived=data.get("archived", False),
+            trashed=data.get("trashed", False),
+            color=data.get("color", ""),
+            reminder_at=datetime.fromisoformat(data["reminder_at"]) if data.get("reminder_at") else None,
+            reminder_location=data.get("reminder_location", ""),
+            shared_with=data.get("shared_with", []),
+            attachments=[Attachment.from_dict(a) for a in data.get("attachments", [])],
+            created_at=_UNHASHED_TIMESTAMP,
+            updated_at=_UNHASHED_TIMESTAMP,
+        )
         return note.content_hash
     except Exception:
         comparable = {
@@ -18,13 +41,15 @@ def note_data_hash(data: Dict[str, Any]) -> str:
             for key, value in data.items()
             if key not in {"local_modified", "remote_modified", "sync_status"}
         }
-        return hashlib.md5(json.dumps(comparable, sort_keys=True, default=str).encode()).hexdigest()
+        payload = json.dumps(comparable, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(payload, digest_size=CONTENT_HASH_DIGEST_SIZE).hexdigest()
 
 
 def build_cloud_sync_plan(
     local_notes: List[Note],
     remote_notes: Dict[str, Dict[str, Any]],
     base_versions: Dict[str, str],
+    remote_hashes: Optional[Dict[str, str]] = None,
 ) -> Dict[str, List[Any]]:
     plan = {
         "download_creates": [],
@@ -41,7 +66,11 @@ def build_cloud_sync_plan(
         remote_data = remote_notes.get(note_id)
         base_hash = base_versions.get(note_id)
         local_hash = local_note.content_hash if local_note else None
-        remote_hash = note_data_hash(remote_data) if remote_data else None
+        # Providers pass known hashes for remote notes whose body was not downloaded
+        if remote_data and remote_hashes and note_id in remote_hashes:
+            remote_hash = remote_hashes[note_id]
+        else:
+            remote_hash = note_data_hash(remote_data) if remote_data else None
 
         if local_note and not remote_data:
             if base_hash and local_hash == base_hash:
@@ -1,9 +1,13 @@
 """Cloud sync providers for Google Drive and GitHub backends."""
 
-import json
+import hashlib
+import importlib.util
+import io
 import os
-import tempfile
+import queue
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Callable, Dict, List, Optional
 
@@ -13,6 +17,7 @@ from keepsync_cloud_plan import (
     build_cloud_sync_plan,
     cloud_base_versions,
     cloud_plan_counts,
+    note_data_hash,
     save_cloud_conflict_copy,
 )
 from keepsync_credentials import (
@@ -23,6 +28,7 @@ from keepsync_credentials import (
     store_file_secret,
 )
 from keepsync_diagnostics import log_diagnostic_event, log_diagnostic_exception
+from keepsync_json import json_dumps, json_dumps_bytes, json_dumps_pretty, json_loads
 from keepsync_models import Note
 from keepsync_paths import (
     get_app_data_dir,
@@ -32,6 +38,16 @@ from keepsync_paths import (
 from keepsync_storage import DatabaseManager
 
 
+# Probed without importing it: PyGithub is only imported when a connect actually needs it
+PYGITHUB_AVAILABLE = importlib.util.find_spec("github") is not None
+
+
+def git_blob_sha(content: str) -> str:
+    """Git's object id for a file holding content as UTF-8, as reported in ContentFile.sha."""
+    data = content.encode("utf-8")
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
 class CloudSyncProvider:
     """Base class for cloud sync providers"""
 
@@ -49,16 +65,60 @@ class CloudSyncProvider:
         self.is_connected = False
         self.last_sync: Optional[datetime] = None
         self.sync_callbacks: List[Callable] = []
+        self._notify_queue: "queue.Queue[tuple[str, str]]" = queue.Queue()
+        self._notify_thread: Optional[threading.Thread] = None
+        self._notify_lock = threading.Lock()
+        # note id -> (version, serialized note). Most writes bump updated_at, but unlinking changes
+        # only sync_status and a hash migration only content_hash, so both join the version key
+        self._json_cache: Dict[str, tuple[tuple, bytes]] = {}
 
     def add_callback(self, callback: Callable):
         self.sync_callbacks.append(callback)
 
+    def _encode_note(self, note: Note) -> bytes:
+        return json_dumps_bytes(note.to_dict())
+
+    def _note_json(self, note: Note) -> bytes:
+        """Serialized note, reused across syncs until the note is written again."""
+        version = (note.updated_at, note.content_hash, note.sync_status)
+        hit = self._json_cache.get(note.id)
+        if hit and hit[0] == version:
+            return hit[1]
+        data = self._encode_note(note)
+        self._json_cache[note.id] = (version, data)
+        return data
+
+    def _prune_json_cache(self, notes: List[Note]):
+        for note_id in self._json_cache.keys() - {note.id for note in notes}:
+            del self._json_cache[note_id]
+
     def _notify(self, status: str, message: str):
-        for cb in self.sync_callbacks:
+        """Queue a status update; callbacks run in order on a notifier thread so sync never waits on them."""
+        if not self.sync_callbacks:
+            return
+        with self._notify_lock:
+            if self._notify_thread is None:
+                self._notify_thread = threading.Thread(
+                    target=self._notify_loop, name="keepsync-cloud-notify", daemon=True
+                )
+                self._notify_thread.start()
+        self._notify_queue.put((status, message))
+
+    def _notify_loop(self):
+        while True:
+            status, message = self._notify_queue.get()
             try:
-                cb(status, message)
-            except:
-                pass
+                for cb in list(self.sync_callbacks):
+                    try:
+                        cb(status, message)
+                    except:
+                        pass
+            finally:
+                self._notify_queue.task_done()
+
+    def flush_notifications(self):
+        """Block until every queued status update has been delivered."""
+        self._notify_queue.join()
 
     def connect(self, **kwargs) -> tuple[bool, str]:
         raise NotImplementedError
@@ -81,6 +141,12 @@ class GoogleDriveSync(CloudSyncProvider):
 
     FOLDER_NAME = "KeepSync Notes Backup"
     NOTES_FILE = "notes_backup.json"
+    FOLDER_ID_SETTING = "gdrive_folder_id"
+    NOTES_FILE_ID_SETTING = "gdrive_notes_file_id"
+    # md5 of the notes.json this device last uploaded, compared with Drive's md5Checksum
+    NOTES_MD5_SETTING = "gdrive_notes_md5"
+    UPLOAD_CHUNK_SIZE = 10 * 1024 * 1024
+    UPLOAD_RETRIES = 5
     SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
     def __init__(
@@ -128,7 +194,7 @@ class GoogleDriveSync(CloudSyncProvider):
             # Load existing token from OS keyring, migrating the old JSON token file if present.
             token_json = migrate_file_secret(token_path, GDRIVE_OAUTH_TOKEN_CREDENTIAL)
             if token_json:
-                creds = Credentials.from_authorized_user_info(json.loads(token_json), self.SCOPES)
+                creds = Credentials.from_authorized_user_info(json_loads(token_json), self.SCOPES)
 
             # Refresh or get new credentials
             if not creds or not creds.valid:
@@ -153,6 +219,9 @@ class GoogleDriveSync(CloudSyncProvider):
                     return False, f"Google Drive token was not saved because OS keyring is unavailable: {credentials_state.SECURE_CREDENTIALS.last_error}"
 
             self.creds = creds
+            # googleapiclient already sends accept-encoding: gzip and the "(gzip)" user-agent tag
+            # Google's servers key compression on, for API calls and media downloads alike.
+            # The service is kept for the whole connection, so its httplib2 keep-alive socket is reused.
             self.service = build('drive', 'v3', credentials=creds)
 
             # Find or create our folder
@@ -170,17 +239,26 @@ class GoogleDriveSync(CloudSyncProvider):
 
     def _ensure_folder(self):
         """Find or create the backup folder in Google Drive"""
-        # Search for existing folder
-        results = self.service.files().list(
-            q=f"name='{self.FOLDER_NAME}' and mimeType='application/vnd.google-apps.folder' and trashed=false",
-            spaces='drive',
-            fields='files(id, name)'
-        ).execute()
-
-        files = results.get('files', [])
+        # A remembered folder id costs one small get instead of a search.
+        cached_id = self.db.get_setting(self.FOLDER_ID_SETTING)
+        if cached_id:
+            try:
+                folder = self.service.files().get(fileId=cached_id, fields='id, trashed').execute()
+                if not folder.get('trashed'):
+                    self.folder_id = folder.get('id', cached_id)
+                    return
+            except Exception:
+                pass
 
-        if files:
-            self.folder_id = files[0]['id']
+        # Search for existing folder
+        folder_id = self._find_file_id(
+            f"name='{self.FOLDER_NAME}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
+        )
+
+        # A different folder means the remembered notes file is not in it
+        self.db.delete_setting(self.NOTES_FILE_ID_SETTING)
+        if folder_id:
+            self.folder_id = folder_id
         else:
             # Create folder
             file_metadata = {
@@ -190,6 +268,39 @@ class GoogleDriveSync(CloudSyncProvider):
             folder = self.service.files().create(body=file_metadata, fields='id').execute()
             self.folder_id = folder.get('id')
 
+        if self.folder_id:
+            self.db.set_setting(self.FOLDER_ID_SETTING, self.folder_id)
+
+    def _notes_file(self) -> tuple[Optional[str], Optional[str]]:
+        """Id and md5Checksum of the notes backup file, checking the remembered id before searching"""
+        cached_id = self.db.get_setting(self.NOTES_FILE_ID_SETTING)
+        if cached_id:
+            try:
+                remote_file = self.service.files().get(
+                    fileId=cached_id, fields='id, trashed, md5Checksum'
+                ).execute()
+                if not remote_file.get('trashed'):
+                    return remote_file.get('id', cached_id), remote_file.get('md5Checksum')
+            except Exception:
+                pass
+            self.db.delete_setting(self.NOTES_FILE_ID_SETTING)
+
+        file_id = self._find_file_id(
+            f"name='{self.NOTES_FILE}' and '{self.folder_id}' in parents and trashed=false"
+        )
+        return file_id, None
+
+    def _find_file_id(self, query: str) -> Optional[str]:
+        """Id of the first Drive file matching query; only one is ever used, so one is requested."""
+        results = self.service.files().list(
+            q=query,
+            spaces='drive',
+            pageSize=1,
+            fields='files(id)'
+        ).execute()
+        files = results.get('files', [])
+        return files[0]['id'] if files else None
+
     def disconnect(self):
         """Disconnect from Google Drive"""
         self.service = None
@@ -197,6 +308,9 @@ class GoogleDriveSync(CloudSyncProvider):
         self.folder_id = None
         self.is_connected = False
         self.db.set_setting("cloud_provider", None)
+        self.db.delete_setting(self.FOLDER_ID_SETTING)
+        self.db.delete_setting(self.NOTES_FILE_ID_SETTING)
+        self.db.delete_setting(self.NOTES_MD5_SETTING)
         credentials_state.SECURE_CREDENTIALS.delete_secret(GDRIVE_OAUTH_TOKEN_CREDENTIAL)
         self._notify("disconnected", "Disconnected from Google Drive")
 
@@ -215,29 +329,23 @@ class GoogleDriveSync(CloudSyncProvider):
 
             # Get local notes
             local_notes = self.db.get_all_notes(include_archived=True, include_trashed=False)
-            local_data = {
-                "version": self.db_version,
-                "synced_at": datetime.now(timezone.utc).isoformat(),
-                "notes": [n.to_dict() for n in local_notes],
-                "labels": [l.to_dict() for l in self.db.get_all_labels()]
-            }
+            base_versions = self.db.get_setting("cloud_base_gdrive", {})
+            if not isinstance(base_versions, dict):
+                base_versions = {}
 
             # Check for existing backup file
-            results = self.service.files().list(
-                q=f"name='{self.NOTES_FILE}' and '{self.folder_id}' in parents and trashed=false",
-                spaces='drive',
-                fields='files(id, name, modifiedTime)'
-            ).execute()
-
-            remote_files = results.get('files', [])
+            file_id, remote_md5 = self._notes_file()
             remote_notes = {}
+            remote_hashes = None
 
-            if remote_files:
+            if file_id and remote_md5 and remote_md5 == self.db.get_setting(self.NOTES_MD5_SETTING):
+                # Untouched since this device uploaded it, so it holds exactly the base versions
+                remote_notes = {note_id: {"id": note_id} for note_id in base_versions}
+                remote_hashes = base_versions
+            elif file_id:
                 # Download and merge with remote
-                file_id = remote_files[0]['id']
 
                 # Download remote file
-                import io
                 from googleapiclient.http import MediaIoBaseDownload
 
                 request = self.service.files().get_media(fileId=file_id)
@@ -247,17 +355,13 @@ class GoogleDriveSync(CloudSyncProvider):
                 while not done:
                     _, done = downloader.next_chunk()
 
-                fh.seek(0)
-                remote_data = json.loads(fh.read().decode('utf-8'))
+                remote_data = json_loads(fh.getvalue())
                 remote_notes = {
                     note["id"]: note for note in remote_data.get("notes", [])
                     if isinstance(note, dict) and note.get("id")
                 }
 
-            base_versions = self.db.get_setting("cloud_base_gdrive", {})
-            if not isinstance(base_versions, dict):
-                base_versions = {}
-            plan = build_cloud_sync_plan(local_notes, remote_notes, base_versions)
+            plan = build_cloud_sync_plan(local_notes, remote_notes, base_versions, remote_hashes)
             dry_run = cloud_plan_counts(plan)
             stats["dry_run"] = dry_run
             log_diagnostic_event("info", f"Google Drive sync plan: {dry_run}")
@@ -281,36 +385,54 @@ class GoogleDriveSync(CloudSyncProvider):
             stats["deleted"] += len(plan["delete_remote"])
             stats["uploaded"] = len(plan["upload_creates"]) + len(plan["upload_updates"])
             local_notes = self.db.get_all_notes(include_archived=True, include_trashed=False)
-            local_data["notes"] = [n.to_dict() for n in local_notes]
-
-            # Upload merged data
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump(local_data, f, indent=2)
-                temp_path = f.name
-
-            from googleapiclient.http import MediaFileUpload
-            media = MediaFileUpload(temp_path, mimetype='application/json')
+            local_data = {
+                "version": self.db_version,
+                "synced_at": datetime.now(timezone.utc).isoformat(),
+                "labels": [l.to_dict() for l in self.db.get_all_labels()]
+            }
+            # Notes are spliced in from per-note cached JSON, so unchanged notes are not re-encoded
+            payload = b"".join((
+                json_dumps_bytes(local_data)[:-1],
+                b',"notes":[',
+                b",".join(self._note_json(note) for note in local_notes),
+                b"]}",
+            ))
+            self._prune_json_cache(local_notes)
+
+            # Upload merged data straight from memory as compact JSON
+            from googleapiclient.http import MediaIoBaseUpload
+            media = MediaIoBaseUpload(
+                io.BytesIO(payload),
+                mimetype='application/json',
+                chunksize=self.UPLOAD_CHUNK_SIZE,
+                resumable=True,
+            )
 
-            if remote_files:
+            if file_id:
                 # Update existing file
-                self.service.files().update(
-                    fileId=remote_files[0]['id'],
+                request = self.service.files().update(
+                    fileId=file_id,
                     media_body=media
-                ).execute()
+                )
             else:
                 # Create new file
                 file_metadata = {
                     'name': self.NOTES_FILE,
                     'parents': [self.folder_id]
                 }
-                self.service.files().create(
+                request = self.service.files().create(
                     body=file_metadata,
                     media_body=media,
                     fields='id'
-                ).execute()
-
-            os.unlink(temp_path)
+                )
+            # Resumable: a transient 429/5xx retries the current chunk with backoff instead of the whole file
+            response = None
+            while response is None:
+                _, response = request.next_chunk(num_retries=self.UPLOAD_RETRIES)
+            file_id = response.get('id', file_id) if isinstance(response, dict) else file_id
+            if file_id:
+                self.db.set_setting(self.NOTES_FILE_ID_SETTING, file_id)
+                self.db.set_setting(self.NOTES_MD5_SETTING, hashlib.md5(payload).hexdigest())
 
             self.last_sync = datetime.now(timezone.utc)
             self.db.set_setting("gdrive_last_sync", self.last_sync.isoformat())
@@ -334,6 +456,14 @@ class GitHubSync(CloudSyncProvider):
     NOTES_DIR = "notes"
     LABELS_FILE = "labels.json"
     METADATA_FILE = "metadata.json"
+    # Blob sha of the labels.json this device last committed
+    LABELS_SHA_SETTING = "github_labels_sha"
+    # note id -> [blob sha, content hash] of each remote note file as of the last sync
+    NOTE_BLOBS_SETTING = "github_note_blobs"
+    # owner/name of the repository last verified by a full connect
+    REPO_FULL_NAME_SETTING = "github_repo_full_name"
+    # Concurrent note downloads, matched by the HTTP connection pool handed to PyGithub
+    FETCH_WORKERS = 16
 
     def __init__(
         self,
@@ -360,20 +490,34 @@ class GitHubSync(CloudSyncProvider):
             repo_name: Repository name (e.g., 'my-notes-backup')
             create_if_missing: Create repo if it doesn't exist
         """
+        if not PYGITHUB_AVAILABLE:
+            return False, "PyGithub is not installed. Run: python -m pip install -r requirements.txt"
         try:
             try:
                 from github import Github, GithubException
             except ImportError:
                 return False, "PyGithub is not installed. Run: python -m pip install -r requirements.txt"
 
+            saved_token = not token
             token = token or migrate_setting_secret(self.db, "github_token", GITHUB_PAT_CREDENTIAL)
             if not token:
                 return False, "GitHub token not found in the OS keyring. Enter a token once to save it securely."
 
-            self.github = Github(token)
+            # One client per connection: its requests.Session keeps a pooled, retrying HTTPAdapter
+            # alive across every sync, so only the first request pays for the TLS handshake
+            self.github = Github(token, pool_size=self.FETCH_WORKERS)
             self.token = token
             self.repo_name = repo_name
 
+            # Reconnecting with the keyring token to the repo already verified: open it lazily,
+            # so startup makes no request and the first sync is the first round-trip
+            full_name = self.db.get_setting(self.REPO_FULL_NAME_SETTING)
+            if saved_token and full_name and self.db.get_setting("github_repo") == repo_name:
+                self.repo = self.github.get_repo(full_name, lazy=True)
+                self.is_connected = True
+                self._notify("connected", f"Connected to GitHub: {repo_name}")
+                return True, f"Connected to GitHub repository: {repo_name}"
+
             # Get authenticated user
             user = self.github.get_user()
 
@@ -406,6 +550,7 @@ class GitHubSync(CloudSyncProvider):
             self.is_connected = True
             self.db.set_setting("cloud_provider", "github")
             self.db.set_setting("github_repo", repo_name)
+            self.db.set_setting(self.REPO_FULL_NAME_SETTING, self.repo.full_name)
             if not credentials_state.SECURE_CREDENTIALS.set_secret(GITHUB_PAT_CREDENTIAL, token):
                 self.db.log_sync("credentials", "github", "warning", credentials_state.SECURE_CREDENTIALS.last_error)
                 self._notify("connected", f"Connected to GitHub: {repo_name}")
@@ -427,6 +572,9 @@ class GitHubSync(CloudSyncProvider):
         self.is_connected = False
         self.db.set_setting("cloud_provider", None)
         self.db.delete_setting("github_token")
+        self.db.delete_setting(self.LABELS_SHA_SETTING)
+        self.db.delete_setting(self.NOTE_BLOBS_SETTING)
+        self.db.delete_setting(self.REPO_FULL_NAME_SETTING)
         credentials_state.SECURE_CREDENTIALS.delete_secret(GITHUB_PAT_CREDENTIAL)
         self._notify("disconnected", "Disconnected from GitHub")
 
@@ -448,22 +596,39 @@ class GitHubSync(CloudSyncProvider):
             # Get local notes
             local_notes = self.db.get_all_notes(include_archived=True, include_trashed=False)
 
+            base_versions = self.db.get_setting("cloud_base_github", {})
+            if not isinstance(base_versions, dict):
+                base_versions = {}
+            known_blobs = self.db.get_setting(self.NOTE_BLOBS_SETTING, {})
+            if not isinstance(known_blobs, dict):
+                known_blobs = {}
+
             # Get remote notes
             remote_notes = {}
+            remote_hashes = {}
             try:
-                contents = self.repo.get_contents(self.NOTES_DIR)
+                contents = [c for c in self.repo.get_contents(self.NOTES_DIR) if c.name.endswith('.json')]
+                changed = []
                 for content in contents:
-                    if content.name.endswith('.json'):
-                        note_data = json.loads(content.decoded_content.decode('utf-8'))
-                        remote_notes[note_data['id']] = (note_data, content.sha)
+                    note_id = content.name[:-len('.json')]
+                    known = known_blobs.get(note_id)
+                    # Same blob as last sync and still the base version: skip downloading its body
+                    if known and known[0] == content.sha and known[1] == base_versions.get(note_id):
+                        remote_notes[note_id] = ({"id": note_id}, content.sha)
+                        remote_hashes[note_id] = known[1]
+                    else:
+                        changed.append(content)
+                # Each decoded_content is its own GET, so fetch in parallel and parse here
+                with ThreadPoolExecutor(max_workers=self.FETCH_WORKERS) as pool:
+                    fetched = list(pool.map(lambda c: (c.decoded_content, c.sha), changed))
+                for raw, sha in fetched:
+                    note_data = json_loads(raw)
+                    remote_notes[note_data['id']] = (note_data, sha)
             except GithubException as e:
                 if e.status != 404:  # 404 means folder doesn't exist yet
                     raise
             remote_note_data = {note_id: note_data for note_id, (note_data, _sha) in remote_notes.items()}
-            base_versions = self.db.get_setting("cloud_base_github", {})
-            if not isinstance(base_versions, dict):
-                base_versions = {}
-            plan = build_cloud_sync_plan(local_notes, remote_note_data, base_versions)
+            plan = build_cloud_sync_plan(local_notes, remote_note_data, base_versions, remote_hashes)
             dry_run = cloud_plan_counts(plan)
             stats["dry_run"] = dry_run
             log_diagnostic_event("info", f"GitHub sync plan: {dry_run}")
@@ -493,94 +658,55 @@ class GitHubSync(CloudSyncProvider):
             upload_update_ids = {note.id for note in plan["upload_updates"]} | conflict_local_ids
             local_notes = self.db.get_all_notes(include_archived=True, include_trashed=False)
 
+            # Every change lands in one tree and one commit; None marks a file to delete
+            changes: Dict[str, Optional[str]] = {}
             for remote_note in plan["delete_remote"]:
                 note_id = remote_note["id"]
                 if note_id in remote_notes:
-                    _, sha = remote_notes[note_id]
-                    self.repo.delete_file(
-                        f"{self.NOTES_DIR}/{note_id}.json",
-                        f"Delete note: {remote_note.get('title', 'Untitled')[:50]}",
-                        sha
-                    )
+                    changes[f"{self.NOTES_DIR}/{note_id}.json"] = None
                     stats["deleted"] += 1
 
             # Upload local note changes
             for note in local_notes:
-                note_filename = f"{self.NOTES_DIR}/{note.id}.json"
-                note_content = json.dumps(note.to_dict(), indent=2)
-
-                try:
-                    if note.id in remote_notes:
-                        if note.id not in upload_update_ids:
-                            continue
-                        # Update existing
-                        _, sha = remote_notes[note.id]
-                        self.repo.update_file(
-                            note_filename,
-                            f"Update note: {note.title[:50]}",
-                            note_content,
-                            sha
-                        )
-                        stats["uploaded"] += 1
-                    else:
-                        if note.id not in upload_create_ids:
-                            continue
-                        # Create new
-                        self.repo.create_file(
-                            note_filename,
-                            f"Add note: {note.title[:50]}",
-                            note_content
-                        )
-                        stats["uploaded"] += 1
-                except GithubException as e:
-                    if e.status == 409:  # Conflict
-                        stats["conflicts"] += 1
-                    else:
-                        raise
+                pending_ids = upload_update_ids if note.id in remote_notes else upload_create_ids
+                if note.id not in pending_ids:
+                    continue
+                # Compact like the Drive blob; only metadata.json is pretty-printed for people
+                note_content = self._note_json(note).decode("utf-8")
+                # Matching git blob sha: the serialized note is already in the repo byte for byte
+                if note.id in remote_notes and remote_notes[note.id][1] == git_blob_sha(note_content):
+                    continue
+                changes[f"{self.NOTES_DIR}/{note.id}.json"] = note_content
+                stats["uploaded"] += 1
 
             # Upload labels
             labels = self.db.get_all_labels()
-            labels_content = json.dumps([l.to_dict() for l in labels], indent=2)
-            try:
-                contents = self.repo.get_contents(self.LABELS_FILE)
-                self.repo.update_file(
-                    self.LABELS_FILE,
-                    "Update labels",
-                    labels_content,
-                    contents.sha
-                )
-            except GithubException:
-                self.repo.create_file(
-                    self.LABELS_FILE,
-                    "Add labels",
-                    labels_content
-                )
+            labels_content = json_dumps([l.to_dict() for l in labels])
+            # Compared with what this device last wrote, so unchanged labels cost no request at all
+            labels_sha = git_blob_sha(labels_content)
+            if labels_sha != self.db.get_setting(self.LABELS_SHA_SETTING):
+                changes[self.LABELS_FILE] = labels_content
+
+            # Metadata rides along with real changes; an idle sync makes no commit
+            if changes:
+                metadata = {
+                    "last_sync": datetime.now(timezone.utc).isoformat(),
+                    "note_count": len(local_notes),
+                    "app_version": self.app_version
+                }
+                changes[self.METADATA_FILE] = json_dumps_pretty(metadata)
 
-            # Update metadata
-            metadata = {
-                "last_sync": datetime.now(timezone.utc).isoformat(),
-                "note_count": len(local_notes),
-                "app_version": self.app_version
-            }
-            metadata_content = json.dumps(metadata, indent=2)
-            try:
-                contents = self.repo.get_contents(self.METADATA_FILE)
-                self.repo.update_file(
-                    self.METADATA_FILE,
-                    "Update sync metadata",
-                    metadata_content,
-                    contents.sha
-                )
-            except GithubException:
-                self.repo.create_file(
-                    self.METADATA_FILE,
-                    "Add sync metadata",
-                    metadata_content
+                self._commit_changes(
+                    changes,
+                    f"Sync notes: {stats['uploaded']} uploaded, {stats['deleted']} deleted"
                 )
+                self.db.set_setting(self.LABELS_SHA_SETTING, labels_sha)
 
             self.last_sync = datetime.now(timezone.utc)
             self.db.set_setting("github_last_sync", self.last_sync.isoformat())
             self.db.set_setting("cloud_base_github", cloud_base_versions(local_notes))
+            self.db.set_setting(self.NOTE_BLOBS_SETTING, self._note_blobs(local_notes, remote_notes, remote_hashes, changes))
+            self._prune_json_cache(local_notes)
 
             self._notify("synced", f"GitHub sync: ↑{stats['uploaded']} ↓{stats['downloaded']}")
             return True, "Sync completed", stats
@@ -590,6 +716,35 @@ class GitHubSync(CloudSyncProvider):
             self._notify("error", f"Sync error: {str(e)}")
             return False, f"Sync error: {str(e)}", stats
 
+    def _note_blobs(self, local_notes, remote_notes, remote_hashes, changes) -> Dict[str, List[str]]:
+        """Blob sha and content hash of each note file now on the remote, for the next sync's listing."""
+        note_blobs = {}
+        for note in local_notes:
+            content = changes.get(f"{self.NOTES_DIR}/{note.id}.json")
+            if content is not None:
+                note_blobs[note.id] = [git_blob_sha(content), note.content_hash]
+            elif note.id in remote_notes:
+                note_data, sha = remote_notes[note.id]
+                note_blobs[note.id] = [sha, remote_hashes.get(note.id) or note_data_hash(note_data)]
+        return note_blobs
+
+    def _commit_changes(self, changes: Dict[str, Optional[str]], message: str):
+        """Write every file change as a single commit on the default branch via the Git Data API."""
+        from github import InputGitTreeElement
+
+        ref = self.repo.get_git_ref(f"heads/{self.repo.default_branch}")
+        base_commit = self.repo.get_git_commit(ref.object.sha)
+        elements = [
+            InputGitTreeElement(path, "100644", "blob", content=content)
+            if content is not None
+            else InputGitTreeElement(path, "100644", "blob", sha=None)
+            for path, content in changes.items()
+        ]
+        tree = self.repo.create_git_tree(elements, base_commit.tree)
+        commit = self.repo.create_git_commit(message, tree, [base_commit])
+        # Not forced: a concurrent push makes this fail instead of being overwritten
+        ref.edit(commit.sha)
+
 
 class CloudSyncManager:
     """
@@ -614,6 +769,10 @@ class CloudSyncManager:
         self.active_provider: Optional[CloudSyncProvider] = None
         self.auto_sync_thread: Optional[threading.Thread] = None
         self._stop_sync = threading.Event()
+        # Set by trigger_sync (and stop_auto_sync) to wake the auto-sync loop early
+        self._sync_trigger = threading.Event()
+        # time.monotonic() when the last sync finished, manual or automatic
+        self._last_sync_end: Optional[float] = None
         self.sync_callbacks: List[Callable] = []
 
     def add_callback(self, callback: Callable):
@@ -663,11 +822,16 @@ class CloudSyncManager:
             LocalBackupManager(self.db, self.app_name, self.app_version).create_backup(f"before {self.active_provider.get_provider_name()} sync")
         except Exception as e:
             return False, f"Backup failed before cloud sync: {e}", {}
-        return self.active_provider.sync()
+        try:
+            return self.active_provider.sync()
+        finally:
+            self._last_sync_end = time.monotonic()
 
     def start_auto_sync(self, interval_minutes: int = 15):
         """Start automatic background sync"""
         self._stop_sync.clear()
+        self._sync_trigger.clear()
+        interval = interval_minutes * 60
 
         def sync_loop():
             while not self._stop_sync.is_set():
@@ -676,14 +840,32 @@ class CloudSyncManager:
                         self.sync()
                     except Exception as e:
                         print(f"Auto-sync error: {e}")
-                self._stop_sync.wait(interval_minutes * 60)
+                # Re-measure after every wake so a manual sync pushes the next automatic one back
+                while not self._stop_sync.is_set():
+                    remaining = self._seconds_until_next_sync(interval)
+                    if remaining <= 0:
+                        break
+                    if self._sync_trigger.wait(remaining):
+                        self._sync_trigger.clear()
+                        break
 
         self.auto_sync_thread = threading.Thread(target=sync_loop, daemon=True)
         self.auto_sync_thread.start()
 
+    def _seconds_until_next_sync(self, interval: float) -> float:
+        """Seconds left in the interval, counted from the end of the last sync."""
+        if self._last_sync_end is None:
+            return interval
+        return max(0.0, interval - (time.monotonic() - self._last_sync_end))
+
+    def trigger_sync(self):
+        """Wake the auto-sync loop to sync now instead of at the end of its interval."""
+        self._sync_trigger.set()
+
     def stop_auto_sync(self):
         """Stop automatic background sync"""
         self._stop_sync.set()
+        self._sync_trigger.set()
         if self.auto_sync_thread:
             self.auto_sync_thread.join(timeout=1)
 
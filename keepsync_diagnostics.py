@@ -44,6 +44,7 @@ class DiagnosticsManager:
         self.last_exception = ""
         self._previous_sys_hook = None
         self._previous_thread_hook = None
+        self._dependency_state: Optional[Dict[str, str]] = None
 
     def install_hooks(self):
         self._previous_sys_hook = sys.excepthook
@@ -79,11 +80,14 @@ class DiagnosticsManager:
         if self._previous_thread_hook:
             self._previous_thread_hook(args)
 
-    def dependency_state(self) -> Dict[str, str]:
-        state = {}
-        for package, import_name in self.DEPENDENCIES.items():
-            state[package] = "available" if importlib.util.find_spec(import_name) else "missing"
-        return state
+    def dependency_state(self, refresh: bool = False) -> Dict[str, str]:
+        """Probe optional packages once per session; missing ones cost a full sys.path scan."""
+        if self._dependency_state is None or refresh:
+            state = {}
+            for package, import_name in self.DEPENDENCIES.items():
+                state[package] = "available" if importlib.util.find_spec(import_name) else "missing"
+            self._dependency_state = state
+        return dict(self._dependency_state)
 
     def recent_log(self, limit: int = 80) -> str:
         if not self.log_path.exists():
@@ -40,6 +40,26 @@ def _derive_key(password: str, salt: bytes) -> bytes:
     return kdf.derive(password.encode("utf-8"))
 
 
+def _copy_database(source_path: str, dest_path: str) -> None:
+    # The SQLite backup API honors WAL and locks, unlike a raw file copy under an open connection.
+    try:
+        source = sqlite3.connect(source_path)
+        try:
+            dest = sqlite3.connect(dest_path)
+            try:
+                source.backup(dest)
+            finally:
+                dest.close()
+        finally:
+            source.close()
+    except sqlite3.DatabaseError as e:
+        # Only a file SQLite cannot read at all is copied raw; a locked or busy database must not
+        # be copied mid-write, and sqlite3 reports the unreadable case only through this message.
+        if "file is not a database" not in str(e):
+            raise
+        shutil.copy2(source_path, dest_path)
+
+
 def create_encrypted_backup(
     db_path: str,
     output_path: Path,
@@ -148,8 +168,8 @@ def restore_encrypted_backup(
 
         dest_path = Path(restore_db_path)
         if dest_path.exists():
-            shutil.copy2(dest_path, dest_path.with_suffix(".db.pre-restore"))
-        shutil.copy2(tmp_path, dest_path)
+            _copy_database(str(dest_path), str(dest_path.with_suffix(".db.pre-restore")))
+        _copy_database(tmp_path, str(dest_path))
     finally:
         os.unlink(tmp_path)
 
@@ -1,12 +1,12 @@
 """Multi-source note importers and Takeout parsing helpers."""
 
-import json
 import re
 import shutil
 import tempfile
 import uuid
 import zipfile
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from html import unescape
 from html.parser import HTMLParser
@@ -22,6 +22,7 @@ from keepsync_import_safety import (
     guarded_import_files,
     validate_zip_members,
 )
+from keepsync_json import json_loads
 from keepsync_models import (
     Attachment,
     ChecklistItem,
@@ -35,6 +36,16 @@ from keepsync_models import (
 )
 from keepsync_note_ops import normalize_import_labels
 
+_URL_SCHEME_PATTERN = re.compile(r"^[a-z]+://", re.IGNORECASE)
+_INLINE_SPACE_PATTERN = re.compile(r"[ \t\r\f\v]+")
+_LINE_PADDING_PATTERN = re.compile(r" *\n *")
+_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+_HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+_ENEX_DOCTYPE_PATTERN = re.compile(r"<!DOCTYPE[^>]*>", re.IGNORECASE)
+_ENEX_XML_DECLARATION_PATTERN = re.compile(r"<\?xml[^>]*\?>", re.IGNORECASE)
+_HASHTAG_PATTERN = re.compile(r"(?<!\w)#([A-Za-z0-9_-]+)")
+_COMPACT_TIMESTAMP_PATTERN = re.compile(r"\d{8}T\d{6}Z?")
+
 
 def extract_shared_with(data: dict) -> List[str]:
     shared = []
@@ -72,7 +83,7 @@ def takeout_attachment_specs(data: dict) -> List[Any]:
 
 
 def resolve_takeout_attachment_path(source: str, base_path: Optional[Path]) -> Optional[Path]:
-    if not source or re.match(r"^[a-z]+://", source, re.IGNORECASE):
+    if not source or _URL_SCHEME_PATTERN.match(source):
         return None
 
     source_path = Path(source)
@@ -171,9 +182,9 @@ class HTMLTextExtractor(HTMLParser):
 
     def text(self) -> str:
         value = unescape("".join(self.parts))
-        value = re.sub(r"[ \t\r\f\v]+", " ", value)
-        value = re.sub(r" *\n *", "\n", value)
-        value = re.sub(r"\n{3,}", "\n\n", value)
+        value = _INLINE_SPACE_PATTERN.sub(" ", value)
+        value = _LINE_PADDING_PATTERN.sub("\n", value)
+        value = _BLANK_LINES_PATTERN.sub("\n\n", value)
         return value.strip()
 
 
@@ -183,13 +194,13 @@ def html_to_text(value: str) -> str:
         extractor.feed(value or "")
         return extractor.text()
     except Exception:
-        return re.sub(r"<[^>]+>", "", value or "").strip()
+        return _HTML_TAG_PATTERN.sub("", value or "").strip()
 
 
 def strip_enex_content(value: str) -> str:
     content = value or ""
-    content = re.sub(r"<!DOCTYPE[^>]*>", "", content, flags=re.IGNORECASE)
-    content = re.sub(r"<\?xml[^>]*\?>", "", content, flags=re.IGNORECASE)
+    content = _ENEX_DOCTYPE_PATTERN.sub("", content)
+    content = _ENEX_XML_DECLARATION_PATTERN.sub("", content)
     return html_to_text(content)
 
 
@@ -202,7 +213,7 @@ def title_from_content(content: str, fallback: str) -> str:
 
 
 def labels_from_hashtags(content: str) -> List[str]:
-    return sorted({match.group(1) for match in re.finditer(r"(?<!\w)#([A-Za-z0-9_-]+)", content or "")})
+    return sorted({match.group(1) for match in _HASHTAG_PATTERN.finditer(content or "")})
 
 
 def parse_external_datetime(value: Any) -> Optional[datetime]:
@@ -210,7 +221,7 @@ def parse_external_datetime(value: Any) -> Optional[datetime]:
         return None
     text = str(value).strip()
     candidates = [text, text.replace("Z", "+00:00")]
-    if re.fullmatch(r"\d{8}T\d{6}Z?", text):
+    if _COMPACT_TIMESTAMP_PATTERN.fullmatch(text):
         candidates.append(f"{text[0:4]}-{text[4:6]}-{text[6:8]}T{text[9:11]}:{text[11:13]}:{text[13:15]}+00:00")
     for candidate in candidates:
         try:
@@ -361,7 +372,7 @@ class MultiSourceImporter:
 
     def import_simplenote_export(self, path: Path) -> List[Note]:
         if path.suffix.lower() == ".json":
-            return self.import_simplenote_json(json.loads(path.read_text(encoding="utf-8-sig")))
+            return self.import_simplenote_json(json_loads(path.read_text(encoding="utf-8-sig")))
 
         notes = []
         with zipfile.ZipFile(path) as zf:
@@ -372,9 +383,9 @@ class MultiSourceImporter:
                 self._check_cancelled()
                 self._progress(f"Reading {Path(member.filename).name}", index, total)
                 try:
-                    parsed = json.loads(decode_zip_member(zf, member))
+                    parsed = json_loads(decode_zip_member(zf, member))
                     notes.extend(self.import_simplenote_json(parsed))
-                except json.JSONDecodeError:
+                except ValueError:
                     continue
             if notes:
                 return notes
@@ -399,22 +410,33 @@ class MultiSourceImporter:
         json_files = self._takeout_json_files(folder)
         if len(json_files) > import_safety.MAX_IMPORT_FOLDER_FILES:
             raise ImportSafetyError(f"Takeout folder contains more than {import_safety.MAX_IMPORT_FOLDER_FILES} JSON files")
-        total_size = sum(file_path.stat().st_size for file_path in json_files)
-        if total_size > import_safety.MAX_IMPORT_FOLDER_BYTES:
+        sizes = {file_path: file_path.stat().st_size for file_path in json_files}
+        if sum(sizes.values()) > import_safety.MAX_IMPORT_FOLDER_BYTES:
             raise ImportSafetyError("Takeout folder JSON size exceeds the import limit")
+        # Smallest files first: progress moves from the start, and the few large notes
+        # are left to overlap with each other on the pool at the end
+        json_files.sort(key=sizes.__getitem__)
         total = len(json_files)
-        for index, json_file in enumerate(json_files, start=1):
-            self._check_cancelled()
-            self._progress(f"Reading {json_file.name}", index, total)
-            try:
-                data = json.loads(json_file.read_text(encoding="utf-8"))
-                note = self.parse_takeout_note(data, json_file.parent)
+        # Files are read, parsed and their attachments copied on a pool so disk latency overlaps;
+        # results are consumed in submission order, so progress and note order are deterministic.
+        executor = ThreadPoolExecutor(thread_name_prefix="takeout-import")
+        try:
+            parsed = executor.map(self._read_takeout_note_file, json_files)
+            for index, (json_file, note) in enumerate(zip(json_files, parsed), start=1):
+                self._check_cancelled()
+                self._progress(f"Reading {json_file.name}", index, total)
                 if note:
                     notes.append(note)
-            except Exception:
-                continue
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
         return notes
 
+    def _read_takeout_note_file(self, json_file: Path) -> Optional[Note]:
+        try:
+            return self.parse_takeout_note(json_loads(json_file.read_bytes()), json_file.parent)
+        except Exception:
+            return None
+
     def import_takeout_zip(self, path: Path) -> List[Note]:
         with tempfile.TemporaryDirectory() as temp_dir:
             with zipfile.ZipFile(path) as zf:
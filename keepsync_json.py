@@ -0,0 +1,105 @@
+"""Compact JSON encode/decode helpers, backed by orjson when it is installed.
+
+Large import files are streamed item by item with ijson when it is installed.
+"""
+
+import dataclasses
+import json
+from typing import Any, BinaryIO, Iterator
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+
+
+def _encode_default(value: Any) -> Any:
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_dumps(value: Any) -> str:
+    """Serialize to compact JSON text; dataclasses are encoded field-by-field."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=_encode_default)
+
+
+def json_dumps_bytes(value: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes without an intermediate str when orjson is available."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            pass
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=_encode_default).encode("utf-8")
+
+
+def json_dumps_pretty(value: Any) -> str:
+    """Serialize to two-space indented JSON text; identical output with or without orjson."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, indent=2, ensure_ascii=False, default=_encode_default)
+
+
+def json_dumps_pretty_bytes(value: Any) -> bytes:
+    """Two-space indented UTF-8 JSON bytes, ready to write to a file opened in binary mode."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(value, indent=2, ensure_ascii=False, default=_encode_default).encode("utf-8")
+
+
+def json_loads(data: Any) -> Any:
+    """Parse JSON text or bytes; raises ValueError on malformed input."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def peek_json_container(fp: BinaryIO) -> str:
+    """Return the first non-whitespace character of a seekable binary JSON file without consuming it."""
+    start = fp.tell()
+    head = b""
+    while not head:
+        chunk = fp.read(64)
+        if not chunk:
+            break
+        head = chunk.lstrip(b" \t\r\n")
+    fp.seek(start)
+    return head[:1].decode("ascii", "replace")
+
+
+def iter_json_items(fp: BinaryIO, prefix: str = "item") -> Iterator[Any]:
+    """Yield the elements of the array at an ijson prefix such as "item" or "notes.item".
+
+    With ijson the file is parsed incrementally; otherwise it is loaded whole and walked.
+    """
+    if IJSON_AVAILABLE:
+        yield from ijson.items(fp, prefix, use_float=True)
+        return
+    value = json_loads(fp.read())
+    for key in prefix.split(".")[:-1]:
+        value = value.get(key) if isinstance(value, dict) else None
+    if isinstance(value, list):
+        yield from value
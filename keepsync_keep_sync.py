@@ -1,10 +1,13 @@
 # Google Keep sync and auth helpers.
 
 from datetime import datetime, timezone
-from typing import Callable, List, Optional
-import json
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import importlib
 import re
 import threading
+import time
 import uuid
 
 import requests
@@ -14,6 +17,7 @@ from keepsync_backups import LocalBackupManager
 import keepsync_credentials as credentials_state
 from keepsync_credentials import KEEP_MASTER_TOKEN_CREDENTIAL, migrate_setting_secret
 from keepsync_diagnostics import log_diagnostic_exception
+from keepsync_json import json_loads
 from keepsync_models import (
     ChecklistItem,
     Note,
@@ -33,6 +37,93 @@ except ImportError:
 
 SECURE_CREDENTIALS = credentials_state.SECURE_CREDENTIALS
 
+# Pulled notes are written in batches so a large pull commits once per batch.
+PULL_SAVE_BATCH_SIZE = 500
+
+# Google auth cookies read from browser profiles; SID or HSID alone marks a session.
+_KEEP_COOKIE_NAMES = frozenset({'SID', 'HSID', 'SSID', 'APISID', 'SAPISID'})
+_KEEP_SESSION_COOKIE_NAMES = frozenset({'SID', 'HSID'})
+
+# Embedded Keep page payloads, tried in order by KeepWebScraper.fetch_notes.
+_KEEP_DATA_PATTERNS = tuple(re.compile(pattern, re.DOTALL) for pattern in (
+    r'data:(\[.*?\])\s*,\s*sideChannel',
+    r"AF_initDataCallback\(\{key:\s*'[^']*',\s*data:(\[.*?\])\}\);",
+    r'key:\s*[\'"]ds:1[\'"]\s*,\s*data:\s*(\[.*?\])',
+))
+
+
+class _KeepNoteHTMLParser(HTMLParser):
+    """Single-pass extraction of data-id note cards with title and content divs."""
+
+    VOID_TAGS = frozenset({
+        "area", "base", "br", "col", "embed", "hr", "img", "input",
+        "link", "meta", "param", "source", "track", "wbr",
+    })
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.notes: List[Tuple[str, str, str]] = []
+        self._note: Optional[Dict[str, Any]] = None
+        self._depth = 0
+        self._field: Optional[str] = None
+        self._field_depth = 0
+        self._field_text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_TAGS:
+            return
+        if self._note is None:
+            note_id = dict(attrs).get("data-id")
+            if note_id:
+                self._note = {"id": note_id}
+                self._depth = 1
+            return
+        self._depth += 1
+        if self._field is None and tag == "div":
+            classes = (dict(attrs).get("class") or "").lower()
+            for field_name in ("title", "content"):
+                if field_name in classes and field_name not in self._note:
+                    self._field = field_name
+                    self._field_depth = self._depth
+                    self._field_text = []
+                    break
+
+    def handle_startendtag(self, tag, attrs):
+        pass
+
+    def handle_endtag(self, tag):
+        if self._note is None or tag in self.VOID_TAGS:
+            return
+        if self._field is not None and self._depth == self._field_depth:
+            self._note[self._field] = "".join(self._field_text).strip()
+            self._field = None
+        self._depth -= 1
+        if self._depth == 0:
+            if "content" in self._note:
+                self.notes.append((self._note["id"], self._note.get("title", ""), self._note["content"]))
+            self._note = None
+
+    def handle_data(self, data):
+        if self._field is not None:
+            self._field_text.append(data)
+
+
+def _parse_keep_note_html(html: str) -> List[Tuple[str, str, str]]:
+    """Return (id, title, content) for each note card in a Keep page."""
+    parser = _KeepNoteHTMLParser()
+    parser.feed(html)
+    parser.close()
+    return parser.notes
+
+
+@lru_cache(maxsize=None)
+def _optional_module(name: str):
+    """Import an auth helper on first use and remember it, or that it is missing, for later attempts."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
 
 def set_secure_credential_store(store):
     """Swap the credential store for tests while preserving app-level compatibility."""
@@ -53,6 +144,10 @@ class KeepSyncEngine:
         self.sync_callbacks: List[Callable] = []
         self._sync_thread: Optional[threading.Thread] = None
         self._stop_sync = threading.Event()
+        # Set by trigger_sync (and stop_auto_sync) to wake the auto-sync loop early
+        self._sync_trigger = threading.Event()
+        # time.monotonic() when the last sync finished, manual or automatic
+        self._last_sync_end: Optional[float] = None
 
     def add_sync_callback(self, callback: Callable):
         """Add callback for sync status updates"""
@@ -169,7 +264,7 @@ class KeepSyncEngine:
         self.sync_in_progress = True
         self._notify_callbacks("syncing", "Synchronizing...")
 
-        stats = {"pulled": 0, "pushed": 0, "conflicts": 0, "errors": 0}
+        stats = {"pulled": 0, "pushed": 0, "unlinked": 0, "conflicts": 0, "errors": 0}
 
         try:
             # Sync with Google Keep servers
@@ -182,6 +277,7 @@ class KeepSyncEngine:
             # Push local changes
             push_stats = self._push_to_keep()
             stats["pushed"] = push_stats.get("created", 0) + push_stats.get("updated", 0)
+            stats["unlinked"] = push_stats.get("unlinked", 0)
 
             # Final sync to commit changes
             self.keep.sync()
@@ -189,8 +285,14 @@ class KeepSyncEngine:
             self.last_sync = datetime.now(timezone.utc)
             self.db.set_setting("last_sync", self.last_sync.isoformat())
 
-            self._notify_callbacks("synced", f"Synced: ↓{stats['pulled']} ↑{stats['pushed']}")
-            return True, "Sync completed successfully", stats
+            summary = f"Synced: ↓{stats['pulled']} ↑{stats['pushed']}"
+            message = "Sync completed successfully"
+            if stats["unlinked"]:
+                unlinked_text = f"{stats['unlinked']} deleted in Keep, kept locally as unlinked"
+                summary += f" ({unlinked_text})"
+                message += f"; {unlinked_text}"
+            self._notify_callbacks("synced", summary)
+            return True, message, stats
 
         except Exception as e:
             stats["errors"] += 1
@@ -200,81 +302,161 @@ class KeepSyncEngine:
             return False, f"Sync error: {str(e)}", stats
         finally:
             self.sync_in_progress = False
+            self._last_sync_end = time.monotonic()
 
     def _pull_from_keep(self) -> dict:
         """Pull notes from Google Keep to local database"""
         stats = {"new": 0, "updated": 0, "skipped": 0}
+        pending: List[Note] = []
+        pending_stats: List[str] = []
+        stale: List[Tuple[Note, str]] = []
+        # Remote edits that left the content hash unchanged only need their sync state recorded
+        touched: List[Tuple[str, str, datetime]] = []
+        # Logged after the saves so error rows do not commit between batches
+        errors: List[Tuple[str, str]] = []
+        # One timestamp stamps every note this pull converts
+        batch_now = datetime.now(timezone.utc)
+
+        def flush():
+            if stale:
+                # Load every local copy the batch will overwrite in one IN (...) query
+                local_notes = self.db.get_notes_by_ids(note_id for _, note_id in stale)
+                for local_note, note_id in stale:
+                    existing = local_notes.get(note_id)
+                    if existing:
+                        # The identity _keep_note_to_local takes from an existing note
+                        local_note.id = existing.id
+                        local_note.created_at = existing.created_at
+                        if local_note.checklist_items:
+                            # Fresh items carry fresh ids, which alone change the hash
+                            self._reuse_checklist_item_ids(local_note, existing)
+                            local_note.update_hash()
+                            if local_note.content_hash == existing.content_hash:
+                                touched.append((existing.id, local_note.keep_id, local_note.remote_modified))
+                                continue
+                    local_note.sync_status = SyncStatus.SYNCED
+                    pending.append(local_note)
+                    pending_stats.append("updated")
+                stale.clear()
+            if self.db.save_notes(pending):
+                for key in pending_stats:
+                    stats[key] += 1
+            else:
+                # One bad note must not drop its whole batch: retry the notes one at a time
+                for local_note, key in zip(pending, pending_stats):
+                    if self.db.save_note(local_note):
+                        stats[key] += 1
+                    else:
+                        errors.append((local_note.keep_id or "", f"Failed to save pulled note {local_note.id}"))
+            pending.clear()
+            pending_stats.clear()
+            if touched:
+                if self.db.mark_notes_synced(touched):
+                    stats["skipped"] += len(touched)
+                else:
+                    errors.append(("", f"Failed to record {len(touched)} unchanged pulled notes"))
+                touched.clear()
+
+        # One query for every linked note instead of a SELECT per remote note
+        sync_index = self.db.get_sync_index()
+        oldest = datetime.min.replace(tzinfo=timezone.utc)
 
         for keep_note in self.keep.all():
             try:
-                # Find existing local note
-                cursor = self.db.conn.cursor()
-                cursor.execute("SELECT * FROM notes WHERE keep_id = ?", (keep_note.id,))
-                row = cursor.fetchone()
+                indexed = sync_index.get(keep_note.id)
 
-                if row:
-                    local_note = self.db._row_to_note(row)
+                if indexed:
+                    note_id, content_hash, remote_modified = indexed
 
                     # Check if remote is newer
-                    if keep_note.timestamps.updated > (local_note.remote_modified or datetime.min.replace(tzinfo=timezone.utc)):
-                        # Update local note from remote
-                        local_note = self._keep_note_to_local(keep_note, local_note)
-                        local_note.sync_status = SyncStatus.SYNCED
-                        self.db.save_note(local_note)
-                        stats["updated"] += 1
-                    else:
+                    if keep_note.timestamps.updated <= (remote_modified or oldest):
                         stats["skipped"] += 1
+                    else:
+                        # Convert once: the same note serves the hash check and the batched save
+                        local_note = self._keep_note_to_local(keep_note, now=batch_now)
+                        local_note.update_hash()
+                        if local_note.content_hash == content_hash:
+                            # Keep re-emitted an identical note: skip the full-row rewrite and reindex
+                            touched.append((note_id, keep_note.id, keep_note.timestamps.updated))
+                        else:
+                            # Update local note from remote once its batch is loaded
+                            stale.append((local_note, note_id))
                 else:
                     # Create new local note from Keep
-                    local_note = self._keep_note_to_local(keep_note)
+                    local_note = self._keep_note_to_local(keep_note, now=batch_now)
                     local_note.sync_status = SyncStatus.SYNCED
-                    self.db.save_note(local_note)
-                    stats["new"] += 1
+                    pending.append(local_note)
+                    pending_stats.append("new")
 
             except Exception as e:
-                self.db.log_sync("pull", keep_note.id, "error", str(e))
+                errors.append((keep_note.id, str(e)))
+
+            if len(pending) + len(stale) + len(touched) >= PULL_SAVE_BATCH_SIZE:
+                flush()
 
+        flush()
+        for keep_id, message in errors:
+            self.db.log_sync("pull", keep_id, "error", message)
         return stats
 
     def _push_to_keep(self) -> dict:
         """Push local changes to Google Keep"""
-        stats = {"created": 0, "updated": 0, "deleted": 0, "errors": 0}
-
-        # Get notes that need pushing
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM notes WHERE sync_status IN (?, ?) AND trashed = 0",
-            (SyncStatus.PENDING_PUSH.value, SyncStatus.LOCAL_ONLY.value)
-        )
-
-        for row in cursor.fetchall():
-            local_note = self.db._row_to_note(row)
-
+        stats = {"created": 0, "updated": 0, "deleted": 0, "unlinked": 0, "errors": 0}
+        synced: List[Tuple[str, str, datetime]] = []
+        unlinked: List[str] = []
+        # findLabel scans every Keep label, so index them once per push
+        label_cache = self._keep_label_index()
+        batch_now = datetime.now(timezone.utc)
+
+        # Rows stream from the cursor; sync-state writes wait until it is exhausted so the
+        # scan never sees its own updates. The scan walks idx_notes_sync_status, and a
+        # concurrent editor save that changes a note's status in place (local_only to
+        # pending_push) moves its entry further along that index, where the cursor can
+        # meet it again, so each note is pushed at most once.
+        pushed = set()
+        for local_note in self.db.iter_notes_pending_push():
+            if local_note.id in pushed:
+                continue
+            pushed.add(local_note.id)
             try:
                 if local_note.keep_id:
-                    # Update existing Keep note
+                    # Update existing Keep note; keep.get is a dict lookup on gkeepapi's node index,
+                    # so no per-push copy of every remote note is needed
                     keep_note = self.keep.get(local_note.keep_id)
-                    if keep_note:
-                        self._update_keep_note(keep_note, local_note)
-                        stats["updated"] += 1
+                    if not keep_note:
+                        # Removed from Keep since the last sync: keep the local copy and its
+                        # edits, but stop pushing it to a note that no longer exists
+                        unlinked.append(local_note.id)
+                        continue
+                    self._update_keep_note(keep_note, local_note)
+                    stats["updated"] += 1
                 else:
                     # Create new Keep note
-                    keep_note = self._create_keep_note(local_note)
+                    keep_note = self._create_keep_note(local_note, label_cache)
                     local_note.keep_id = keep_note.id
                     stats["created"] += 1
 
-                local_note.sync_status = SyncStatus.SYNCED
-                local_note.remote_modified = datetime.now(timezone.utc)
-                self.db.save_note(local_note)
+                # Only sync metadata changes, so skip the full-row rewrite and reindex
+                synced.append((local_note.id, local_note.keep_id, batch_now))
 
             except Exception as e:
                 stats["errors"] += 1
                 self.db.log_sync("push", local_note.id, "error", str(e))
 
+        if not self.db.mark_notes_synced(synced):
+            stats["errors"] += len(synced)
+            self.db.log_sync("push", "", "error", f"Failed to record {len(synced)} pushed notes")
+        if self.db.mark_notes_unlinked(unlinked):
+            stats["unlinked"] = len(unlinked)
+        else:
+            stats["errors"] += len(unlinked)
+            self.db.log_sync("push", "", "error", f"Failed to unlink {len(unlinked)} notes deleted in Keep")
         return stats
 
-    def _keep_note_to_local(self, keep_note, existing: Note = None) -> Note:
-        """Convert gkeepapi note to local Note object"""
+    def _keep_note_to_local(self, keep_note, existing: Note = None, now: Optional[datetime] = None) -> Note:
+        """Convert gkeepapi note to local Note object; ``now`` lets a batch share one timestamp."""
+        if now is None:
+            now = datetime.now(timezone.utc)
         note_id = existing.id if existing else str(uuid.uuid4())
 
         # Determine note type and content
@@ -308,10 +490,23 @@ class KeepSyncEngine:
             color=normalize_keep_color(keep_note.color.value if keep_note.color else ""),
             keep_id=keep_note.id,
             remote_modified=keep_note.timestamps.updated,
-            created_at=existing.created_at if existing else (keep_note.timestamps.created or datetime.now(timezone.utc)),
-            updated_at=datetime.now(timezone.utc),
+            created_at=existing.created_at if existing else (keep_note.timestamps.created or now),
+            updated_at=now,
         )
 
+    @staticmethod
+    def _reuse_checklist_item_ids(local_note: Note, existing: Note):
+        """Give pulled checklist items the id and indent of the local item with the same text and state."""
+        unused: Dict[Tuple[str, bool], List[ChecklistItem]] = {}
+        for item in existing.checklist_items:
+            unused.setdefault((item.text, item.checked), []).append(item)
+        for item in local_note.checklist_items:
+            matches = unused.get((item.text, item.checked))
+            if matches:
+                match = matches.pop(0)
+                item.id = match.id
+                item.indent = match.indent
+
     def _extract_keep_shared_with(self, keep_note) -> List[str]:
         """Best-effort collaborator metadata extraction from gkeepapi notes."""
         shared = []
@@ -329,7 +524,7 @@ class KeepSyncEngine:
                 continue
         return shared
 
-    def _create_keep_note(self, local_note: Note):
+    def _create_keep_note(self, local_note: Note, label_cache: Optional[Dict[str, Any]] = None):
         """Create a new note in Google Keep"""
         if local_note.note_type == NoteType.CHECKLIST:
             keep_note = self.keep.createList(
@@ -344,14 +539,21 @@ class KeepSyncEngine:
         self._apply_keep_color(keep_note, local_note.color)
 
         # Add labels
+        label_cache = self._keep_label_index() if label_cache is None else label_cache
         for label_name in local_note.labels:
-            label = self.keep.findLabel(label_name)
-            if not label:
+            key = label_name.lower()
+            label = label_cache.get(key)
+            if label is None:
                 label = self.keep.createLabel(label_name)
+                label_cache[key] = label
             keep_note.labels.add(label)
 
         return keep_note
 
+    def _keep_label_index(self) -> Dict[str, Any]:
+        """Map lower-cased Keep label names to labels, matching findLabel's case-insensitive lookup."""
+        return {label.name.lower(): label for label in self.keep.labels()}
+
     def _update_keep_note(self, keep_note, local_note: Note):
         """Update an existing Google Keep note"""
         keep_note.title = local_note.title
@@ -404,19 +606,39 @@ class KeepSyncEngine:
     def start_auto_sync(self, interval_minutes: int = 5):
         """Start automatic background sync"""
         self._stop_sync.clear()
+        self._sync_trigger.clear()
+        interval = interval_minutes * 60
 
         def sync_loop():
             while not self._stop_sync.is_set():
                 if self.is_authenticated and not self.sync_in_progress:
                     self.sync()
-                self._stop_sync.wait(interval_minutes * 60)
+                # Re-measure after every wake so a manual sync pushes the next automatic one back
+                while not self._stop_sync.is_set():
+                    remaining = self._seconds_until_next_sync(interval)
+                    if remaining <= 0:
+                        break
+                    if self._sync_trigger.wait(remaining):
+                        self._sync_trigger.clear()
+                        break
 
         self._sync_thread = threading.Thread(target=sync_loop, daemon=True)
         self._sync_thread.start()
 
+    def _seconds_until_next_sync(self, interval: float) -> float:
+        """Seconds left in the interval, counted from the end of the last sync."""
+        if self._last_sync_end is None:
+            return interval
+        return max(0.0, interval - (time.monotonic() - self._last_sync_end))
+
+    def trigger_sync(self):
+        """Wake the auto-sync loop to sync now instead of at the end of its interval."""
+        self._sync_trigger.set()
+
     def stop_auto_sync(self):
         """Stop automatic background sync"""
         self._stop_sync.set()
+        self._sync_trigger.set()
         if self._sync_thread:
             self._sync_thread.join(timeout=1)
 
@@ -439,9 +661,8 @@ def get_master_token_cli():
     print("  3. Use that password below (not your regular password)")
     print()
 
-    try:
-        import gpsoauth
-    except ImportError:
+    gpsoauth = _optional_module("gpsoauth")
+    if gpsoauth is None:
         print("ERROR: gpsoauth is not installed.")
         print("Run: python -m pip install -r requirements.txt")
         return None
@@ -514,6 +735,18 @@ def get_master_token_cli():
         return None
 
 
+def _collect_keep_cookies(cookie_jar, cookies_found: Dict[str, str]) -> Dict[str, str]:
+    """Copy Google auth cookies into cookies_found, stopping once all are present."""
+    if len(cookies_found) == len(_KEEP_COOKIE_NAMES):
+        return cookies_found
+    for cookie in cookie_jar:
+        if cookie.name in _KEEP_COOKIE_NAMES:
+            cookies_found[cookie.name] = cookie.value
+            if len(cookies_found) == len(_KEEP_COOKIE_NAMES):
+                break
+    return cookies_found
+
+
 def extract_token_from_browser():
     """
     Extract Google authentication token from browser cookies.
@@ -527,10 +760,8 @@ def extract_token_from_browser():
     print("Make sure you're logged into Google Keep in Chrome or Firefox.")
     print()
 
-    # Import browser_cookie3 if the deterministic environment includes it.
-    try:
-        import browser_cookie3
-    except ImportError:
+    browser_cookie3 = _optional_module("browser_cookie3")
+    if browser_cookie3 is None:
         print("ERROR: browser-cookie3 is not installed.")
         print("Run: python -m pip install -r requirements.txt")
         return None
@@ -543,9 +774,7 @@ def extract_token_from_browser():
     # Try Chrome
     try:
         chrome_cookies = browser_cookie3.chrome(domain_name='.google.com')
-        for cookie in chrome_cookies:
-            if cookie.name in ('SID', 'HSID', 'SSID', 'APISID', 'SAPISID'):
-                cookies_found[cookie.name] = cookie.value
+        _collect_keep_cookies(chrome_cookies, cookies_found)
         if cookies_found:
             print(f"✓ Found {len(cookies_found)} Google cookies in Chrome")
     except Exception as e:
@@ -555,9 +784,7 @@ def extract_token_from_browser():
     if len(cookies_found) < 3:
         try:
             ff_cookies = browser_cookie3.firefox(domain_name='.google.com')
-            for cookie in ff_cookies:
-                if cookie.name in ('SID', 'HSID', 'SSID', 'APISID', 'SAPISID'):
-                    cookies_found[cookie.name] = cookie.value
+            _collect_keep_cookies(ff_cookies, cookies_found)
             if cookies_found:
                 print(f"✓ Found {len(cookies_found)} Google cookies in Firefox")
         except Exception as e:
@@ -567,9 +794,7 @@ def extract_token_from_browser():
     if len(cookies_found) < 3:
         try:
             edge_cookies = browser_cookie3.edge(domain_name='.google.com')
-            for cookie in edge_cookies:
-                if cookie.name in ('SID', 'HSID', 'SSID', 'APISID', 'SAPISID'):
-                    cookies_found[cookie.name] = cookie.value
+            _collect_keep_cookies(edge_cookies, cookies_found)
             if cookies_found:
                 print(f"✓ Found {len(cookies_found)} Google cookies in Edge")
         except Exception as e:
@@ -612,13 +837,10 @@ class KeepWebScraper:
         Returns:
             (success, message)
         """
-        try:
-            import browser_cookie3
-        except ImportError:
+        browser_cookie3 = _optional_module("browser_cookie3")
+        if browser_cookie3 is None:
             return False, "browser-cookie3 is not installed. Run: python -m pip install -r requirements.txt"
 
-        import requests
-
         # Try to get cookies from browser
         cj = None
         browser_used = None
@@ -645,8 +867,7 @@ class KeepWebScraper:
             try:
                 cj = func(domain_name='.google.com')
                 # Verify we have the essential cookies
-                cookie_names = [c.name for c in cj]
-                if 'SID' in cookie_names or 'HSID' in cookie_names:
+                if any(c.name in _KEEP_SESSION_COOKIE_NAMES for c in cj):
                     browser_used = name
                     break
             except Exception:
@@ -706,25 +927,16 @@ class KeepWebScraper:
 
             # Try to find embedded note data in the page
             # Google Keep embeds initial data in a script tag
-            import re
-
-            # Look for the data payload
-            patterns = [
-                r'data:(\[.*?\])\s*,\s*sideChannel',
-                r"AF_initDataCallback\(\{key:\s*'[^']*',\s*data:(\[.*?\])\}\);",
-                r'key:\s*[\'"]ds:1[\'"]\s*,\s*data:\s*(\[.*?\])',
-            ]
-
             data_found = None
-            for pattern in patterns:
-                matches = re.findall(pattern, html, re.DOTALL)
+            for pattern in _KEEP_DATA_PATTERNS:
+                matches = pattern.findall(html)
                 if matches:
                     for match in matches:
                         try:
-                            data_found = json.loads(match)
+                            data_found = json_loads(match)
                             if isinstance(data_found, list) and len(data_found) > 0:
                                 break
-                        except json.JSONDecodeError:
+                        except ValueError:
                             continue
                     if data_found:
                         break
@@ -732,14 +944,11 @@ class KeepWebScraper:
             if not data_found:
                 # Fallback: Try to extract notes from the HTML structure
                 # This is a simplified extraction
-                note_pattern = r'data-id="([^"]+)"[^>]*>.*?<div[^>]*class="[^"]*title[^"]*"[^>]*>([^<]*)</div>.*?<div[^>]*class="[^"]*content[^"]*"[^>]*>([^<]*)</div>'
-                note_matches = re.findall(note_pattern, html, re.DOTALL | re.IGNORECASE)
-
-                for note_id, title, content in note_matches:
+                for note_id, title, content in _parse_keep_note_html(html):
                     notes.append({
                         'id': note_id,
-                        'title': title.strip(),
-                        'content': content.strip(),
+                        'title': title,
+                        'content': content,
                         'type': 'note',
                     })
 
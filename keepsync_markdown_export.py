@@ -9,6 +9,9 @@ import shutil
 
 from keepsync_models import Attachment, ChecklistItem, Note, NoteType
 
+_UNSAFE_FILENAME_PATTERN = re.compile(r"[^A-Za-z0-9._ -]+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 @dataclass
 class MarkdownVaultExportResult:
@@ -69,8 +72,8 @@ def note_date_prefix(note: Note) -> str:
 
 
 def slugify_title(value: str) -> str:
-    text = re.sub(r"[^A-Za-z0-9._ -]+", "-", value.strip())
-    text = re.sub(r"\s+", "-", text).strip(" .-").lower()
+    text = _UNSAFE_FILENAME_PATTERN.sub("-", value.strip())
+    text = _WHITESPACE_PATTERN.sub("-", text).strip(" .-").lower()
     return text[:80] or "untitled"
 
 
@@ -195,5 +198,5 @@ def _unique_attachment_target(directory: Path, filename: str) -> Path:
 
 
 def slugify_attachment_filename(filename: str) -> str:
-    safe = re.sub(r"[^A-Za-z0-9._ -]+", "-", Path(filename or "attachment").name).strip(" .-")
+    safe = _UNSAFE_FILENAME_PATTERN.sub("-", Path(filename or "attachment").name).strip(" .-")
     return safe or "attachment"
@@ -1,7 +1,6 @@
 """Core note data models and normalization helpers for KeepSync Notes."""
 
 import hashlib
-import json
 import mimetypes
 import re
 import uuid
@@ -11,6 +10,18 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, List, Optional
 
+from keepsync_json import json_dumps
+
+
+# Change-detection hashing: BLAKE2b is stdlib and faster than MD5 on 64-bit CPUs.
+CONTENT_HASH_DIGEST_SIZE = 16
+CONTENT_HASH_VERSION = 3
+HASH_FIELD_SEPARATOR = "\x1f"
+HASH_GROUP_SEPARATOR = "\x1e"
+
+# Note card preview limits
+PREVIEW_CHARS = 150
+PREVIEW_CHECKLIST_ITEMS = 3
 
 KEEP_COLOR_PALETTE = {
     "": ("Default", "#1e293b"),
@@ -118,7 +129,7 @@ class NoteType(Enum):
     CHECKLIST = "checklist"
 
 
-@dataclass
+@dataclass(slots=True)
 class Attachment:
     filename: str
     stored_path: str
@@ -158,7 +169,7 @@ class Attachment:
         return bool(self.stored_path and Path(self.stored_path).exists())
 
 
-@dataclass
+@dataclass(slots=True)
 class ChecklistItem:
     text: str
     checked: bool = False
@@ -166,7 +177,8 @@ class ChecklistItem:
     indent: int = 0
 
     def to_dict(self) -> dict:
-        return {"id": self.id, "text": self.text, "checked": self.checked, "indent": self.indent}
+        # Field order matches orjson's dataclass encoding so checklist hashes agree with or without it.
+        return {"text": self.text, "checked": self.checked, "id": self.id, "indent": self.indent}
 
     @classmethod
     def from_dict(cls, data: dict) -> "ChecklistItem":
@@ -178,7 +190,7 @@ class ChecklistItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     id: str
     title: str
@@ -202,6 +214,8 @@ class Note:
     content_hash: str = ""
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # Importer-only metadata for fidelity reports; never persisted or hashed.
+    unsupported_fields: List[str] = field(default_factory=list, compare=False, repr=False)
 
     def __post_init__(self):
         self.color = normalize_keep_color(self.color)
@@ -209,17 +223,56 @@ class Note:
         self.attachments = [Attachment.from_dict(a) if isinstance(a, dict) else a for a in self.attachments]
         for item in self.checklist_items:
             item.indent = clamp_checklist_indent(item.indent)
-        self.update_hash()
-
-    def update_hash(self):
-        """Generate content hash for change detection."""
-        content = (
-            f"{self.title}|{self.content}|{json.dumps([i.to_dict() for i in self.checklist_items])}|"
-            f"{json.dumps(self.labels)}|{self.pinned}|{self.archived}|{self.trashed}|{self.color}|"
-            f"{self.reminder_at.isoformat() if self.reminder_at else ''}|{self.reminder_location}|"
-            f"{json.dumps(self.shared_with)}|{json.dumps([a.to_dict() for a in self.attachments])}"
-        )
-        self.content_hash = hashlib.md5(content.encode()).hexdigest()
+        # A supplied hash is trusted (storage rows carry a current-version hash); otherwise compute it.
+        if not self.content_hash:
+            self.update_hash()
+
+    def update_hash(self, checklist_json: Optional[str] = None):
+        """Generate content hash for change detection.
+
+        Storage passes the checklist_items column JSON it is about to write, so the
+        checklist is serialized once for both the hash and the row.
+        """
+        if checklist_json is None:
+            checklist_json = json_dumps(self.checklist_items)
+        parts = [self.title or "", self.content or "", self.note_type.value, checklist_json]
+        parts.append(HASH_GROUP_SEPARATOR)
+        parts.extend(map(str, self.labels))
+        parts.append(HASH_GROUP_SEPARATOR)
+        parts.extend((
+            "1" if self.pinned else "0",
+            "1" if self.archived else "0",
+            "1" if self.trashed else "0",
+            self.color,
+            self.reminder_at.isoformat() if self.reminder_at else "",
+            self.reminder_location or "",
+        ))
+        parts.extend(self.shared_with)
+        parts.append(HASH_GROUP_SEPARATOR)
+        for attachment in self.attachments:
+            parts.extend((
+                str(attachment.id),
+                attachment.filename,
+                attachment.stored_path or "",
+                attachment.source_path or "",
+                attachment.mime_type,
+            ))
+        payload = HASH_FIELD_SEPARATOR.join(parts).encode("utf-8", "surrogatepass")
+        self.content_hash = hashlib.blake2b(payload, digest_size=CONTENT_HASH_DIGEST_SIZE).hexdigest()
+
+    @property
+    def preview(self) -> str:
+        """Plain-text card preview: the first checklist items, or content cut at PREVIEW_CHARS."""
+        if self.note_type == NoteType.CHECKLIST:
+            items = self.checklist_items
+            text = "\n".join(
+                f"{'  ' * min(item.indent, 3)}{'[x]' if item.checked else '[ ]'} {item.text}"
+                for item in items[:PREVIEW_CHECKLIST_ITEMS]
+            )
+            hidden = len(items) - PREVIEW_CHECKLIST_ITEMS
+            return f"{text}\n  +{hidden} more..." if hidden > 0 else text
+        content = self.content or ""
+        return content[:PREVIEW_CHARS] + "..." if len(content) > PREVIEW_CHARS else content
 
     def to_dict(self) -> dict:
         return {
@@ -248,9 +301,10 @@ class Note:
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> "Note":
-        return cls(
-            id=data["id"],
+    def from_dict(cls, data: dict, **overrides) -> "Note":
+        """Build a note from to_dict() output; keyword overrides replace fields at construction."""
+        fields = dict(
+            id=overrides["id"] if "id" in overrides else data["id"],
             title=data.get("title", ""),
             content=data.get("content", ""),
             note_type=NoteType(data.get("note_type", "note")),
@@ -269,13 +323,30 @@ class Note:
             sync_status=SyncStatus(data.get("sync_status", "local_only")),
             local_modified=datetime.fromisoformat(data["local_modified"]) if data.get("local_modified") else None,
             remote_modified=datetime.fromisoformat(data["remote_modified"]) if data.get("remote_modified") else None,
-            content_hash=data.get("content_hash", ""),
             created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else datetime.now(timezone.utc),
             updated_at=datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") else datetime.now(timezone.utc),
         )
+        fields.update(overrides)
+        return cls(**fields)
+
+
+@dataclass(slots=True)
+class NoteSummary:
+    """Lightweight list-view projection of a note; open the full Note via get_note()."""
+    id: str
+    title: str
+    snippet: str
+    note_type: NoteType = NoteType.NOTE
+    labels: List[str] = field(default_factory=list)
+    pinned: bool = False
+    archived: bool = False
+    trashed: bool = False
+    color: str = ""
+    sync_status: SyncStatus = SyncStatus.LOCAL_ONLY
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(slots=True)
 class Label:
     id: str
     name: str
@@ -1,9 +1,11 @@
 """Note editor panel widget."""
 
+from concurrent.futures import Future
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 import threading
 import uuid
 import webbrowser
@@ -25,6 +27,7 @@ from keepsync_audio_recording import (
     append_audio_transcript,
     transcribe_audio_file,
 )
+from keepsync_diagnostics import log_diagnostic_event
 from keepsync_dragdrop import drop_copy_action, enable_file_drop
 from keepsync_models import (
     Attachment,
@@ -46,11 +49,15 @@ from keepsync_note_text import (
 from keepsync_storage import DatabaseManager
 from keepsync_theme import COLORS
 from keepsync_ui_components import IconManager, SyncStatusBadge
+from keepsync_ui_fonts import MONO_FAMILY, ui_font
 
 
 class NoteEditor(ctk.CTkFrame):
     """Full note editor panel"""
 
+    # How often the UI thread checks a queued save for completion
+    SAVE_POLL_MS = 15
+
     def __init__(self, parent, db: DatabaseManager, sync_engine: Any,
                  on_save: Callable, on_close: Callable, on_popout: Optional[Callable] = None, **kwargs):
         super().__init__(parent, fg_color=COLORS["bg_dark"], **kwargs)
@@ -66,6 +73,10 @@ class NoteEditor(ctk.CTkFrame):
         self._image_drop_enabled = False
         self._image_drop_target_ids = set()
         self.audio_recorder: Optional[AudioRecorder] = None
+        # One <KeyRelease> binding per editor, shared by every editable widget via a bindtag
+        self._modify_tag = f"NoteEditorModify{id(self)}"
+        self.bind_class(self._modify_tag, "<KeyRelease>", self._on_modify)
+        self._modify_script = self.bind_class(self._modify_tag, "<KeyRelease>")
 
         self._build_ui()
 
@@ -92,7 +103,7 @@ class NoteEditor(ctk.CTkFrame):
         self.header_title = ctk.CTkLabel(
             header,
             text="New Note",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=ui_font(size=16, weight="bold"),
             text_color=COLORS["text_primary"]
         )
         self.header_title.pack(side="left", padx=12)
@@ -116,6 +127,7 @@ class NoteEditor(ctk.CTkFrame):
             command=self._toggle_pin
         )
         self.pin_btn.pack(side="left", padx=2)
+        self._pin_icon_pinned = False
 
         if self.on_popout_callback:
             popout_btn = ctk.CTkButton(
@@ -133,7 +145,7 @@ class NoteEditor(ctk.CTkFrame):
         self.save_btn = ctk.CTkButton(
             actions_frame,
             text="Save",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=ui_font(size=13, weight="bold"),
             width=80,
             height=36,
             fg_color=COLORS["accent_green"],
@@ -155,7 +167,7 @@ class NoteEditor(ctk.CTkFrame):
         self.title_entry = ctk.CTkEntry(
             editor_frame,
             placeholder_text="Title",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=ui_font(size=20, weight="bold"),
             height=45,
             fg_color="transparent",
             border_width=0,
@@ -163,7 +175,7 @@ class NoteEditor(ctk.CTkFrame):
             placeholder_text_color=COLORS["text_muted"]
         )
         self.title_entry.pack(fill="x", pady=(0, 8))
-        self.title_entry.bind("<KeyRelease>", self._on_modify)
+        self._track_modifications(self.title_entry)
 
         # Note type selector
         type_frame = ctk.CTkFrame(editor_frame, fg_color="transparent")
@@ -176,7 +188,7 @@ class NoteEditor(ctk.CTkFrame):
             text="Text Note",
             variable=self.note_type_var,
             value="note",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             text_color=COLORS["text_secondary"],
             fg_color=COLORS["accent_blue"],
             hover_color=COLORS["accent_blue_hover"],
@@ -189,7 +201,7 @@ class NoteEditor(ctk.CTkFrame):
             text="Checklist",
             variable=self.note_type_var,
             value="checklist",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             text_color=COLORS["text_secondary"],
             fg_color=COLORS["accent_blue"],
             hover_color=COLORS["accent_blue_hover"],
@@ -204,7 +216,7 @@ class NoteEditor(ctk.CTkFrame):
         ctk.CTkLabel(
             color_section,
             text="Color",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=ui_font(size=12, weight="bold"),
             text_color=COLORS["text_secondary"]
         ).pack(side="left", padx=(0, 10))
 
@@ -225,9 +237,11 @@ class NoteEditor(ctk.CTkFrame):
             button.pack(side="left", padx=(0, 5))
             self.color_buttons[color_key] = button
 
-        # Content area (switchable between text and checklist)
+        # Content area (text and checklist share one grid cell; switching raises the active one)
         self.content_container = ctk.CTkFrame(editor_frame, fg_color="transparent")
         self.content_container.pack(fill="both", expand=True)
+        self.content_container.grid_rowconfigure(0, weight=1)
+        self.content_container.grid_columnconfigure(0, weight=1)
 
         # Text editor
         self.text_frame = ctk.CTkFrame(self.content_container, fg_color="transparent")
@@ -237,7 +251,7 @@ class NoteEditor(ctk.CTkFrame):
         ctk.CTkLabel(
             self.markdown_controls,
             text="Markdown",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=ui_font(size=12, weight="bold"),
             text_color=COLORS["accent_cyan"]
         ).pack(side="left", padx=(0, 10))
 
@@ -249,7 +263,7 @@ class NoteEditor(ctk.CTkFrame):
                 text=label,
                 width=48 if len(label) > 1 else 30,
                 height=28,
-                font=ctk.CTkFont(size=11, weight="bold" if style == "bold" else "normal"),
+                font=ui_font(size=11, weight="bold" if style == "bold" else "normal"),
                 fg_color=COLORS["bg_medium"],
                 hover_color=COLORS["bg_hover"],
                 text_color=COLORS["text_primary"],
@@ -273,7 +287,7 @@ class NoteEditor(ctk.CTkFrame):
 
         self.content_text = ctk.CTkTextbox(
             self.text_frame,
-            font=ctk.CTkFont(size=14),
+            font=ui_font(size=14),
             fg_color=COLORS["bg_medium"],
             border_width=1,
             border_color=COLORS["border"],
@@ -281,11 +295,11 @@ class NoteEditor(ctk.CTkFrame):
             corner_radius=8
         )
         self.content_text.pack(fill="both", expand=True)
-        self.content_text.bind("<KeyRelease>", self._on_modify)
+        self._track_modifications(self.content_text)
 
         self.markdown_preview = ctk.CTkTextbox(
             self.text_frame,
-            font=ctk.CTkFont(size=14),
+            font=ui_font(size=14),
             fg_color=COLORS["bg_medium"],
             border_width=1,
             border_color=COLORS["border"],
@@ -295,28 +309,8 @@ class NoteEditor(ctk.CTkFrame):
         )
         self._configure_markdown_preview_tags()
 
-        # Checklist editor
-        self.checklist_frame = ctk.CTkFrame(self.content_container, fg_color="transparent")
-
-        self.checklist_scroll = ctk.CTkScrollableFrame(
-            self.checklist_frame,
-            fg_color=COLORS["bg_medium"],
-            corner_radius=8
-        )
-        self.checklist_scroll.pack(fill="both", expand=True)
-
-        self.add_item_btn = ctk.CTkButton(
-            self.checklist_frame,
-            text="+ Add Item",
-            font=ctk.CTkFont(size=13),
-            height=36,
-            fg_color="transparent",
-            hover_color=COLORS["bg_hover"],
-            text_color=COLORS["accent_blue"],
-            anchor="w",
-            command=self._add_checklist_item
-        )
-        self.add_item_btn.pack(fill="x", pady=(8, 0))
+        # Checklist editor, built by _build_checklist_ui the first time a checklist is shown
+        self.checklist_frame = None
 
         # Labels section
         labels_section = ctk.CTkFrame(editor_frame, fg_color="transparent")
@@ -325,7 +319,7 @@ class NoteEditor(ctk.CTkFrame):
         labels_header = ctk.CTkLabel(
             labels_section,
             text="Labels",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=ui_font(size=12, weight="bold"),
             text_color=COLORS["text_secondary"]
         )
         labels_header.pack(anchor="w")
@@ -336,7 +330,7 @@ class NoteEditor(ctk.CTkFrame):
         self.label_entry = ctk.CTkEntry(
             self.labels_frame,
             placeholder_text="Add label...",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             width=150,
             height=30,
             fg_color=COLORS["bg_medium"],
@@ -346,7 +340,9 @@ class NoteEditor(ctk.CTkFrame):
         self.label_entry.pack(side="left")
         self.label_entry.bind("<Return>", self._add_label)
 
-        self.labels_display = ctk.CTkFrame(self.labels_frame, fg_color="transparent")
+        # Fixed to the entry's height so adding or removing chips never re-lays out the editor
+        self.labels_display = ctk.CTkFrame(self.labels_frame, fg_color="transparent", height=30)
+        self.labels_display.pack_propagate(False)
         self.labels_display.pack(side="left", fill="x", expand=True, padx=(8, 0))
 
         # Reminder section
@@ -356,7 +352,7 @@ class NoteEditor(ctk.CTkFrame):
         ctk.CTkLabel(
             reminder_section,
             text="Reminder",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=ui_font(size=12, weight="bold"),
             text_color=COLORS["text_secondary"]
         ).pack(anchor="w")
 
@@ -366,7 +362,7 @@ class NoteEditor(ctk.CTkFrame):
         self.reminder_entry = ctk.CTkEntry(
             reminder_inputs,
             placeholder_text="YYYY-MM-DD HH:MM",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             width=150,
             height=30,
             fg_color=COLORS["bg_medium"],
@@ -374,24 +370,24 @@ class NoteEditor(ctk.CTkFrame):
             border_color=COLORS["border"]
         )
         self.reminder_entry.pack(side="left")
-        self.reminder_entry.bind("<KeyRelease>", self._on_modify)
+        self._track_modifications(self.reminder_entry)
 
         self.reminder_location_entry = ctk.CTkEntry(
             reminder_inputs,
             placeholder_text="Optional location",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             height=30,
             fg_color=COLORS["bg_medium"],
             border_width=1,
             border_color=COLORS["border"]
         )
         self.reminder_location_entry.pack(side="left", fill="x", expand=True, padx=(8, 0))
-        self.reminder_location_entry.bind("<KeyRelease>", self._on_modify)
+        self._track_modifications(self.reminder_location_entry)
 
         self.clear_reminder_btn = ctk.CTkButton(
             reminder_inputs,
             text="Clear",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             width=58,
             height=30,
             fg_color="transparent",
@@ -407,14 +403,14 @@ class NoteEditor(ctk.CTkFrame):
         ctk.CTkLabel(
             shared_section,
             text="Shared With",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=ui_font(size=12, weight="bold"),
             text_color=COLORS["text_secondary"]
         ).pack(anchor="w")
 
         self.shared_display = ctk.CTkLabel(
             shared_section,
             text="Not shared",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             text_color=COLORS["text_muted"],
             anchor="w",
             justify="left",
@@ -431,14 +427,14 @@ class NoteEditor(ctk.CTkFrame):
         ctk.CTkLabel(
             attachments_header,
             text="Attachments",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=ui_font(size=12, weight="bold"),
             text_color=COLORS["text_secondary"]
         ).pack(side="left")
 
         self.add_image_btn = ctk.CTkButton(
             attachments_header,
             text="Add Image",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             width=86,
             height=28,
             fg_color="transparent",
@@ -451,7 +447,7 @@ class NoteEditor(ctk.CTkFrame):
         self.paste_image_btn = ctk.CTkButton(
             attachments_header,
             text="Paste Image",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             width=92,
             height=28,
             fg_color="transparent",
@@ -464,7 +460,7 @@ class NoteEditor(ctk.CTkFrame):
         self.record_audio_btn = ctk.CTkButton(
             attachments_header,
             text="Record Audio",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             width=104,
             height=28,
             fg_color="transparent",
@@ -477,7 +473,7 @@ class NoteEditor(ctk.CTkFrame):
         self.audio_status_label = ctk.CTkLabel(
             attachments_section,
             text="",
-            font=ctk.CTkFont(size=11),
+            font=ui_font(size=11),
             text_color=COLORS["text_muted"],
             anchor="w"
         )
@@ -493,7 +489,6 @@ class NoteEditor(ctk.CTkFrame):
             self.text_frame,
             self.content_text,
             self._content_text_widget(),
-            self.checklist_frame,
             attachments_section,
             attachments_header,
             self.attachments_frame,
@@ -507,7 +502,7 @@ class NoteEditor(ctk.CTkFrame):
         self.unlink_btn = ctk.CTkButton(
             self.advanced_frame,
             text="Unlink from Google Keep",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             height=32,
             fg_color="transparent",
             hover_color=COLORS["bg_hover"],
@@ -518,8 +513,9 @@ class NoteEditor(ctk.CTkFrame):
         )
 
         # Initialize with text editor
-        self.text_frame.pack(fill="both", expand=True)
+        self.text_frame.grid(row=0, column=0, sticky="nsew")
         self.checklist_items_widgets: List[ctk.CTkFrame] = []
+        self._label_chips: Dict[str, ctk.CTkFrame] = {}
 
     def load_note(self, note: Optional[Note] = None):
         """Load a note into the editor"""
@@ -559,15 +555,9 @@ class NoteEditor(ctk.CTkFrame):
                 self.unlink_btn.pack_forget()
 
             # Update pin button
-            pin_color = COLORS["accent_yellow"] if note.pinned else COLORS["text_secondary"]
-            self.pin_btn.configure(image=IconManager.get_icon("pin", 18, pin_color))
+            self._show_pin_state(note.pinned)
         else:
-            self.current_note = Note(
-                id=str(uuid.uuid4()),
-                title="",
-                content="",
-                sync_status=SyncStatus.LOCAL_ONLY
-            )
+            self.current_note = None
             self.header_title.configure(text="New Note")
 
             self.title_entry.delete(0, "end")
@@ -583,13 +573,42 @@ class NoteEditor(ctk.CTkFrame):
             self._load_attachments([])
             self.sync_badge.update_status(SyncStatus.LOCAL_ONLY)
             self.unlink_btn.pack_forget()
-            self.pin_btn.configure(image=IconManager.get_icon("pin", 18, COLORS["text_secondary"]))
+            self._show_pin_state(False)
 
-        self.is_modified = False
+        self._clear_modified()
 
     def _on_modify(self, event=None):
-        """Mark note as modified"""
-        self.is_modified = True
+        """Mark note as modified; the keystroke binding is dropped until the next save or load."""
+        if event is not None:
+            self._ensure_current_note()
+        if not self.is_modified:
+            self.is_modified = True
+            self.tk.call("bind", self._modify_tag, "<KeyRelease>", "")
+
+    def _clear_modified(self):
+        """Reset the modified flag and re-arm the shared <KeyRelease> binding."""
+        self.is_modified = False
+        self.tk.call("bind", self._modify_tag, "<KeyRelease>", self._modify_script)
+
+    def _ensure_current_note(self) -> Note:
+        """Return the note being edited, creating the blank new note on first use."""
+        if self.current_note is None:
+            self.current_note = Note(
+                id=str(uuid.uuid4()),
+                title="",
+                content="",
+                sync_status=SyncStatus.LOCAL_ONLY
+            )
+        return self.current_note
+
+    def _track_modifications(self, widget):
+        """Route key releases in a CTk entry or textbox to _on_modify through the editor's bindtag."""
+        inner = getattr(widget, "_entry", None) or getattr(widget, "_textbox", widget)
+        inner.bindtags((self._modify_tag,) + inner.bindtags())
+
+    def destroy(self):
+        self.unbind_class(self._modify_tag, "<KeyRelease>")
+        super().destroy()
 
     def _register_image_drop_targets(self, *widgets):
         """Register widgets as native file drop targets when the optional bridge is available."""
@@ -658,10 +677,10 @@ class NoteEditor(ctk.CTkFrame):
         widget.tag_configure("list_item", foreground=COLORS["text_primary"], lmargin1=18, lmargin2=30, spacing3=3)
         widget.tag_configure("task", foreground=COLORS["text_primary"], lmargin1=18, lmargin2=30, spacing3=3)
         widget.tag_configure("quote", foreground=COLORS["text_secondary"], lmargin1=18, lmargin2=18, spacing1=4, spacing3=4)
-        widget.tag_configure("code_block", foreground=COLORS["accent_cyan"], background=COLORS["bg_darkest"], font=("Consolas", 12), lmargin1=12, lmargin2=12, spacing1=3, spacing3=3)
+        widget.tag_configure("code_block", foreground=COLORS["accent_cyan"], background=COLORS["bg_darkest"], font=(MONO_FAMILY, 12), lmargin1=12, lmargin2=12, spacing1=3, spacing3=3)
         widget.tag_configure("bold", font=("Segoe UI", 13, "bold"))
         widget.tag_configure("italic", font=("Segoe UI", 13, "italic"))
-        widget.tag_configure("inline_code", foreground=COLORS["accent_cyan"], background=COLORS["bg_darkest"], font=("Consolas", 12))
+        widget.tag_configure("inline_code", foreground=COLORS["accent_cyan"], background=COLORS["bg_darkest"], font=(MONO_FAMILY, 12))
 
     def _markdown_enabled(self) -> bool:
         return (
@@ -767,7 +786,7 @@ class NoteEditor(ctk.CTkFrame):
             ctk.CTkLabel(
                 self.attachments_frame,
                 text="No attachments - drop images here or use Add/Paste",
-                font=ctk.CTkFont(size=12),
+                font=ui_font(size=12),
                 text_color=COLORS["text_muted"],
                 anchor="w"
             ).pack(anchor="w")
@@ -795,7 +814,7 @@ class NoteEditor(ctk.CTkFrame):
             ctk.CTkLabel(
                 details,
                 text=attachment.filename,
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=ui_font(size=12, weight="bold"),
                 text_color=COLORS["text_primary"],
                 anchor="w"
             ).pack(fill="x")
@@ -803,7 +822,7 @@ class NoteEditor(ctk.CTkFrame):
             ctk.CTkLabel(
                 details,
                 text=attachment.mime_type,
-                font=ctk.CTkFont(size=11),
+                font=ui_font(size=11),
                 text_color=COLORS["text_muted"],
                 anchor="w"
             ).pack(fill="x")
@@ -811,7 +830,7 @@ class NoteEditor(ctk.CTkFrame):
             open_btn = ctk.CTkButton(
                 row,
                 text="Open",
-                font=ctk.CTkFont(size=12),
+                font=ui_font(size=12),
                 width=58,
                 height=30,
                 fg_color="transparent",
@@ -838,8 +857,7 @@ class NoteEditor(ctk.CTkFrame):
 
     def _add_image_attachment(self):
         """Copy an image file into the note attachment store."""
-        if not self.current_note:
-            return
+        self._ensure_current_note()
         path = filedialog.askopenfilename(title="Add Image", filetypes=IMAGE_FILETYPES)
         if not path:
             return
@@ -854,8 +872,7 @@ class NoteEditor(ctk.CTkFrame):
 
     def _paste_image_attachment(self):
         """Paste a clipboard image into the note attachment store."""
-        if not self.current_note:
-            return
+        self._ensure_current_note()
         try:
             clipboard = ImageGrab.grabclipboard()
             if isinstance(clipboard, Image.Image):
@@ -874,8 +891,7 @@ class NoteEditor(ctk.CTkFrame):
 
     def _handle_image_drop(self, event):
         """Copy dropped image files into the note attachment store."""
-        if not self.current_note:
-            return drop_copy_action()
+        self._ensure_current_note()
 
         paths = parse_drop_file_paths(getattr(event, "data", ""), splitlist=self.tk.splitlist)
         if not paths:
@@ -914,8 +930,7 @@ class NoteEditor(ctk.CTkFrame):
             self._start_audio_recording()
 
     def _start_audio_recording(self):
-        if not self.current_note:
-            return
+        self._ensure_current_note()
         try:
             self.audio_recorder = AudioRecorder()
             self.audio_recorder.start()
@@ -1004,24 +1019,57 @@ class NoteEditor(ctk.CTkFrame):
             self._on_modify()
         self._set_audio_status("Audio transcribed into the note.")
 
+    def _build_checklist_ui(self) -> ctk.CTkFrame:
+        """Create the checklist editor; text notes, the common case, never pay for it."""
+        self.checklist_frame = ctk.CTkFrame(self.content_container, fg_color="transparent")
+        self.checklist_frame.grid(row=0, column=0, sticky="nsew")
+        self.checklist_frame.lower()
+
+        self.checklist_scroll = ctk.CTkScrollableFrame(
+            self.checklist_frame,
+            fg_color=COLORS["bg_medium"],
+            corner_radius=8
+        )
+        self.checklist_scroll.pack(fill="both", expand=True)
+
+        self.add_item_btn = ctk.CTkButton(
+            self.checklist_frame,
+            text="+ Add Item",
+            font=ui_font(size=13),
+            height=36,
+            fg_color="transparent",
+            hover_color=COLORS["bg_hover"],
+            text_color=COLORS["accent_blue"],
+            anchor="w",
+            command=self._add_checklist_item
+        )
+        self.add_item_btn.pack(fill="x", pady=(8, 0))
+        self._register_image_drop_targets(self.checklist_frame)
+        return self.checklist_frame
+
     def _on_type_change(self):
         """Switch between text and checklist editor"""
         if self.note_type_var.get() == "checklist":
-            self.text_frame.pack_forget()
-            self.checklist_frame.pack(fill="both", expand=True)
+            (self.checklist_frame or self._build_checklist_ui()).tkraise()
         else:
-            self.checklist_frame.pack_forget()
-            self.text_frame.pack(fill="both", expand=True)
+            self.text_frame.tkraise()
         self._refresh_markdown_controls()
         self._on_modify()
 
     def _toggle_pin(self):
         """Toggle note pinned status"""
-        if self.current_note:
-            self.current_note.pinned = not self.current_note.pinned
-            pin_color = COLORS["accent_yellow"] if self.current_note.pinned else COLORS["text_secondary"]
-            self.pin_btn.configure(image=IconManager.get_icon("pin", 18, pin_color))
-            self._on_modify()
+        note = self._ensure_current_note()
+        note.pinned = not note.pinned
+        self._show_pin_state(note.pinned)
+        self._on_modify()
+
+    def _show_pin_state(self, pinned: bool):
+        """Swap the pin button between its two cached icons; loading a note with the same state is a no-op."""
+        if pinned == self._pin_icon_pinned:
+            return
+        self._pin_icon_pinned = pinned
+        pin_color = COLORS["accent_yellow"] if pinned else COLORS["text_secondary"]
+        self.pin_btn.configure(image=IconManager.get_icon("pin", 18, pin_color))
 
     def _add_checklist_item(
         self,
@@ -1032,6 +1080,11 @@ class NoteEditor(ctk.CTkFrame):
         focus: bool = True
     ):
         """Add a checklist item widget."""
+        if self.checklist_frame is None:
+            self._build_checklist_ui()
+        # Shared by the drag handle and every row button
+        text_muted = COLORS["text_muted"]
+        bg_hover = COLORS["bg_hover"]
         item_frame = ctk.CTkFrame(self.checklist_scroll, fg_color="transparent")
         item_frame.item_id = item_id or str(uuid.uuid4())
         item_frame.indent = clamp_checklist_indent(indent)
@@ -1040,12 +1093,12 @@ class NoteEditor(ctk.CTkFrame):
             item_frame,
             text="::",
             width=22,
-            font=ctk.CTkFont(size=13, weight="bold"),
-            text_color=COLORS["text_muted"]
+            font=ui_font(size=13, weight="bold"),
+            text_color=text_muted
         )
         drag_handle.pack(side="left", padx=(4, 4))
         drag_handle.bind("<ButtonPress-1>", lambda e, frame=item_frame: self._start_checklist_drag(frame))
-        drag_handle.bind("<ButtonRelease-1>", lambda e, frame=item_frame: self._finish_checklist_drag(frame, e))
+        drag_handle.bind("<ButtonRelease-1>", partial(self._finish_checklist_drag, item_frame))
 
         check_var = ctk.BooleanVar(value=checked)
         checkbox = ctk.CTkCheckBox(
@@ -1064,16 +1117,17 @@ class NoteEditor(ctk.CTkFrame):
         entry = ctk.CTkEntry(
             item_frame,
             placeholder_text="List item",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             fg_color="transparent",
             border_width=0,
             text_color=COLORS["text_primary"]
         )
         entry.pack(side="left", fill="x", expand=True)
         entry.insert(0, text)
-        entry.bind("<KeyRelease>", self._on_modify)
+        self._track_modifications(entry)
         entry.bind("<Return>", lambda e: self._add_checklist_item())
 
+        # Row buttons call bound-method partials, not one fresh closure per button
         for label, delta in (("<", -1), (">", 1)):
             indent_btn = ctk.CTkButton(
                 item_frame,
@@ -1081,9 +1135,9 @@ class NoteEditor(ctk.CTkFrame):
                 width=24,
                 height=24,
                 fg_color="transparent",
-                hover_color=COLORS["bg_hover"],
-                text_color=COLORS["text_muted"],
-                command=lambda d=delta, frame=item_frame: self._adjust_checklist_indent(frame, d)
+                hover_color=bg_hover,
+                text_color=text_muted,
+                command=partial(self._adjust_checklist_indent, item_frame, delta)
             )
             indent_btn.pack(side="right", padx=(2, 0))
 
@@ -1093,9 +1147,9 @@ class NoteEditor(ctk.CTkFrame):
             width=32,
             height=24,
             fg_color="transparent",
-            hover_color=COLORS["bg_hover"],
-            text_color=COLORS["text_muted"],
-            command=lambda: self._move_checklist_item(item_frame, 1)
+            hover_color=bg_hover,
+            text_color=text_muted,
+            command=partial(self._move_checklist_item, item_frame, 1)
         )
         down_btn.pack(side="right", padx=(2, 0))
 
@@ -1105,9 +1159,9 @@ class NoteEditor(ctk.CTkFrame):
             width=32,
             height=24,
             fg_color="transparent",
-            hover_color=COLORS["bg_hover"],
-            text_color=COLORS["text_muted"],
-            command=lambda: self._move_checklist_item(item_frame, -1)
+            hover_color=bg_hover,
+            text_color=text_muted,
+            command=partial(self._move_checklist_item, item_frame, -1)
         )
         up_btn.pack(side="right", padx=(2, 0))
 
@@ -1117,16 +1171,17 @@ class NoteEditor(ctk.CTkFrame):
             width=24,
             height=24,
             fg_color="transparent",
-            hover_color=COLORS["bg_hover"],
-            text_color=COLORS["text_muted"],
-            command=lambda: self._remove_checklist_item(item_frame)
+            hover_color=bg_hover,
+            text_color=text_muted,
+            command=partial(self._remove_checklist_item, item_frame)
         )
         delete_btn.pack(side="right", padx=(4, 4))
 
         item_frame.check_var = check_var
         item_frame.entry = entry
         self.checklist_items_widgets.append(item_frame)
-        self._repack_checklist_items()
+        # New rows always go last, so only this row is packed, not every row again
+        self._pack_checklist_item(item_frame)
 
         if focus:
             entry.focus_set()
@@ -1136,7 +1191,11 @@ class NoteEditor(ctk.CTkFrame):
         """Pack checklist rows in stored order with visual indentation."""
         for widget in self.checklist_items_widgets:
             widget.pack_forget()
-            widget.pack(fill="x", pady=2, padx=(4 + widget.indent * 24, 4))
+            self._pack_checklist_item(widget)
+
+    @staticmethod
+    def _pack_checklist_item(widget):
+        widget.pack(fill="x", pady=2, padx=(4 + widget.indent * 24, 4))
 
     def _move_checklist_item(self, item_frame, delta: int):
         """Move a checklist item up or down."""
@@ -1205,10 +1264,11 @@ class NoteEditor(ctk.CTkFrame):
     def _add_label(self, event=None):
         """Add a label to the note"""
         label_text = self.label_entry.get().strip()
-        if label_text and self.current_note:
-            if label_text not in self.current_note.labels:
+        if label_text:
+            if label_text not in self._ensure_current_note().labels:
                 self.current_note.labels.append(label_text)
-                self._load_labels(self.current_note.labels)
+                self._label_chips[label_text] = self._make_label_chip(label_text)
+                self._refresh_markdown_controls()
                 self._on_modify()
             self.label_entry.delete(0, "end")
 
@@ -1216,48 +1276,55 @@ class NoteEditor(ctk.CTkFrame):
         """Remove a label from the note"""
         if self.current_note and label in self.current_note.labels:
             self.current_note.labels.remove(label)
-            self._load_labels(self.current_note.labels)
+            chip = self._label_chips.pop(label, None)
+            if chip is not None:
+                chip.destroy()
+            self._refresh_markdown_controls()
             self._on_modify()
 
     def _load_labels(self, labels: List[str]):
-        """Load labels into display"""
-        for widget in self.labels_display.winfo_children():
-            widget.destroy()
+        """Load labels into display; adding or removing one label only touches its own chip."""
+        for chip in self._label_chips.values():
+            chip.destroy()
 
-        for label in labels:
-            label_frame = ctk.CTkFrame(
-                self.labels_display,
-                fg_color=COLORS["accent_purple"],
-                corner_radius=12
-            )
-            label_frame.pack(side="left", padx=(0, 4))
-
-            label_text = ctk.CTkLabel(
-                label_frame,
-                text=label,
-                font=ctk.CTkFont(size=11),
-                text_color=COLORS["bg_darkest"]
-            )
-            label_text.pack(side="left", padx=(8, 4), pady=4)
+        self._label_chips = {label: self._make_label_chip(label) for label in labels}
+        self._refresh_markdown_controls()
 
-            remove_btn = ctk.CTkButton(
-                label_frame,
-                text="×",
-                width=16,
-                height=16,
-                fg_color="transparent",
-                hover_color=COLORS["accent_purple"],
-                text_color=COLORS["bg_darkest"],
-                command=lambda l=label: self._remove_label(l)
-            )
-            remove_btn.pack(side="left", padx=(0, 4))
+    def _make_label_chip(self, label: str) -> ctk.CTkFrame:
+        """Build and pack one removable label chip."""
+        chip_color = COLORS["accent_purple"]
+        chip_text_color = COLORS["bg_darkest"]
+        label_frame = ctk.CTkFrame(
+            self.labels_display,
+            fg_color=chip_color,
+            corner_radius=12
+        )
+        label_frame.pack(side="left", padx=(0, 4))
 
-        self._refresh_markdown_controls()
+        label_text = ctk.CTkLabel(
+            label_frame,
+            text=label,
+            font=ui_font(size=11),
+            text_color=chip_text_color
+        )
+        label_text.pack(side="left", padx=(8, 4), pady=4)
+
+        # A clickable label is lighter than a CTkButton for the chip's remove control
+        remove_label = ctk.CTkLabel(
+            label_frame,
+            text="×",
+            width=16,
+            height=16,
+            cursor="hand2",
+            text_color=chip_text_color
+        )
+        remove_label.pack(side="left", padx=(0, 4))
+        remove_label.bind("<Button-1>", lambda e, l=label: self._remove_label(l))
+        return label_frame
 
     def _save_note(self):
         """Save the current note"""
-        if not self.current_note:
-            return
+        self._ensure_current_note()
 
         # Update note data
         self.current_note.title = self.title_entry.get()
@@ -1279,12 +1346,12 @@ class NoteEditor(ctk.CTkFrame):
             self.current_note.checklist_items = [
                 ChecklistItem(
                     id=widget.item_id,
-                    text=widget.entry.get(),
+                    text=text,
                     checked=widget.check_var.get(),
                     indent=widget.indent
                 )
-                for widget in self.checklist_items_widgets
-                if widget.entry.get().strip()
+                for widget, text in zip(self.checklist_items_widgets, self._checklist_entry_texts())
+                if text.strip()
             ]
             self.current_note.content = ""
         else:
@@ -1297,11 +1364,35 @@ class NoteEditor(ctk.CTkFrame):
         if self.current_note.keep_id:
             self.current_note.sync_status = SyncStatus.PENDING_PUSH
 
-        # Save to database
-        if self.db.save_note(self.current_note):
-            self.is_modified = False
-            self.sync_badge.update_status(self.current_note.sync_status)
-            self.on_save_callback(self.current_note)
+        # Save on the database writer thread. The Tk root polls for the result because it
+        # outlives detached editors that close right after saving, and the writer thread
+        # itself never touches Tk (the UI thread may be blocked waiting on it).
+        note = self.current_note
+        self._clear_modified()
+        self._poll_save(self._root(), note, self.db.save_note_async(note))
+
+    def _poll_save(self, root, note: Note, save: Future):
+        if not save.done():
+            root.after(self.SAVE_POLL_MS, self._poll_save, root, note, save)
+            return
+        self._finish_save(note, save.result())
+
+    def _finish_save(self, note: Note, saved: bool):
+        """Apply a completed background save on the UI thread."""
+        is_current = self.winfo_exists() and note is self.current_note
+        if not saved:
+            log_diagnostic_event("error", f"Failed to save note {note.id}")
+            if is_current:
+                self._on_modify()
+            else:
+                # The editor has moved on, so nothing else would tell the user these edits were lost
+                messagebox.showerror(
+                    "Save Failed", f"Your latest changes to \"{note.title or 'Untitled'}\" could not be saved."
+                )
+            return
+        if is_current:
+            self.sync_badge.update_status(note.sync_status)
+        self.on_save_callback(note)
 
     def _unlink_from_keep(self):
         """Unlink the note from Google Keep"""
@@ -1326,11 +1417,20 @@ class NoteEditor(ctk.CTkFrame):
             self.unlink_btn.pack_forget()
             self.on_save_callback(self.current_note)
 
+    def _checklist_entry_texts(self) -> List[str]:
+        """Read every checklist entry in one Tcl round-trip instead of one get() per row."""
+        entries = [widget.entry for widget in self.checklist_items_widgets]
+        if not entries:
+            return []
+        texts = self.tk.splitlist(self.tk.eval("list " + " ".join(f"[{entry._entry._w} get]" for entry in entries)))
+        # Raw Tk entries hold the placeholder text while it is showing; CTkEntry.get() reports that as empty
+        return ["" if entry._placeholder_text_active else text for entry, text in zip(entries, texts)]
+
     def _handle_popout(self):
         if self.is_modified:
             self._save_note()
-        if self.current_note and self.on_popout_callback:
-            self.on_popout_callback(self.current_note)
+        if self.on_popout_callback:
+            self.on_popout_callback(self._ensure_current_note())
 
     def _handle_close(self):
         """Handle close with unsaved changes check"""
@@ -2,6 +2,7 @@
 
 import difflib
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from keepsync_models import Note, NoteType, normalize_keep_color
@@ -98,7 +99,9 @@ def advanced_filters_active(filters: Dict[str, Any]) -> bool:
     return any(filters.get(key) != value for key, value in defaults.items() if key != "mode")
 
 
+@lru_cache(maxsize=32)
 def parse_filter_date(value: str) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD filter bound; cached because filters are re-applied to every note."""
     text = (value or "").strip()
     if not text:
         return None
@@ -4,6 +4,13 @@ from datetime import datetime, timezone
 import re
 from typing import Any, Dict, List, Optional
 
+# Compiled once: the markdown preview re-renders on every editor keystroke.
+_INLINE_MARKDOWN_PATTERN = re.compile(r"(`([^`]+)`|\*\*([^*]+)\*\*|__([^_]+)__|\*([^*]+)\*|_([^_]+)_)")
+_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$")
+_TASK_PATTERN = re.compile(r"^\s*[-*+]\s+\[([ xX])\]\s+(.+)$")
+_BULLET_PATTERN = re.compile(r"^\s*[-*+]\s+(.+)$")
+_NUMBERED_PATTERN = re.compile(r"^\s*(\d+)[.)]\s+(.+)$")
+
 
 def parse_reminder_datetime(value: str) -> Optional[datetime]:
     text = (value or "").strip()
@@ -49,11 +56,10 @@ def note_uses_markdown(labels: List[str]) -> bool:
 
 def split_inline_markdown(text: str) -> List[Dict[str, str]]:
     """Split a markdown line into display segments with lightweight styles."""
-    pattern = re.compile(r"(`([^`]+)`|\*\*([^*]+)\*\*|__([^_]+)__|\*([^*]+)\*|_([^_]+)_)")
     segments = []
     cursor = 0
 
-    for match in pattern.finditer(text or ""):
+    for match in _INLINE_MARKDOWN_PATTERN.finditer(text or ""):
         if match.start() > cursor:
             segments.append({"text": text[cursor:match.start()], "style": "plain"})
 
@@ -91,7 +97,7 @@ def markdown_preview_blocks(markdown_text: str) -> List[Dict[str, Any]]:
             blocks.append({"style": "blank", "segments": []})
             continue
 
-        heading = re.match(r"^(#{1,6})\s+(.+)$", stripped)
+        heading = _HEADING_PATTERN.match(stripped)
         if heading:
             level = min(len(heading.group(1)), 3)
             blocks.append({
@@ -100,7 +106,7 @@ def markdown_preview_blocks(markdown_text: str) -> List[Dict[str, Any]]:
             })
             continue
 
-        task = re.match(r"^\s*[-*+]\s+\[([ xX])\]\s+(.+)$", raw_line)
+        task = _TASK_PATTERN.match(raw_line)
         if task:
             mark = "[x]" if task.group(1).lower() == "x" else "[ ]"
             blocks.append({
@@ -109,7 +115,7 @@ def markdown_preview_blocks(markdown_text: str) -> List[Dict[str, Any]]:
             })
             continue
 
-        bullet = re.match(r"^\s*[-*+]\s+(.+)$", raw_line)
+        bullet = _BULLET_PATTERN.match(raw_line)
         if bullet:
             blocks.append({
                 "style": "list_item",
@@ -117,7 +123,7 @@ def markdown_preview_blocks(markdown_text: str) -> List[Dict[str, Any]]:
             })
             continue
 
-        numbered = re.match(r"^\s*(\d+)[.)]\s+(.+)$", raw_line)
+        numbered = _NUMBERED_PATTERN.match(raw_line)
         if numbered:
             blocks.append({
                 "style": "list_item",
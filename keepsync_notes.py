@@ -86,6 +86,17 @@ from keepsync_folders import (
     normalize_folder_path,
     note_matches_folder,
 )
+from keepsync_json import (
+    IJSON_AVAILABLE,
+    ORJSON_AVAILABLE,
+    iter_json_items,
+    json_dumps,
+    json_dumps_bytes,
+    json_dumps_pretty,
+    json_dumps_pretty_bytes,
+    json_loads,
+    peek_json_container,
+)
 from keepsync_import_reports import IMPORT_SUCCESS_STATUSES, import_summary_lines
 from keepsync_import_safety import (
     MAX_IMPORT_FOLDER_BYTES,
@@ -125,6 +136,7 @@ from keepsync_models import (
     KEEP_COLOR_PALETTE,
     Label,
     Note,
+    NoteSummary,
     NoteType,
     SyncStatus,
     clamp_checklist_indent,
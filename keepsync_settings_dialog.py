@@ -1,23 +1,23 @@
 """Settings dialog and settings-backed import/export workflows."""
 
-import json
 import threading
 import uuid
 import webbrowser
 from datetime import datetime, timezone
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Any, Callable, List, Optional
+from typing import Any, BinaryIO, Callable, Iterator, List, Optional, Tuple
 
 import customtkinter as ctk
 
 import keepsync_diagnostics as diagnostics_state
 from keepsync_backups import LocalBackupManager
-from keepsync_cloud_sync import CloudSyncManager
+from keepsync_cloud_sync import PYGITHUB_AVAILABLE, CloudSyncManager
 from keepsync_diagnostics import log_diagnostic_exception
 from keepsync_import_reports import IMPORT_SUCCESS_STATUSES, import_summary_lines
 from keepsync_import_safety import ImportCancelled
 from keepsync_importers import MultiSourceImporter, extract_shared_with, import_takeout_attachments
+from keepsync_json import iter_json_items, json_dumps_bytes, json_loads, peek_json_container
 from keepsync_markdown_export import export_markdown_vault
 from keepsync_clipboard_import import (
     CLIPBOARD_HISTORY_AVAILABLE,
@@ -42,12 +42,84 @@ from keepsync_ui_dialogs import (
     TakeoutInstructionsDialog,
     TokenGeneratorDialog,
 )
+from keepsync_ui_fonts import MONO_FAMILY, ui_font
 from keepsync_ui_modal import configure_modal_dialog
 
 
+_GDRIVE_INSTRUCTIONS = """Google Drive Setup Instructions
+
+1. Go to console.cloud.google.com
+
+2. Create a new project (or select existing)
+
+3. Enable the Google Drive API:
+   - Go to "APIs & Services" → "Library"
+   - Search for "Google Drive API"
+   - Click "Enable"
+
+4. Create OAuth credentials:
+   - Go to "APIs & Services" → "Credentials"
+   - Click "Create Credentials" → "OAuth client ID"
+   - Select "Desktop app"
+   - Download the JSON file
+
+5. Save the JSON file as:
+   {credentials_path}
+
+6. Click "Connect to Google Drive" again
+
+The first time you connect, a browser window will open
+for you to authorize the app."""
+
+
+def _static_label(
+    parent,
+    text: str,
+    size: int,
+    color: str,
+    weight: Optional[str] = None,
+    justify: str = "center",
+    **pack_options,
+) -> ctk.CTkLabel:
+    """Create and pack a settings label whose text never changes."""
+    label = ctk.CTkLabel(
+        parent,
+        text=text,
+        font=ui_font(size=size, weight=weight),
+        text_color=COLORS[color],
+        justify=justify
+    )
+    label.pack(**pack_options)
+    return label
+
+
+def _link_button(parent, text: str, command: Callable, **pack_options) -> ctk.CTkButton:
+    """Create and pack a borderless blue help link."""
+    button = ctk.CTkButton(
+        parent,
+        text=text,
+        font=ui_font(size=11),
+        height=28,
+        fg_color="transparent",
+        hover_color=COLORS["bg_hover"],
+        text_color=COLORS["accent_blue"],
+        anchor="w",
+        command=command
+    )
+    button.pack(**pack_options)
+    return button
+
+
 class SettingsDialog(ctk.CTkToplevel):
     """Settings dialog for Google Keep connection and app settings"""
 
+    # Notes saved per transaction while streaming a JSON import
+    IMPORT_BATCH_SIZE = 500
+    # Quiet period before auto-sync changes are written, so rapid toggles cost one write
+    AUTOSYNC_SAVE_DELAY_MS = 200
+    # Write buffer for JSON exports: per-note writes reach the OS in a few large chunks
+    EXPORT_BUFFER_SIZE = 1 << 20
+
     def __init__(
         self,
         parent,
@@ -71,6 +143,7 @@ class SettingsDialog(ctk.CTkToplevel):
         self.db_version = db_version
         self.gkeepapi_available = gkeepapi_available
         self.web_scraper_factory = web_scraper_factory
+        self._autosync_save_after_id = None
 
         self.title("Settings")
         self.geometry("550x700")
@@ -94,16 +167,19 @@ class SettingsDialog(ctk.CTkToplevel):
         self.tabview.add("🔄 Google Keep")
         self.tabview.add("📦 Data")
 
-        # Build each tab
+        # Build the visible tab now; the others on first reveal
+        self._tab_builders = {
+            "🔄 Google Keep": self._build_keep_tab,
+            "📦 Data": self._build_data_tab,
+        }
+        self.tabview.configure(command=self._on_tab_changed)
         self._build_cloud_sync_tab()
-        self._build_keep_tab()
-        self._build_data_tab()
 
         # Close button
         close_btn = ctk.CTkButton(
             self,
             text="Close",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=ui_font(size=14, weight="bold"),
             height=44,
             fg_color=COLORS["accent_blue"],
             hover_color=COLORS["accent_blue_hover"],
@@ -112,6 +188,11 @@ class SettingsDialog(ctk.CTkToplevel):
         )
         close_btn.pack(fill="x", padx=20, pady=(0, 15))
 
+    def _on_tab_changed(self):
+        builder = self._tab_builders.pop(self.tabview.get(), None)
+        if builder:
+            builder()
+
     def _build_cloud_sync_tab(self):
         """Build the Cloud Sync settings tab"""
         tab = self.tabview.tab("☁️ Cloud Sync")
@@ -119,31 +200,29 @@ class SettingsDialog(ctk.CTkToplevel):
         # Scroll frame
         scroll = ctk.CTkScrollableFrame(tab, fg_color="transparent")
         scroll.pack(fill="both", expand=True)
+        self.cloud_scroll = scroll
 
         # Header
-        ctk.CTkLabel(
-            scroll,
-            text="Cloud Backup",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=COLORS["text_primary"]
-        ).pack(anchor="w", pady=(10, 5))
+        _static_label(scroll, "Cloud Backup", 20, "text_primary", weight="bold", anchor="w", pady=(10, 5))
 
-        ctk.CTkLabel(
+        _static_label(
             scroll,
-            text="Sync your notes to Google Drive or GitHub for backup",
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS["text_secondary"]
-        ).pack(anchor="w", pady=(0, 15))
+            "Sync your notes to Google Drive or GitHub for backup",
+            12,
+            "text_secondary",
+            anchor="w", pady=(0, 15)
+        )
 
         # Current status
         status_frame = ctk.CTkFrame(scroll, fg_color=COLORS["bg_medium"], corner_radius=10)
         status_frame.pack(fill="x", pady=(0, 15))
 
+        self._cloud_status_display = ("Not connected to any cloud service", COLORS["text_muted"])
         self.cloud_status_label = ctk.CTkLabel(
             status_frame,
-            text="Not connected to any cloud service",
-            font=ctk.CTkFont(size=13),
-            text_color=COLORS["text_muted"]
+            text=self._cloud_status_display[0],
+            font=ui_font(size=13),
+            text_color=self._cloud_status_display[1]
         )
         self.cloud_status_label.pack(pady=15)
 
@@ -151,42 +230,38 @@ class SettingsDialog(ctk.CTkToplevel):
         github_frame = ctk.CTkFrame(scroll, fg_color=COLORS["bg_medium"], corner_radius=12)
         github_frame.pack(fill="x", pady=(0, 15))
 
-        github_header = ctk.CTkFrame(github_frame, fg_color="transparent")
-        github_header.pack(fill="x", padx=16, pady=(16, 8))
-
-        ctk.CTkLabel(
-            github_header,
-            text="🐙 GitHub Sync",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=COLORS["text_primary"]
-        ).pack(side="left")
+        _static_label(
+            github_frame,
+            "🐙 GitHub Sync",
+            16,
+            "text_primary",
+            weight="bold",
+            anchor="w", padx=16, pady=(16, 8)
+        )
 
+        # Placed over the title row, so no header frame is needed just to hold two labels
         ctk.CTkLabel(
-            github_header,
+            github_frame,
             text="Recommended",
-            font=ctk.CTkFont(size=11),
+            font=ui_font(size=11),
             text_color=COLORS["accent_green"]
-        ).pack(side="right")
+        ).place(relx=1.0, x=-16, y=16, anchor="ne")
 
-        ctk.CTkLabel(
+        _static_label(
             github_frame,
-            text="Store notes in a private GitHub repository with version history",
-            font=ctk.CTkFont(size=11),
-            text_color=COLORS["text_muted"]
-        ).pack(anchor="w", padx=16, pady=(0, 10))
+            "Store notes in a private GitHub repository with version history",
+            11,
+            "text_muted",
+            anchor="w", padx=16, pady=(0, 10)
+        )
 
         # GitHub Token
-        ctk.CTkLabel(
-            github_frame,
-            text="Personal Access Token",
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS["text_secondary"]
-        ).pack(anchor="w", padx=16, pady=(0, 4))
+        _static_label(github_frame, "Personal Access Token", 12, "text_secondary", anchor="w", padx=16, pady=(0, 4))
 
         self.github_token_entry = ctk.CTkEntry(
             github_frame,
             placeholder_text="Leave blank to reuse saved keyring token",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             height=38,
             fg_color=COLORS["bg_dark"],
             border_color=COLORS["border"],
@@ -195,17 +270,12 @@ class SettingsDialog(ctk.CTkToplevel):
         self.github_token_entry.pack(fill="x", padx=16)
 
         # GitHub Repo
-        ctk.CTkLabel(
-            github_frame,
-            text="Repository Name",
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS["text_secondary"]
-        ).pack(anchor="w", padx=16, pady=(10, 4))
+        _static_label(github_frame, "Repository Name", 12, "text_secondary", anchor="w", padx=16, pady=(10, 4))
 
         self.github_repo_entry = ctk.CTkEntry(
             github_frame,
             placeholder_text="my-notes-backup",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             height=38,
             fg_color=COLORS["bg_dark"],
             border_color=COLORS["border"]
@@ -213,24 +283,18 @@ class SettingsDialog(ctk.CTkToplevel):
         self.github_repo_entry.pack(fill="x", padx=16)
 
         # Help link
-        help_btn = ctk.CTkButton(
+        _link_button(
             github_frame,
-            text="📖 How to get a GitHub token",
-            font=ctk.CTkFont(size=11),
-            height=28,
-            fg_color="transparent",
-            hover_color=COLORS["bg_hover"],
-            text_color=COLORS["accent_blue"],
-            anchor="w",
-            command=lambda: webbrowser.open("https://github.com/settings/tokens/new?description=KeepSync%20Notes&scopes=repo")
+            "📖 How to get a GitHub token",
+            lambda: webbrowser.open("https://github.com/settings/tokens/new?description=KeepSync%20Notes&scopes=repo"),
+            anchor="w", padx=12, pady=(4, 0)
         )
-        help_btn.pack(anchor="w", padx=12, pady=(4, 0))
 
         # Connect button
         self.github_connect_btn = ctk.CTkButton(
             github_frame,
             text="Connect to GitHub",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=ui_font(size=13, weight="bold"),
             height=40,
             fg_color=COLORS["accent_green"],
             hover_color=COLORS["accent_green_hover"],
@@ -238,30 +302,35 @@ class SettingsDialog(ctk.CTkToplevel):
             command=self._connect_github
         )
         self.github_connect_btn.pack(fill="x", padx=16, pady=(10, 16))
+        if not PYGITHUB_AVAILABLE:
+            self.github_connect_btn.configure(state="disabled", text="PyGithub not installed (see requirements.txt)")
 
         # === Google Drive Section ===
         gdrive_frame = ctk.CTkFrame(scroll, fg_color=COLORS["bg_medium"], corner_radius=12)
         gdrive_frame.pack(fill="x", pady=(0, 15))
 
-        ctk.CTkLabel(
+        _static_label(
             gdrive_frame,
-            text="📁 Google Drive Sync",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=COLORS["text_primary"]
-        ).pack(anchor="w", padx=16, pady=(16, 8))
+            "📁 Google Drive Sync",
+            16,
+            "text_primary",
+            weight="bold",
+            anchor="w", padx=16, pady=(16, 8)
+        )
 
-        ctk.CTkLabel(
+        _static_label(
             gdrive_frame,
-            text="Store notes in a Google Drive folder\nRequires OAuth setup (more complex)",
-            font=ctk.CTkFont(size=11),
-            text_color=COLORS["text_muted"],
-            justify="left"
-        ).pack(anchor="w", padx=16, pady=(0, 10))
+            "Store notes in a Google Drive folder\nRequires OAuth setup (more complex)",
+            11,
+            "text_muted",
+            justify="left",
+            anchor="w", padx=16, pady=(0, 10)
+        )
 
         self.gdrive_connect_btn = ctk.CTkButton(
             gdrive_frame,
             text="Connect to Google Drive",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             height=40,
             fg_color=COLORS["bg_light"],
             hover_color=COLORS["bg_hover"],
@@ -270,36 +339,32 @@ class SettingsDialog(ctk.CTkToplevel):
         )
         self.gdrive_connect_btn.pack(fill="x", padx=16, pady=(0, 8))
 
-        gdrive_help = ctk.CTkButton(
+        _link_button(
             gdrive_frame,
-            text="📖 Google Drive setup instructions",
-            font=ctk.CTkFont(size=11),
-            height=28,
-            fg_color="transparent",
-            hover_color=COLORS["bg_hover"],
-            text_color=COLORS["accent_blue"],
-            anchor="w",
-            command=self._show_gdrive_instructions
+            "📖 Google Drive setup instructions",
+            self._show_gdrive_instructions,
+            anchor="w", padx=12, pady=(0, 16)
         )
-        gdrive_help.pack(anchor="w", padx=12, pady=(0, 16))
 
         # === Auto-sync Settings ===
         autosync_frame = ctk.CTkFrame(scroll, fg_color=COLORS["bg_medium"], corner_radius=12)
         autosync_frame.pack(fill="x", pady=(0, 15))
 
-        ctk.CTkLabel(
+        _static_label(
             autosync_frame,
-            text="⏱️ Auto-Sync Settings",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=COLORS["text_primary"]
-        ).pack(anchor="w", padx=16, pady=(16, 8))
+            "⏱️ Auto-Sync Settings",
+            16,
+            "text_primary",
+            weight="bold",
+            anchor="w", padx=16, pady=(16, 8)
+        )
 
         self.cloud_autosync_var = ctk.BooleanVar(value=True)
         autosync_check = ctk.CTkCheckBox(
             autosync_frame,
             text="Enable automatic cloud sync",
             variable=self.cloud_autosync_var,
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             text_color=COLORS["text_secondary"],
             fg_color=COLORS["accent_green"],
             hover_color=COLORS["accent_green_hover"],
@@ -310,45 +375,23 @@ class SettingsDialog(ctk.CTkToplevel):
         interval_frame = ctk.CTkFrame(autosync_frame, fg_color="transparent")
         interval_frame.pack(fill="x", padx=16, pady=(0, 16))
 
-        ctk.CTkLabel(
-            interval_frame,
-            text="Sync interval:",
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS["text_secondary"]
-        ).pack(side="left")
+        _static_label(interval_frame, "Sync interval:", 12, "text_secondary", side="left")
 
         self.cloud_sync_interval = ctk.CTkEntry(
             interval_frame,
             width=60,
             height=32,
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             fg_color=COLORS["bg_dark"],
             border_color=COLORS["border"]
         )
         self.cloud_sync_interval.pack(side="left", padx=(8, 4))
-        self.cloud_sync_interval.insert(0, "15")
 
-        ctk.CTkLabel(
-            interval_frame,
-            text="minutes",
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS["text_secondary"]
-        ).pack(side="left")
+        _static_label(interval_frame, "minutes", 12, "text_secondary", side="left")
 
-        # Disconnect button
-        self.cloud_disconnect_btn = ctk.CTkButton(
-            scroll,
-            text="Disconnect from Cloud",
-            font=ctk.CTkFont(size=13),
-            height=40,
-            fg_color="transparent",
-            hover_color=COLORS["bg_hover"],
-            text_color=COLORS["accent_red"],
-            border_width=1,
-            border_color=COLORS["accent_red"],
-            command=self._disconnect_cloud
-        )
-        # Initially hidden, shown when connected
+        # Disconnect button, built the first time a connection is shown
+        self.cloud_disconnect_btn = None
+        self._cloud_disconnect_visible = False
 
     def _build_keep_tab(self):
         """Build the Google Keep import tab"""
@@ -358,42 +401,35 @@ class SettingsDialog(ctk.CTkToplevel):
         scroll.pack(fill="both", expand=True)
 
         # Header
-        ctk.CTkLabel(
-            scroll,
-            text="Import from Google Keep",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=COLORS["text_primary"]
-        ).pack(anchor="w", pady=(10, 5))
+        _static_label(scroll, "Import from Google Keep", 20, "text_primary", weight="bold", anchor="w", pady=(10, 5))
 
-        ctk.CTkLabel(
+        _static_label(
             scroll,
-            text="One-time import to migrate your notes from Google Keep",
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS["text_secondary"]
-        ).pack(anchor="w", pady=(0, 15))
+            "One-time import to migrate your notes from Google Keep",
+            12,
+            "text_secondary",
+            anchor="w", pady=(0, 15)
+        )
 
         # Takeout import (primary)
         takeout_frame = ctk.CTkFrame(scroll, fg_color=COLORS["bg_medium"], corner_radius=12)
         takeout_frame.pack(fill="x", pady=(0, 15))
 
-        ctk.CTkLabel(
+        _static_label(
             takeout_frame,
-            text="📦 Google Takeout Import",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=COLORS["text_primary"]
-        ).pack(anchor="w", padx=16, pady=(16, 4))
+            "📦 Google Takeout Import",
+            16,
+            "text_primary",
+            weight="bold",
+            anchor="w", padx=16, pady=(16, 4)
+        )
 
-        ctk.CTkLabel(
-            takeout_frame,
-            text="Recommended",
-            font=ctk.CTkFont(size=11),
-            text_color=COLORS["accent_green"]
-        ).pack(anchor="w", padx=16, pady=(0, 8))
+        _static_label(takeout_frame, "Recommended", 11, "accent_green", anchor="w", padx=16, pady=(0, 8))
 
         takeout_btn = ctk.CTkButton(
             takeout_frame,
             text="Import from Takeout Folder",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=ui_font(size=13, weight="bold"),
             height=40,
             fg_color=COLORS["accent_green"],
             hover_color=COLORS["accent_green_hover"],
@@ -402,42 +438,39 @@ class SettingsDialog(ctk.CTkToplevel):
         )
         takeout_btn.pack(fill="x", padx=16, pady=(0, 8))
 
-        takeout_help = ctk.CTkButton(
+        _link_button(
             takeout_frame,
-            text="📖 How to export from Google Takeout",
-            font=ctk.CTkFont(size=11),
-            height=28,
-            fg_color="transparent",
-            hover_color=COLORS["bg_hover"],
-            text_color=COLORS["accent_blue"],
-            anchor="w",
-            command=lambda: TakeoutInstructionsDialog(self)
+            "📖 How to export from Google Takeout",
+            lambda: TakeoutInstructionsDialog.show(self),
+            anchor="w", padx=12, pady=(0, 16)
         )
-        takeout_help.pack(anchor="w", padx=12, pady=(0, 16))
 
         # Browser import (alternative)
         browser_frame = ctk.CTkFrame(scroll, fg_color=COLORS["bg_medium"], corner_radius=12)
         browser_frame.pack(fill="x", pady=(0, 15))
 
-        ctk.CTkLabel(
+        _static_label(
             browser_frame,
-            text="🌐 Browser Session Import",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=COLORS["text_primary"]
-        ).pack(anchor="w", padx=16, pady=(16, 8))
+            "🌐 Browser Session Import",
+            16,
+            "text_primary",
+            weight="bold",
+            anchor="w", padx=16, pady=(16, 8)
+        )
 
-        ctk.CTkLabel(
+        _static_label(
             browser_frame,
-            text="Extract notes using your browser's Google login\n(Close browser before using)",
-            font=ctk.CTkFont(size=11),
-            text_color=COLORS["text_muted"],
-            justify="left"
-        ).pack(anchor="w", padx=16, pady=(0, 10))
+            "Extract notes using your browser's Google login\n(Close browser before using)",
+            11,
+            "text_muted",
+            justify="left",
+            anchor="w", padx=16, pady=(0, 10)
+        )
 
         browser_btn = ctk.CTkButton(
             browser_frame,
             text="Import from Browser",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             height=40,
             fg_color=COLORS["bg_light"],
             hover_color=COLORS["bg_hover"],
@@ -450,19 +483,22 @@ class SettingsDialog(ctk.CTkToplevel):
         legacy_frame = ctk.CTkFrame(scroll, fg_color=COLORS["bg_medium"], corner_radius=12)
         legacy_frame.pack(fill="x", pady=(0, 15))
 
-        ctk.CTkLabel(
+        _static_label(
             legacy_frame,
-            text="🔑 API Token Method",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=COLORS["text_muted"]
-        ).pack(anchor="w", padx=16, pady=(16, 4))
+            "🔑 API Token Method",
+            14,
+            "text_muted",
+            weight="bold",
+            anchor="w", padx=16, pady=(16, 4)
+        )
 
-        ctk.CTkLabel(
+        _static_label(
             legacy_frame,
-            text="⚠️ Often blocked by Google - use Takeout instead",
-            font=ctk.CTkFont(size=11),
-            text_color=COLORS["accent_yellow"]
-        ).pack(anchor="w", padx=16, pady=(0, 16))
+            "⚠️ Often blocked by Google - use Takeout instead",
+            11,
+            "accent_yellow",
+            anchor="w", padx=16, pady=(0, 16)
+        )
 
     def _build_data_tab(self):
         """Build the Data Management tab"""
@@ -472,40 +508,25 @@ class SettingsDialog(ctk.CTkToplevel):
         scroll.pack(fill="both", expand=True)
 
         # Header
-        ctk.CTkLabel(
-            scroll,
-            text="Data Management",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=COLORS["text_primary"]
-        ).pack(anchor="w", pady=(10, 15))
+        _static_label(scroll, "Data Management", 20, "text_primary", weight="bold", anchor="w", pady=(10, 15))
 
         # Theme
         theme_frame = ctk.CTkFrame(scroll, fg_color=COLORS["bg_medium"], corner_radius=12)
         theme_frame.pack(fill="x", pady=(0, 15))
 
-        ctk.CTkLabel(
-            theme_frame,
-            text="Appearance",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=COLORS["text_primary"]
-        ).pack(anchor="w", padx=16, pady=(16, 8))
+        _static_label(theme_frame, "Appearance", 16, "text_primary", weight="bold", anchor="w", padx=16, pady=(16, 8))
 
         self.theme_var = ctk.StringVar(value=self.db.get_setting("theme", "dark"))
         theme_row = ctk.CTkFrame(theme_frame, fg_color="transparent")
         theme_row.pack(fill="x", padx=16, pady=(0, 16))
 
-        ctk.CTkLabel(
-            theme_row,
-            text="Theme:",
-            font=ctk.CTkFont(size=13),
-            text_color=COLORS["text_secondary"]
-        ).pack(side="left")
+        _static_label(theme_row, "Theme:", 13, "text_secondary", side="left")
 
         theme_menu = ctk.CTkOptionMenu(
             theme_row,
             values=["Dark (Catppuccin Mocha)", "Light (Catppuccin Latte)"],
             variable=self.theme_var,
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             fg_color=COLORS["bg_light"],
             button_color=COLORS["bg_hover"],
             button_hover_color=COLORS["accent_blue"],
@@ -523,12 +544,14 @@ class SettingsDialog(ctk.CTkToplevel):
         data_frame = ctk.CTkFrame(scroll, fg_color=COLORS["bg_medium"], corner_radius=12)
         data_frame.pack(fill="x", pady=(0, 15))
 
-        ctk.CTkLabel(
+        _static_label(
             data_frame,
-            text="Export & Import",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=COLORS["text_primary"]
-        ).pack(anchor="w", padx=16, pady=(16, 10))
+            "Export & Import",
+            16,
+            "text_primary",
+            weight="bold",
+            anchor="w", padx=16, pady=(16, 10)
+        )
 
         btn_frame = ctk.CTkFrame(data_frame, fg_color="transparent")
         btn_frame.pack(fill="x", padx=16, pady=(0, 16))
@@ -536,7 +559,7 @@ class SettingsDialog(ctk.CTkToplevel):
         export_btn = ctk.CTkButton(
             btn_frame,
             text="Export Notes",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             height=40,
             fg_color=COLORS["bg_light"],
             hover_color=COLORS["bg_hover"],
@@ -548,7 +571,7 @@ class SettingsDialog(ctk.CTkToplevel):
         import_btn = ctk.CTkButton(
             btn_frame,
             text="Import JSON",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             height=40,
             fg_color=COLORS["bg_light"],
             hover_color=COLORS["bg_hover"],
@@ -563,7 +586,7 @@ class SettingsDialog(ctk.CTkToplevel):
         vault_export_btn = ctk.CTkButton(
             export_row2,
             text="Export Markdown Vault",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             height=40,
             fg_color=COLORS["accent_blue"],
             hover_color=COLORS["accent_blue_hover"],
@@ -575,7 +598,7 @@ class SettingsDialog(ctk.CTkToplevel):
         pdf_export_btn = ctk.CTkButton(
             export_row2,
             text="Export PDF Book",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             height=40,
             fg_color=COLORS["accent_blue"],
             hover_color=COLORS["accent_blue_hover"],
@@ -599,7 +622,7 @@ class SettingsDialog(ctk.CTkToplevel):
                 "OneNote HTML Folder",
             ],
             variable=self.external_source_var,
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             fg_color=COLORS["bg_light"],
             button_color=COLORS["bg_hover"],
             button_hover_color=COLORS["accent_blue"],
@@ -613,7 +636,7 @@ class SettingsDialog(ctk.CTkToplevel):
         external_btn = ctk.CTkButton(
             source_frame,
             text="Import Source",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             height=36,
             fg_color=COLORS["accent_blue"],
             hover_color=COLORS["accent_blue_hover"],
@@ -626,7 +649,7 @@ class SettingsDialog(ctk.CTkToplevel):
             clip_btn = ctk.CTkButton(
                 data_frame,
                 text="Import from Clipboard History",
-                font=ctk.CTkFont(size=13),
+                font=ui_font(size=13),
                 height=40,
                 fg_color=COLORS["bg_light"],
                 hover_color=COLORS["bg_hover"],
@@ -638,12 +661,12 @@ class SettingsDialog(ctk.CTkToplevel):
         watcher_frame = ctk.CTkFrame(data_frame, fg_color=COLORS["bg_dark"], corner_radius=8)
         watcher_frame.pack(fill="x", padx=16, pady=(0, 16))
 
-        self.takeout_watch_enabled_var = ctk.BooleanVar(value=False)
+        self.takeout_watch_enabled_var = ctk.BooleanVar(value=self.db.get_setting("takeout_watch_enabled", False))
         watcher_check = ctk.CTkCheckBox(
             watcher_frame,
             text="Auto-import Google Takeout drops",
             variable=self.takeout_watch_enabled_var,
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             text_color=COLORS["text_secondary"],
             fg_color=COLORS["accent_green"],
             hover_color=COLORS["accent_green_hover"],
@@ -657,18 +680,19 @@ class SettingsDialog(ctk.CTkToplevel):
         self.takeout_watch_entry = ctk.CTkEntry(
             watcher_inputs,
             placeholder_text="Watched folder",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             height=32,
             fg_color=COLORS["bg_medium"],
             border_color=COLORS["border"]
         )
+        self.takeout_watch_entry.insert(0, self.db.get_setting("takeout_watch_folder", ""))
         self.takeout_watch_entry.pack(side="left", fill="x", expand=True, padx=(0, 8))
         self.takeout_watch_entry.bind("<FocusOut>", lambda _event: self._save_takeout_watch_settings())
 
         browse_watch_btn = ctk.CTkButton(
             watcher_inputs,
             text="Browse",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             width=74,
             height=32,
             fg_color=COLORS["bg_light"],
@@ -681,19 +705,22 @@ class SettingsDialog(ctk.CTkToplevel):
         backup_frame = ctk.CTkFrame(data_frame, fg_color=COLORS["bg_dark"], corner_radius=8)
         backup_frame.pack(fill="x", padx=16, pady=(0, 16))
 
-        ctk.CTkLabel(
+        _static_label(
             backup_frame,
-            text="Local Backups",
-            font=ctk.CTkFont(size=13, weight="bold"),
-            text_color=COLORS["text_primary"]
-        ).pack(anchor="w", padx=12, pady=(12, 4))
+            "Local Backups",
+            13,
+            "text_primary",
+            weight="bold",
+            anchor="w", padx=12, pady=(12, 4)
+        )
 
-        ctk.CTkLabel(
+        _static_label(
             backup_frame,
-            text="Backups include the SQLite database and local attachments.",
-            font=ctk.CTkFont(size=11),
-            text_color=COLORS["text_muted"]
-        ).pack(anchor="w", padx=12, pady=(0, 10))
+            "Backups include the SQLite database and local attachments.",
+            11,
+            "text_muted",
+            anchor="w", padx=12, pady=(0, 10)
+        )
 
         backup_buttons = ctk.CTkFrame(backup_frame, fg_color="transparent")
         backup_buttons.pack(fill="x", padx=12, pady=(0, 12))
@@ -701,7 +728,7 @@ class SettingsDialog(ctk.CTkToplevel):
         ctk.CTkButton(
             backup_buttons,
             text="Create Backup",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             height=34,
             fg_color=COLORS["bg_light"],
             hover_color=COLORS["bg_hover"],
@@ -712,7 +739,7 @@ class SettingsDialog(ctk.CTkToplevel):
         ctk.CTkButton(
             backup_buttons,
             text="Restore Backup",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             height=34,
             fg_color=COLORS["accent_yellow"],
             hover_color=COLORS["bg_hover"],
@@ -723,19 +750,22 @@ class SettingsDialog(ctk.CTkToplevel):
         enc_frame = ctk.CTkFrame(data_frame, fg_color=COLORS["bg_dark"], corner_radius=8)
         enc_frame.pack(fill="x", padx=16, pady=(0, 16))
 
-        ctk.CTkLabel(
+        _static_label(
             enc_frame,
-            text="Encrypted Backup",
-            font=ctk.CTkFont(size=13, weight="bold"),
-            text_color=COLORS["text_primary"]
-        ).pack(anchor="w", padx=12, pady=(12, 4))
+            "Encrypted Backup",
+            13,
+            "text_primary",
+            weight="bold",
+            anchor="w", padx=12, pady=(12, 4)
+        )
 
-        ctk.CTkLabel(
+        _static_label(
             enc_frame,
-            text="AES-256-GCM encrypted SQLite dump with a password.",
-            font=ctk.CTkFont(size=11),
-            text_color=COLORS["text_muted"]
-        ).pack(anchor="w", padx=12, pady=(0, 10))
+            "AES-256-GCM encrypted SQLite dump with a password.",
+            11,
+            "text_muted",
+            anchor="w", padx=12, pady=(0, 10)
+        )
 
         enc_buttons = ctk.CTkFrame(enc_frame, fg_color="transparent")
         enc_buttons.pack(fill="x", padx=12, pady=(0, 12))
@@ -743,7 +773,7 @@ class SettingsDialog(ctk.CTkToplevel):
         ctk.CTkButton(
             enc_buttons,
             text="Create Encrypted Backup",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             height=34,
             fg_color=COLORS["accent_green"],
             hover_color=COLORS["accent_green_hover"],
@@ -754,7 +784,7 @@ class SettingsDialog(ctk.CTkToplevel):
         ctk.CTkButton(
             enc_buttons,
             text="Restore Encrypted",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             height=34,
             fg_color=COLORS["accent_yellow"],
             hover_color=COLORS["bg_hover"],
@@ -765,7 +795,7 @@ class SettingsDialog(ctk.CTkToplevel):
         ctk.CTkButton(
             data_frame,
             text="Open Diagnostics",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             height=36,
             fg_color=COLORS["bg_light"],
             hover_color=COLORS["bg_hover"],
@@ -777,18 +807,20 @@ class SettingsDialog(ctk.CTkToplevel):
         info_frame = ctk.CTkFrame(scroll, fg_color=COLORS["bg_medium"], corner_radius=12)
         info_frame.pack(fill="x", pady=(0, 15))
 
-        ctk.CTkLabel(
+        _static_label(
             info_frame,
-            text="Database Location",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=COLORS["text_primary"]
-        ).pack(anchor="w", padx=16, pady=(16, 8))
+            "Database Location",
+            16,
+            "text_primary",
+            weight="bold",
+            anchor="w", padx=16, pady=(16, 8)
+        )
 
         db_path = str(Path(self.db.db_path))
         ctk.CTkLabel(
             info_frame,
             text=db_path,
-            font=ctk.CTkFont(size=11, family="Consolas"),
+            font=ui_font(size=11, family=MONO_FAMILY),
             text_color=COLORS["text_muted"]
         ).pack(anchor="w", padx=16, pady=(0, 16))
 
@@ -797,65 +829,93 @@ class SettingsDialog(ctk.CTkToplevel):
             warning_frame = ctk.CTkFrame(scroll, fg_color=COLORS["bg_medium"], corner_radius=12)
             warning_frame.pack(fill="x", pady=(0, 15))
 
-            ctk.CTkLabel(
+            _static_label(
                 warning_frame,
-                text="ℹ️ gkeepapi not installed",
-                font=ctk.CTkFont(size=14),
-                text_color=COLORS["text_muted"]
-            ).pack(anchor="w", padx=16, pady=(12, 4))
+                "ℹ️ gkeepapi not installed",
+                14,
+                "text_muted",
+                anchor="w", padx=16, pady=(12, 4)
+            )
 
-            ctk.CTkLabel(
+            _static_label(
                 warning_frame,
-                text="Google Keep API sync disabled. Use Takeout import instead.",
-                font=ctk.CTkFont(size=11),
-                text_color=COLORS["text_muted"]
-            ).pack(anchor="w", padx=16, pady=(0, 12))
+                "Google Keep API sync disabled. Use Takeout import instead.",
+                11,
+                "text_muted",
+                anchor="w", padx=16, pady=(0, 12)
+            )
 
     def _load_settings(self):
         """Load saved settings"""
-        # Load cloud sync settings
-        auto_sync = self.db.get_setting("cloud_auto_sync", True)
-        self.cloud_autosync_var.set(auto_sync)
-
-        interval = self.db.get_setting("cloud_sync_interval", 15)
-        self.cloud_sync_interval.delete(0, "end")
-        self.cloud_sync_interval.insert(0, str(interval))
+        # Load cloud sync settings; the freshly built widgets are empty, so each gets one write
+        settings = self.db.get_settings_many({
+            "cloud_auto_sync": True,
+            "cloud_sync_interval": 15,
+            "github_repo": "",
+        })
+        auto_sync = settings["cloud_auto_sync"]
+        if auto_sync is not True:
+            self.cloud_autosync_var.set(auto_sync)
+
+        self.cloud_sync_interval.insert(0, str(settings["cloud_sync_interval"]))
 
         # Load GitHub repo name if saved
-        github_repo = self.db.get_setting("github_repo", "")
+        github_repo = settings["github_repo"]
         if github_repo:
             self.github_repo_entry.insert(0, github_repo)
 
-        self.takeout_watch_enabled_var.set(self.db.get_setting("takeout_watch_enabled", False))
-        self.takeout_watch_entry.delete(0, "end")
-        self.takeout_watch_entry.insert(0, self.db.get_setting("takeout_watch_folder", ""))
-
         # Update cloud status
         self._update_cloud_status()
 
     def _update_cloud_status(self):
         """Update the cloud connection status display"""
-        if self.cloud_sync and self.cloud_sync.is_connected():
+        # Read all provider state first, then write only what changed
+        connected = bool(self.cloud_sync and self.cloud_sync.is_connected())
+        if connected:
             status = self.cloud_sync.get_status()
             provider = status.get("provider", "Unknown")
             last_sync = status.get("last_sync")
 
             if last_sync:
-                sync_time = datetime.fromisoformat(last_sync).strftime("%Y-%m-%d %H:%M")
+                # isoformat() text already starts with "YYYY-MM-DDTHH:MM", so slicing matches strftime
+                if len(last_sync) >= 16:
+                    sync_time = last_sync[:16].replace("T", " ")
+                else:
+                    sync_time = datetime.fromisoformat(last_sync).strftime("%Y-%m-%d %H:%M")
                 status_text = f"✓ Connected to {provider}\nLast sync: {sync_time}"
             else:
                 status_text = f"✓ Connected to {provider}"
-
-            self.cloud_status_label.configure(
-                text=status_text,
-                text_color=COLORS["accent_green"]
-            )
-            self.cloud_disconnect_btn.pack(fill="x", pady=(0, 15))
+            display = (status_text, COLORS["accent_green"])
         else:
-            self.cloud_status_label.configure(
-                text="Not connected to any cloud service",
-                text_color=COLORS["text_muted"]
+            display = ("Not connected to any cloud service", COLORS["text_muted"])
+
+        if display != self._cloud_status_display:
+            self._cloud_status_display = display
+            self.cloud_status_label.configure(text=display[0], text_color=display[1])
+        self._show_cloud_disconnect(connected)
+
+    def _show_cloud_disconnect(self, visible: bool):
+        """Pack or forget the disconnect button only when its visibility actually flips."""
+        if visible == self._cloud_disconnect_visible:
+            return
+        self._cloud_disconnect_visible = visible
+        if not visible:
+            self.cloud_disconnect_btn.pack_forget()
+            return
+        if self.cloud_disconnect_btn is None:
+            self.cloud_disconnect_btn = ctk.CTkButton(
+                self.cloud_scroll,
+                text="Disconnect from Cloud",
+                font=ui_font(size=13),
+                height=40,
+                fg_color="transparent",
+                hover_color=COLORS["bg_hover"],
+                text_color=COLORS["accent_red"],
+                border_width=1,
+                border_color=COLORS["accent_red"],
+                command=self._disconnect_cloud
             )
+        self.cloud_disconnect_btn.pack(fill="x", pady=(0, 15))
 
     def _connect_github(self):
         """Connect to GitHub"""
@@ -871,20 +931,28 @@ class SettingsDialog(ctk.CTkToplevel):
             self.github_repo_entry.insert(0, repo)
 
         self.github_connect_btn.configure(state="disabled", text="Connecting...")
-        self.update()
 
-        success, message = self.cloud_sync.connect_github(token, repo)
+        def worker():
+            success, message = self.cloud_sync.connect_github(token, repo)
+            self._on_ui_thread(self._on_github_connected, success, message)
+
+        threading.Thread(target=worker, daemon=True).start()
 
+    def _on_ui_thread(self, fn: Callable, *args, **kwargs):
+        """Call fn now on the Tk thread, or queue it on the Tk event loop from a worker thread."""
+        if threading.current_thread() is threading.main_thread():
+            fn(*args, **kwargs)
+        else:
+            self.after(0, lambda: fn(*args, **kwargs))
+
+    def _on_github_connected(self, success: bool, message: str):
         self.github_connect_btn.configure(state="normal", text="Connect to GitHub")
 
         if success:
             self._update_cloud_status()
             self._save_autosync_settings()
             messagebox.showinfo("Success", f"{message}\n\nYour notes will now sync to GitHub.")
-
-            # Do initial sync
-            if messagebox.askyesno("Initial Sync", "Would you like to sync your notes now?"):
-                self.cloud_sync.sync()
+            self._offer_initial_cloud_sync()
         else:
             messagebox.showerror("Connection Failed", message)
 
@@ -895,22 +963,29 @@ class SettingsDialog(ctk.CTkToplevel):
             return
 
         self.gdrive_connect_btn.configure(state="disabled", text="Connecting...")
-        self.update()
 
-        success, message = self.cloud_sync.connect_gdrive()
+        def worker():
+            success, message = self.cloud_sync.connect_gdrive()
+            self._on_ui_thread(self._on_gdrive_connected, success, message)
+
+        threading.Thread(target=worker, daemon=True).start()
 
+    def _on_gdrive_connected(self, success: bool, message: str):
         self.gdrive_connect_btn.configure(state="normal", text="Connect to Google Drive")
 
         if success:
             self._update_cloud_status()
             self._save_autosync_settings()
             messagebox.showinfo("Success", message)
-
-            if messagebox.askyesno("Initial Sync", "Would you like to sync your notes now?"):
-                self.cloud_sync.sync()
+            self._offer_initial_cloud_sync()
         else:
             messagebox.showerror("Connection Failed", message)
 
+    def _offer_initial_cloud_sync(self):
+        """Ask to run the first cloud sync right away, off the UI thread."""
+        if messagebox.askyesno("Initial Sync", "Would you like to sync your notes now?"):
+            threading.Thread(target=self.cloud_sync.sync, daemon=True).start()
+
     def _disconnect_cloud(self):
         """Disconnect from cloud provider"""
         if not self.cloud_sync:
@@ -921,13 +996,26 @@ class SettingsDialog(ctk.CTkToplevel):
             self._update_cloud_status()
 
     def _save_autosync_settings(self):
-        """Save auto-sync settings"""
-        self.db.set_setting("cloud_auto_sync", self.cloud_autosync_var.get())
+        """Save auto-sync settings once they stop changing"""
+        if self._autosync_save_after_id:
+            self.after_cancel(self._autosync_save_after_id)
+        self._autosync_save_after_id = self.after(self.AUTOSYNC_SAVE_DELAY_MS, self._save_autosync_settings_now)
+
+    def _save_autosync_settings_now(self):
+        self._autosync_save_after_id = None
+        settings = {"cloud_auto_sync": self.cloud_autosync_var.get()}
         try:
-            interval = int(self.cloud_sync_interval.get())
-            self.db.set_setting("cloud_sync_interval", interval)
+            settings["cloud_sync_interval"] = int(self.cloud_sync_interval.get())
         except ValueError:
             pass
+        self.db.set_settings_many(settings)
+
+    def destroy(self):
+        # A save still waiting on its delay would be dropped with the dialog
+        if self._autosync_save_after_id:
+            self.after_cancel(self._autosync_save_after_id)
+            self._save_autosync_settings_now()
+        super().destroy()
 
     def _select_takeout_watch_folder(self):
         folder = filedialog.askdirectory(title="Select Takeout watch folder")
@@ -983,11 +1071,12 @@ class SettingsDialog(ctk.CTkToplevel):
             try:
                 items = fetch_clipboard_text_items(max_items=50)
                 if not items:
-                    self.after(0, lambda: messagebox.showinfo(
+                    self._on_ui_thread(
+                        messagebox.showinfo,
                         "Clipboard History",
                         "No text items found in clipboard history.\n\n"
                         "Make sure clipboard history is enabled in Windows settings.",
-                    ))
+                    )
                     return
                 notes = clipboard_items_to_notes(items)
                 LocalBackupManager(self.db, self.app_name, self.app_version).create_backup("before clipboard import")
@@ -995,13 +1084,14 @@ class SettingsDialog(ctk.CTkToplevel):
                 for note in notes:
                     if self.db.save_imported_note(note, conflict_policy="skip") in IMPORT_SUCCESS_STATUSES:
                         imported += 1
-                self.after(0, lambda: messagebox.showinfo(
+                self._on_ui_thread(
+                    messagebox.showinfo,
                     "Clipboard Import Complete",
                     f"Imported {imported} of {len(items)} clipboard entries as notes.",
-                ))
+                )
             except Exception as e:
                 log_diagnostic_exception("clipboard import", e)
-                self.after(0, lambda message=str(e): messagebox.showerror("Clipboard Import Failed", message))
+                self._on_ui_thread(messagebox.showerror, "Clipboard Import Failed", str(e))
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -1032,10 +1122,10 @@ class SettingsDialog(ctk.CTkToplevel):
                     f"Size: {result.size_bytes:,} bytes\n\n"
                     f"Keep your password safe — the backup cannot be recovered without it."
                 )
-                self.after(0, lambda: messagebox.showinfo("Encrypted Backup Created", message))
+                self._on_ui_thread(messagebox.showinfo, "Encrypted Backup Created", message)
             except Exception as e:
                 log_diagnostic_exception("encrypted backup create", e)
-                self.after(0, lambda message=str(e): messagebox.showerror("Encrypted Backup Failed", message))
+                self._on_ui_thread(messagebox.showerror, "Encrypted Backup Failed", str(e))
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -1062,12 +1152,12 @@ class SettingsDialog(ctk.CTkToplevel):
         def worker():
             try:
                 count = restore_encrypted_backup(Path(selected), password, self.db.db_path)
-                self.after(0, lambda: self._on_encrypted_restore_complete(selected, count))
+                self._on_ui_thread(self._on_encrypted_restore_complete, selected, count)
             except ValueError as e:
-                self.after(0, lambda message=str(e): messagebox.showerror("Restore Failed", message))
+                self._on_ui_thread(messagebox.showerror, "Restore Failed", str(e))
             except Exception as e:
                 log_diagnostic_exception("encrypted backup restore", e)
-                self.after(0, lambda message=str(e): messagebox.showerror("Restore Failed", message))
+                self._on_ui_thread(messagebox.showerror, "Restore Failed", str(e))
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -1099,33 +1189,10 @@ class SettingsDialog(ctk.CTkToplevel):
 
     def _show_gdrive_instructions(self):
         """Show Google Drive setup instructions"""
-        credentials_path = get_google_drive_credentials_path()
-        instructions = f"""Google Drive Setup Instructions
-
-1. Go to console.cloud.google.com
-
-2. Create a new project (or select existing)
-
-3. Enable the Google Drive API:
-   - Go to "APIs & Services" → "Library"
-   - Search for "Google Drive API"
-   - Click "Enable"
-
-4. Create OAuth credentials:
-   - Go to "APIs & Services" → "Credentials"
-   - Click "Create Credentials" → "OAuth client ID"
-   - Select "Desktop app"
-   - Download the JSON file
-
-5. Save the JSON file as:
-   {credentials_path}
-
-6. Click "Connect to Google Drive" again
-
-The first time you connect, a browser window will open
-for you to authorize the app."""
-
-        messagebox.showinfo("Google Drive Setup", instructions)
+        messagebox.showinfo(
+            "Google Drive Setup",
+            _GDRIVE_INSTRUCTIONS.format(credentials_path=get_google_drive_credentials_path())
+        )
 
     def _connect_keep(self):
         """Connect to Google Keep (legacy)"""
@@ -1147,8 +1214,60 @@ for you to authorize the app."""
         """Open master token generator"""
         TokenGeneratorDialog(self, "")
 
-    def _save_imported_note(self, note: Note) -> bool:
-        return self._save_imported_note_status(note) in IMPORT_SUCCESS_STATUSES
+    def _save_imported_notes(self, notes: List[Optional[Note]], known_labels: Optional[set] = None) -> int:
+        """Save a batch of imported notes and return how many were imported.
+
+        known_labels carries label names already in the database across batches of one import.
+        """
+        statuses = self._save_imported_note_statuses(notes, known_labels)
+        return sum(status in IMPORT_SUCCESS_STATUSES for status in statuses)
+
+    def _save_imported_note_statuses(
+        self, notes: List[Optional[Note]], known_labels: Optional[set] = None
+    ) -> List[str]:
+        """Save notes that cannot conflict in one transaction; the rest go through the conflict dialog.
+
+        Returns one import status per note, in the order given.
+        """
+        statuses, contested = self._save_uncontested_imported_notes(notes, known_labels)
+        for index in contested:
+            statuses[index] = self._save_imported_note_status(notes[index])
+        return statuses
+
+    def _save_uncontested_imported_notes(
+        self, notes: List[Optional[Note]], known_labels: Optional[set] = None
+    ) -> Tuple[List[Optional[str]], List[int]]:
+        """Bulk-save the notes that cannot conflict; safe off the UI thread.
+
+        Returns the statuses so far, with None for each contested note, and the contested indexes.
+        """
+        statuses: List[Optional[str]] = [None] * len(notes)
+        clean, contested, titles = [], [], set()
+        for index, note in enumerate(notes):
+            if not note:
+                statuses[index] = "failed"
+                continue
+            title = (note.title or "").strip().lower()
+            # A title repeated within the file would conflict with its own earlier copy
+            if (title and title in titles) or self.db.find_import_conflict(note):
+                contested.append(index)
+            else:
+                clean.append(index)
+            if title:
+                titles.add(title)
+
+        if clean:
+            clean_notes = [notes[index] for index in clean]
+            saved = self.db.save_notes(clean_notes)
+            if saved:
+                labels = {label for note in clean_notes for label in note.labels}
+                if known_labels is not None:
+                    labels -= known_labels
+                if labels and self.db.ensure_labels(labels) and known_labels is not None:
+                    known_labels |= labels
+            for index in clean:
+                statuses[index] = "imported" if saved else "failed"
+        return statuses, contested
 
     def _save_imported_note_status(self, note: Note) -> str:
         if not note:
@@ -1181,16 +1300,20 @@ for you to authorize the app."""
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
         if filepath:
-            notes = self.db.get_all_notes(include_trashed=True, include_archived=True)
-            data = {
-                "version": self.db_version,
-                "exported_at": datetime.now(timezone.utc).isoformat(),
-                "notes": [note.to_dict() for note in notes],
-                "labels": [label.to_dict() for label in self.db.get_all_labels()]
-            }
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=2)
-            messagebox.showinfo("Export Complete", f"Exported {len(notes)} notes to {filepath}")
+            with open(filepath, "wb", buffering=self.EXPORT_BUFFER_SIZE) as f:
+                count = self._write_json_export(f)
+            messagebox.showinfo("Export Complete", f"Exported {count} notes to {filepath}")
+
+    def _write_json_export(self, f: BinaryIO) -> int:
+        """Stream the export document one note per line, so no list of every note dict is built."""
+        header = {"version": self.db_version, "exported_at": datetime.now(timezone.utc).isoformat()}
+        f.write(json_dumps_bytes(header)[:-1] + b',"notes":[')
+        count = 0
+        for note in self.db.iter_all_notes(include_trashed=True, include_archived=True):
+            f.write((b",\n" if count else b"\n") + json_dumps_bytes(note.to_dict()))
+            count += 1
+        f.write(b'\n],"labels":' + json_dumps_bytes([label.to_dict() for label in self.db.get_all_labels()]) + b"}\n")
+        return count
 
     def _export_markdown_vault(self):
         """Export all notes as an Obsidian-compatible Markdown vault."""
@@ -1209,10 +1332,10 @@ for you to authorize the app."""
                 )
                 if result.attachments_missing:
                     message += f"\nMissing attachments skipped: {result.attachments_missing}"
-                self.after(0, lambda: messagebox.showinfo("Markdown Export Complete", message))
+                self._on_ui_thread(messagebox.showinfo, "Markdown Export Complete", message)
             except Exception as e:
                 log_diagnostic_exception("markdown vault export", e)
-                self.after(0, lambda message=str(e): messagebox.showerror("Markdown Export Failed", message))
+                self._on_ui_thread(messagebox.showerror, "Markdown Export Failed", str(e))
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -1232,10 +1355,10 @@ for you to authorize the app."""
                 notes = self.db.get_all_notes(include_trashed=False, include_archived=True)
                 result = export_pdf_book(notes, output_path, title=self.app_name)
                 message = f"Exported {result.notes_exported} notes ({result.pages} pages) to:\n{result.output_path}"
-                self.after(0, lambda: messagebox.showinfo("PDF Export Complete", message))
+                self._on_ui_thread(messagebox.showinfo, "PDF Export Complete", message)
             except Exception as e:
                 log_diagnostic_exception("pdf book export", e)
-                self.after(0, lambda message=str(e): messagebox.showerror("PDF Export Failed", message))
+                self._on_ui_thread(messagebox.showerror, "PDF Export Failed", str(e))
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -1249,14 +1372,16 @@ for you to authorize the app."""
         progress_dialog = ImportProgressDialog(self, title)
 
         def progress(message: str, current: int, total: int):
-            self.after(0, lambda: progress_dialog.set_progress(message, current, total))
+            self._on_ui_thread(progress_dialog.set_progress, message, current, total)
 
-        def complete(notes: List[Note]):
+        def complete(notes: List[Note], statuses: List[Optional[str]], contested: List[int]):
             progress_dialog.destroy()
             if not notes:
                 messagebox.showerror("No Notes Found", empty_message)
                 return
-            statuses = [self._save_imported_note_status(note) for note in notes]
+            # Conflicts ask the user, so only they are resolved here on the UI thread
+            for index in contested:
+                statuses[index] = self._save_imported_note_status(notes[index])
             self._show_import_summary(source_name, notes, statuses)
 
         def failed(message: str):
@@ -1276,12 +1401,16 @@ for you to authorize the app."""
                     cancel_check=progress_dialog.is_cancelled,
                 )
                 notes = import_func(importer)
-                self.after(0, lambda: complete(notes))
+                statuses, contested = [], []
+                if notes:
+                    progress(f"Saving {len(notes)} notes", len(notes), len(notes))
+                    statuses, contested = self._save_uncontested_imported_notes(notes)
+                self._on_ui_thread(complete, notes, statuses, contested)
             except ImportCancelled:
-                self.after(0, cancelled)
+                self._on_ui_thread(cancelled)
             except Exception as e:
                 log_diagnostic_exception(f"{source_name} import", e)
-                self.after(0, lambda message=str(e): failed(message))
+                self._on_ui_thread(failed, str(e))
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -1326,92 +1455,106 @@ for you to authorize the app."""
         )
         if filepath:
             try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                LocalBackupManager(self.db, self.app_name, self.app_version).create_backup("before json import")
-                imported = 0
-
-                # Check if this is a Google Takeout export
-                if isinstance(data, dict) and "textContent" in data:
-                    # Single Google Keep note from Takeout
-                    note = self._parse_takeout_note(data, Path(filepath).parent)
-                    if self._save_imported_note(note):
-                        imported = 1
-                elif isinstance(data, list):
-                    # Multiple notes or Takeout folder
-                    for item in data:
-                        if isinstance(item, dict):
-                            if "textContent" in item or "title" in item:
-                                # Takeout format
-                                note = self._parse_takeout_note(item, Path(filepath).parent)
-                            else:
-                                # Our export format
-                                note = Note.from_dict(item)
-
-                            if note:
-                                note.id = str(uuid.uuid4())
-                                note.keep_id = None
-                                note.sync_status = SyncStatus.LOCAL_ONLY
-                                if self._save_imported_note(note):
-                                    imported += 1
-                elif isinstance(data, dict) and "notes" in data:
-                    # Our export format
-                    for note_data in data.get("notes", []):
-                        note = Note.from_dict(note_data)
-                        note.id = str(uuid.uuid4())
-                        note.keep_id = None
-                        note.sync_status = SyncStatus.LOCAL_ONLY
-                        if self._save_imported_note(note):
-                            imported += 1
-
-                messagebox.showinfo("Import Complete", f"Imported {imported} notes")
+                with open(filepath, "rb") as f:
+                    LocalBackupManager(self.db, self.app_name, self.app_version).create_backup("before json import")
+                    imported = skipped = 0
+                    batch = []
+                    known_labels = {label.name for label in self.db.get_all_labels()}
+                    for note in self._iter_json_import_notes(f, Path(filepath).parent):
+                        # A malformed item is skipped rather than failing the whole file
+                        if note is None:
+                            skipped += 1
+                            continue
+                        batch.append(note)
+                        if len(batch) >= self.IMPORT_BATCH_SIZE:
+                            imported += self._save_imported_notes(batch, known_labels)
+                            batch = []
+                    imported += self._save_imported_notes(batch, known_labels)
+
+                message = f"Imported {imported} notes"
+                if skipped:
+                    message += f"\nSkipped {skipped} that could not be read"
+                messagebox.showinfo("Import Complete", message)
             except Exception as e:
                 log_diagnostic_exception("JSON import", e)
                 messagebox.showerror("Import Failed", str(e))
 
-    def _parse_takeout_note(self, data: dict, base_path: Optional[Path] = None) -> Optional[Note]:
-        """Parse a Google Takeout Keep note format"""
+    def _iter_json_import_notes(self, f: BinaryIO, base_path: Path) -> Iterator[Optional[Note]]:
+        """Yield notes from a JSON import file; note arrays are streamed when ijson is installed."""
+        if peek_json_container(f) == "[":
+            # Multiple notes or Takeout folder; each item is parsed by its own shape
+            takeout_parse = None
+            for item in iter_json_items(f, "item"):
+                if not isinstance(item, dict):
+                    yield None
+                elif "textContent" in item or "listContent" in item:
+                    if takeout_parse is None:
+                        takeout_parse = self._takeout_note_parser(base_path)
+                    yield takeout_parse(item)
+                else:
+                    yield self._native_import_note(item)
+            return
+
+        # Our export format wraps its notes in {"notes": [...]}
+        found = False
+        for note_data in iter_json_items(f, "notes.item"):
+            found = True
+            yield self._native_import_note(note_data) if isinstance(note_data, dict) else None
+        if found:
+            return
+
+        # Otherwise a single Google Keep note from Takeout, small enough to load whole
+        f.seek(0)
+        data = json_loads(f.read())
+        if isinstance(data, dict) and "textContent" in data:
+            yield self._parse_takeout_note(data, base_path)
+
+    def _native_import_note(self, data: dict) -> Optional[Note]:
+        """Build an exported note as a new local-only note, unlinked from Keep; None if it is malformed."""
         try:
-            note_id = str(uuid.uuid4())
-            title = data.get("title", "")
-            content = data.get("textContent", "")
-
-            # Check for checklist
-            checklist_items = []
-            if "listContent" in data:
-                for item in data["listContent"]:
-                    checklist_items.append(ChecklistItem(
-                        text=item.get("text", ""),
-                        checked=item.get("isChecked", False)
-                    ))
-
-            # Parse labels
-            labels = []
-            if "labels" in data:
-                labels = [l.get("name", "") for l in data["labels"] if l.get("name")]
-
-            attachments_root = Path(self.db.db_path).parent / "attachments"
-            attachments = import_takeout_attachments(data, base_path, attachments_root, note_id)
-
-            return Note(
-                id=note_id,
-                title=title,
-                content=content,
-                note_type=NoteType.CHECKLIST if checklist_items else NoteType.NOTE,
-                checklist_items=checklist_items,
-                labels=labels,
-                attachments=attachments,
-                pinned=data.get("isPinned", False),
-                archived=data.get("isArchived", False),
-                trashed=data.get("isTrashed", False),
-                color=normalize_keep_color(data.get("color", "")),
-                shared_with=extract_shared_with(data),
-                sync_status=SyncStatus.LOCAL_ONLY,
-            )
+            return Note.from_dict(data, id=str(uuid.uuid4()), keep_id=None, sync_status=SyncStatus.LOCAL_ONLY)
         except Exception:
             return None
 
+    def _parse_takeout_note(self, data: dict, base_path: Optional[Path] = None) -> Optional[Note]:
+        """Parse a Google Takeout Keep note format"""
+        return self._takeout_note_parser(base_path)(data)
+
+    def _takeout_note_parser(self, base_path: Optional[Path]) -> Callable[[dict], Optional[Note]]:
+        """Build a Takeout note parser with its per-import lookups resolved once."""
+        attachments_root = Path(self.db.db_path).parent / "attachments"
+        checklist = NoteType.CHECKLIST
+        plain = NoteType.NOTE
+        local_only = SyncStatus.LOCAL_ONLY
+
+        def parse(data: dict) -> Optional[Note]:
+            try:
+                note_id = str(uuid.uuid4())
+                get = data.get
+                checklist_items = [
+                    ChecklistItem(text=item.get("text", ""), checked=item.get("isChecked", False))
+                    for item in get("listContent", ())
+                ]
+                return Note(
+                    id=note_id,
+                    title=get("title", ""),
+                    content=get("textContent", ""),
+                    note_type=checklist if checklist_items else plain,
+                    checklist_items=checklist_items,
+                    labels=[name for name in (label.get("name", "") for label in get("labels", ())) if name],
+                    attachments=import_takeout_attachments(data, base_path, attachments_root, note_id),
+                    pinned=get("isPinned", False),
+                    archived=get("isArchived", False),
+                    trashed=get("isTrashed", False),
+                    color=normalize_keep_color(get("color", "")),
+                    shared_with=extract_shared_with(data),
+                    sync_status=local_only,
+                )
+            except Exception:
+                return None
+
+        return parse
+
     def _import_from_browser(self):
         """Import notes using browser cookies"""
         if not self.web_scraper_factory:
@@ -1429,7 +1572,7 @@ for you to authorize the app."""
         status_label = ctk.CTkLabel(
             progress_dialog,
             text="Checking browser for Google cookies...",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             text_color=COLORS["text_primary"]
         )
         status_label.pack(pady=(40, 20))
@@ -1443,26 +1586,26 @@ for you to authorize the app."""
             scraper = self.web_scraper_factory()
 
             # Update status
-            self.after(0, lambda: status_label.configure(text="Authenticating via browser cookies..."))
+            self._on_ui_thread(status_label.configure, text="Authenticating via browser cookies...")
 
             success, message = scraper.authenticate_from_browser()
 
             if not success:
-                self.after(0, lambda: self._browser_import_failed(progress_dialog, message))
+                self._on_ui_thread(self._browser_import_failed, progress_dialog, message)
                 return
 
-            self.after(0, lambda: status_label.configure(text="Fetching notes from Google Keep..."))
+            self._on_ui_thread(status_label.configure, text="Fetching notes from Google Keep...")
 
             try:
                 LocalBackupManager(self.db, self.app_name, self.app_version).create_backup("before browser import")
             except Exception as e:
                 log_diagnostic_exception("browser import backup", e)
-                self.after(0, lambda message=str(e): self._browser_import_failed(progress_dialog, f"Backup failed before browser import: {message}"))
+                self._on_ui_thread(self._browser_import_failed, progress_dialog, f"Backup failed before browser import: {e}")
                 return
 
             imported, errors = scraper.import_notes_to_db(self.db)
 
-            self.after(0, lambda: self._browser_import_complete(progress_dialog, imported, errors, message))
+            self._on_ui_thread(self._browser_import_complete, progress_dialog, imported, errors, message)
 
         threading.Thread(target=do_import, daemon=True).start()
 
@@ -1479,7 +1622,7 @@ for you to authorize the app."""
         )
 
         if result:
-            TakeoutInstructionsDialog(self)
+            TakeoutInstructionsDialog.show(self)
 
     def _browser_import_complete(self, dialog, imported: int, errors: int, auth_message: str):
         """Handle browser import completion"""
@@ -1503,7 +1646,7 @@ for you to authorize the app."""
             )
 
             if result:
-                TakeoutInstructionsDialog(self)
+                TakeoutInstructionsDialog.show(self)
 
     def _import_takeout_folder(self):
         """Import all notes from a Google Takeout Keep folder"""
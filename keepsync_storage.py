@@ -1,18 +1,25 @@
 """SQLite storage for KeepSyncNotes notes, labels, settings, and sync logs."""
 
-import json
 import os
+import queue
 import re
 import sqlite3
+import threading
 import uuid
+from concurrent.futures import Future
+from dataclasses import replace
 from datetime import datetime, timezone
-from typing import Any, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from keepsync_json import json_dumps, json_loads
 from keepsync_models import (
+    CONTENT_HASH_VERSION,
     Attachment,
     ChecklistItem,
     Label,
     Note,
+    NoteSummary,
     NoteType,
     SyncStatus,
     normalize_keep_color,
@@ -21,21 +28,106 @@ from keepsync_models import (
 from keepsync_note_ops import merge_note_conflict, normalize_import_labels, notes_equivalent
 
 
+FTS_TOKENIZER = "porter unicode61"
+JSON_COLUMN_CACHE_SIZE = 4096
+
+# Plain dict lookups instead of Enum value validation for every loaded row.
+_NOTE_TYPES = {note_type.value: note_type for note_type in NoteType}
+_SYNC_STATUSES = {status.value: status for status in SyncStatus}
+
+
+@lru_cache(maxsize=JSON_COLUMN_CACHE_SIZE)
+def _parse_json_column(blob: Optional[str]) -> tuple:
+    """Decode a JSON list column; keyed by the text itself, so edited rows miss naturally."""
+    return tuple(json_loads(blob or "[]"))
+
+
 class DatabaseManager:
     """SQLite database manager for local note storage"""
+
+    # Columns compared by save_note to detect a no-op write; content_hash covers the note body.
+    NOTE_STATE_COLUMNS = (
+        "content_hash",
+        "keep_id",
+        "sync_status",
+        "local_modified",
+        "remote_modified",
+        "reminder_notified",
+        "created_at",
+    )
+
+    # NORMAL sync is durable under WAL; a 64 MB page cache and 256 MB mmap keep reads off disk.
+    CONNECTION_PRAGMAS = (
+        "synchronous=NORMAL",
+        "cache_size=-65536",
+        "temp_store=MEMORY",
+        "busy_timeout=10000",
+        "mmap_size=268435456",
+    )
+
+    # Prepared statements kept per connection: room for every fixed query plus the
+    # variable-length IN (...) statements built by get_notes_by_ids.
+    STATEMENT_CACHE_SIZE = 256
+
+    # Queued writes coalesced into one transaction (and one commit) by the writer thread.
+    WRITE_BATCH_SIZE = 64
+
+    # Ids bound per IN (...) query, under SQLite's historical 999-parameter limit.
+    ID_QUERY_CHUNK_SIZE = 900
+
+    # Characters of note body carried in a NoteSummary for list previews.
+    SUMMARY_SNIPPET_LENGTH = 200
+
+    # Cloud sync settings mapping note id -> content hash of the last synced version, and
+    # the GitHub blob cache mapping note id -> [blob sha, content hash]; both follow hash migrations.
+    CLOUD_BASE_SETTINGS = ("cloud_base_gdrive", "cloud_base_github")
+    CLOUD_BLOB_SETTINGS = ("github_note_blobs",)
+
+    # Column order of the tuples built by _note_row.
+    NOTE_ROW_COLUMNS = (
+        "id", "title", "content", "note_type", "checklist_items", "labels", "pinned", "archived",
+        "trashed", "color", "reminder_at", "reminder_location", "reminder_notified",
+        "shared_with", "attachments", "keep_id", "sync_status", "local_modified", "remote_modified",
+        "content_hash", "created_at", "updated_at",
+    )
+
+    # Update in place on conflict: unlike INSERT OR REPLACE this keeps the rowid and
+    # touches each index once instead of deleting and reinserting the row.
+    NOTE_UPSERT_SQL = (
+        f"INSERT INTO notes ({', '.join(NOTE_ROW_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in NOTE_ROW_COLUMNS)}) "
+        "ON CONFLICT(id) DO UPDATE SET "
+        + ", ".join(f"{column} = excluded.{column}" for column in NOTE_ROW_COLUMNS[1:])
+    )
     
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
         self._init_db()
+        # Stored (undecoded) setting values, loaded once; the settings writers below keep it current
+        self._settings: Dict[str, str] = {
+            row["key"]: row["value"] for row in self.conn.execute("SELECT key, value FROM settings")
+        }
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="keepsync-db-writer", daemon=True)
+        self._writer_thread.start()
     
     def _init_db(self):
         """Initialize database schema"""
         os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # Autocommit driver mode: transactions are opened explicitly with BEGIN IMMEDIATE, never implicitly per DML.
+        self.conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+        )
         self.conn.row_factory = sqlite3.Row
+        self._configure_connection()
         
         cursor = self.conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
         
         # Notes table
         cursor.execute("""
@@ -70,6 +162,8 @@ class DatabaseManager:
         self._ensure_column("notes", "reminder_notified", "INTEGER DEFAULT 0")
         self._ensure_column("notes", "shared_with", "TEXT DEFAULT '[]'")
         self._ensure_column("notes", "attachments", "TEXT DEFAULT '[]'")
+        cursor.execute("SELECT * FROM notes LIMIT 0")
+        self._note_columns = {column[0]: index for index, column in enumerate(cursor.description)}
         
         # Labels table
         cursor.execute("""
@@ -81,6 +175,17 @@ class DatabaseManager:
             )
         """)
         
+        # Note/label join table for indexed label lookups
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'note_labels'")
+        note_labels_missing = cursor.fetchone() is None
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS note_labels (
+                note_id TEXT NOT NULL,
+                label TEXT NOT NULL COLLATE NOCASE,
+                PRIMARY KEY (note_id, label)
+            )
+        """)
+        
         # Settings table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS settings (
@@ -102,24 +207,195 @@ class DatabaseManager:
         """)
         
         # Create indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_notes_keep_id ON notes(keep_id)")
+        # Covering index: get_sync_index reads it without touching note bodies
+        cursor.execute("DROP INDEX IF EXISTS idx_notes_keep_id")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_notes_keep_sync ON notes(keep_id, id, content_hash, remote_modified)"
+        )
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_notes_sync_status ON notes(sync_status)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_notes_pinned ON notes(pinned)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_notes_archived ON notes(archived)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_notes_trashed ON notes(trashed)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_notes_reminder_at ON notes(reminder_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_note_labels_label ON note_labels(label)")
+        if note_labels_missing:
+            self._rebuild_note_labels(cursor)
+
+        self._migrate_content_hashes(cursor)
 
         self.fts_available = self._init_fts(cursor)
-        if self.fts_available:
+        if self.fts_available and self._fts_needs_rebuild(cursor):
             self._rebuild_fts(cursor)
         
         self.conn.commit()
 
+    def _write(self, operation: Callable[[sqlite3.Cursor], Any]) -> Any:
+        """Run a write on the writer thread and wait for its commit; errors re-raise here."""
+        writer = self._writer_thread
+        if writer is not None and threading.current_thread() is writer:
+            return operation(self.conn.cursor())
+        if writer is None:
+            # No writer (during init or after close): commit inline.
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                result = operation(cursor)
+                self.conn.commit()
+                return result
+            except Exception:
+                self.conn.rollback()
+                raise
+        return self._submit_write(operation).result()
+
+    def _submit_write(self, operation: Callable[[sqlite3.Cursor], Any]) -> Future:
+        """Queue a write for the writer thread without waiting; inline cases return a settled Future."""
+        future: Future = Future()
+        writer = self._writer_thread
+        if writer is None or threading.current_thread() is writer:
+            try:
+                future.set_result(self._write(operation))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        self._write_queue.put((operation, future))
+        return future
+
+    def _writer_loop(self):
+        """Drain queued writes in batches; each batch shares a single transaction."""
+        while True:
+            job = self._write_queue.get()
+            if job is None:
+                return
+            batch = [job]
+            stopping = False
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                try:
+                    job = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    stopping = True
+                    break
+                batch.append(job)
+            self._apply_write_batch(batch)
+            if stopping:
+                return
+
+    def _apply_write_batch(self, batch: List[Tuple[Callable[[sqlite3.Cursor], Any], Future]]):
+        """Isolate each write in a savepoint so one failure cannot discard its batch-mates."""
+        results = []
+        try:
+            cursor = self.conn.cursor()
+            # IMMEDIATE takes the write lock up front instead of failing busy on upgrade
+            cursor.execute("BEGIN IMMEDIATE")
+            for operation, future in batch:
+                cursor.execute("SAVEPOINT keepsync_write")
+                try:
+                    value = operation(cursor)
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO keepsync_write")
+                    cursor.execute("RELEASE keepsync_write")
+                    results.append((future, None, e))
+                else:
+                    cursor.execute("RELEASE keepsync_write")
+                    results.append((future, value, None))
+            self.conn.commit()
+        except Exception as e:
+            try:
+                self.conn.rollback()
+            except sqlite3.Error:
+                pass
+            done = {id(future) for future, _, _ in results}
+            results = [(future, None, error or e) for future, _, error in results]
+            results.extend((future, None, e) for _, future in batch if id(future) not in done)
+        for future, value, error in results:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(value)
+
+    def flush_writes(self):
+        """Block until every write queued so far has been committed."""
+        self._write(lambda cursor: None)
+
+    def _configure_connection(self):
+        """Apply write-friendly PRAGMAs; WAL falls back to the default journal where unsupported."""
+        try:
+            row = self.conn.execute("PRAGMA journal_mode=WAL").fetchone()
+            self.journal_mode = str(row[0]).lower() if row else ""
+        except sqlite3.Error as e:
+            print(f"WAL journal unavailable: {e}")
+            self.journal_mode = ""
+        for pragma in self.CONNECTION_PRAGMAS:
+            try:
+                self.conn.execute(f"PRAGMA {pragma}")
+            except sqlite3.Error as e:
+                print(f"SQLite PRAGMA {pragma} failed: {e}")
+
+    def _migrate_content_hashes(self, cursor: sqlite3.Cursor):
+        """Recompute stored hashes in one pass when the hash algorithm changes."""
+        cursor.execute("SELECT value FROM settings WHERE key = 'content_hash_version'")
+        row = cursor.fetchone()
+        if row and row["value"] == str(CONTENT_HASH_VERSION):
+            return
+        cursor.execute("SELECT * FROM notes")
+        updates = []
+        rehashed: Dict[str, Tuple[str, str]] = {}
+        for note_row in cursor.fetchall():
+            note = self._row_to_note(note_row)
+            note.update_hash()
+            updates.append((note.content_hash, note.id))
+            rehashed[note.id] = (note_row["content_hash"], note.content_hash)
+        cursor.executemany("UPDATE notes SET content_hash = ? WHERE id = ?", updates)
+        self._migrate_cloud_bases(cursor, rehashed)
+        cursor.execute(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES ('content_hash_version', ?)",
+            (str(CONTENT_HASH_VERSION),)
+        )
+
+    def _migrate_cloud_bases(self, cursor: sqlite3.Cursor, rehashed: Dict[str, Tuple[str, str]]):
+        """Carry cloud sync base hashes over to the new algorithm.
+
+        A base equal to its note's old stored hash becomes the new hash; any other base
+        no longer identifies a version this database can reproduce, so it is dropped.
+        """
+        def migrated(note_id: str, old_hash: Any) -> Optional[str]:
+            hashes = rehashed.get(note_id)
+            if hashes and old_hash and hashes[0] == old_hash:
+                return hashes[1]
+            return None
+
+        rows = []
+        for key in self.CLOUD_BASE_SETTINGS + self.CLOUD_BLOB_SETTINGS:
+            cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
+            row = cursor.fetchone()
+            stored = self._decode_setting(row["value"]) if row else None
+            if not isinstance(stored, dict):
+                continue
+            converted = {}
+            for note_id, value in stored.items():
+                if key in self.CLOUD_BLOB_SETTINGS:
+                    if isinstance(value, list) and len(value) == 2:
+                        new_hash = migrated(note_id, value[1])
+                        if new_hash:
+                            converted[note_id] = [value[0], new_hash]
+                else:
+                    new_hash = migrated(note_id, value)
+                    if new_hash:
+                        converted[note_id] = new_hash
+            rows.append((key, json_dumps(converted)))
+        cursor.executemany("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", rows)
+
     def _init_fts(self, cursor: sqlite3.Cursor) -> bool:
         try:
-            cursor.execute("""
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'notes_fts'")
+            row = cursor.fetchone()
+            if row and FTS_TOKENIZER not in (row["sql"] or ""):
+                # Indexes built before stemming was enabled are recreated with the current tokenizer.
+                cursor.execute("DROP TABLE notes_fts")
+            cursor.execute(f"""
                 CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts
-                USING fts5(note_id UNINDEXED, title, content, labels)
+                USING fts5(note_id UNINDEXED, title, content, labels, tokenize="{FTS_TOKENIZER}")
             """)
             return True
         except sqlite3.OperationalError as e:
@@ -132,28 +408,60 @@ class DatabaseManager:
         return note.content or ""
 
     def _update_fts(self, cursor: sqlite3.Cursor, note: Note):
+        self._update_fts_many(cursor, [note])
+
+    def _update_fts_many(self, cursor: sqlite3.Cursor, notes: List[Note]):
         if not getattr(self, "fts_available", False):
             return
-        cursor.execute("DELETE FROM notes_fts WHERE note_id = ?", (note.id,))
-        if note.trashed:
-            return
-        cursor.execute(
+        cursor.executemany("DELETE FROM notes_fts WHERE note_id = ?", [(note.id,) for note in notes])
+        cursor.executemany(
             "INSERT INTO notes_fts (note_id, title, content, labels) VALUES (?, ?, ?, ?)",
-            (note.id, note.title, self._fts_text(note), " ".join(note.labels))
+            [
+                (note.id, note.title, self._fts_text(note), " ".join(note.labels))
+                for note in notes
+                if not note.trashed
+            ]
         )
 
     def _delete_fts(self, cursor: sqlite3.Cursor, note_id: str):
         if getattr(self, "fts_available", False):
             cursor.execute("DELETE FROM notes_fts WHERE note_id = ?", (note_id,))
 
+    def _fts_needs_rebuild(self, cursor: sqlite3.Cursor) -> bool:
+        cursor.execute("SELECT COUNT(*) FROM notes WHERE trashed = 0")
+        indexed_notes = cursor.fetchone()[0]
+        cursor.execute("SELECT COUNT(*) FROM notes_fts")
+        return cursor.fetchone()[0] != indexed_notes
+
     def _rebuild_fts(self, cursor: sqlite3.Cursor):
         cursor.execute("DELETE FROM notes_fts")
         cursor.execute("SELECT * FROM notes WHERE trashed = 0")
+        self._update_fts_many(cursor, [self._row_to_note(row) for row in cursor.fetchall()])
+
+    def _update_note_labels(self, cursor: sqlite3.Cursor, note: Note):
+        self._update_note_labels_many(cursor, [note])
+
+    def _update_note_labels_many(self, cursor: sqlite3.Cursor, notes: List[Note]):
+        cursor.executemany("DELETE FROM note_labels WHERE note_id = ?", [(note.id,) for note in notes])
+        cursor.executemany(
+            "INSERT OR IGNORE INTO note_labels (note_id, label) VALUES (?, ?)",
+            [(note.id, str(label)) for note in notes for label in note.labels if str(label or "").strip()]
+        )
+
+    def _rebuild_note_labels(self, cursor: sqlite3.Cursor):
+        cursor.execute("DELETE FROM note_labels")
+        cursor.execute("SELECT id, labels FROM notes")
+        rows = []
         for row in cursor.fetchall():
-            self._update_fts(cursor, self._row_to_note(row))
+            try:
+                labels = json_loads(row["labels"] or "[]")
+            except ValueError:
+                continue
+            rows.extend((row["id"], str(label)) for label in labels if str(label or "").strip())
+        cursor.executemany("INSERT OR IGNORE INTO note_labels (note_id, label) VALUES (?, ?)", rows)
 
     def _fts_query(self, query: str) -> str:
-        terms = re.findall(r"[A-Za-z0-9_]+", query or "")
+        terms = re.findall(r"\w+", query or "")
         return " ".join(f"{term}*" for term in terms)
 
     def _ensure_column(self, table: str, column: str, definition: str):
@@ -166,38 +474,116 @@ class DatabaseManager:
     def save_note(self, note: Note) -> bool:
         """Save or update a note"""
         try:
-            cursor = self.conn.cursor()
-            note.updated_at = datetime.now(timezone.utc)
-            note.update_hash()
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO notes 
-                (id, title, content, note_type, checklist_items, labels, pinned, archived, 
-                 trashed, color, reminder_at, reminder_location, reminder_notified,
-                 shared_with, attachments, keep_id, sync_status, local_modified, remote_modified,
-                 content_hash, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                note.id, note.title, note.content, note.note_type.value,
-                json.dumps([i.to_dict() for i in note.checklist_items]),
-                json.dumps(note.labels), int(note.pinned), int(note.archived),
-                int(note.trashed), note.color,
-                note.reminder_at.isoformat() if note.reminder_at else None,
-                note.reminder_location, int(note.reminder_notified),
-                json.dumps(note.shared_with),
-                json.dumps([a.to_dict() for a in note.attachments]),
-                note.keep_id, note.sync_status.value,
-                note.local_modified.isoformat() if note.local_modified else None,
-                note.remote_modified.isoformat() if note.remote_modified else None,
-                note.content_hash, note.created_at.isoformat(), note.updated_at.isoformat()
-            ))
-            self._update_fts(cursor, note)
-            self.conn.commit()
+            self._write(self._note_save_operation(note))
             return True
         except Exception as e:
             print(f"Error saving note: {e}")
             return False
+
+    def save_note_async(self, note: Note) -> Future:
+        """Queue a note save and return a Future that resolves to save_note's bool.
+
+        The row is written from a snapshot, so the caller may keep editing note meanwhile.
+        """
+        operation = self._note_save_operation(note, snapshot=True)
+        done: Future = Future()
+
+        def finish(write: Future):
+            error = write.exception()
+            if error is not None:
+                print(f"Error saving note: {error}")
+            done.set_result(error is None)
+
+        self._submit_write(operation).add_done_callback(finish)
+        return done
+
+    def _note_save_operation(self, note: Note, snapshot: bool = False) -> Callable[[sqlite3.Cursor], None]:
+        """Stamp and hash note, then build the write that stores it."""
+        note.updated_at = datetime.now(timezone.utc)
+        checklist_json = json_dumps(note.checklist_items)
+        note.update_hash(checklist_json)
+        if snapshot:
+            note = replace(
+                note,
+                checklist_items=list(note.checklist_items),
+                labels=list(note.labels),
+                shared_with=list(note.shared_with),
+                attachments=list(note.attachments),
+            )
+
+        def write(cursor: sqlite3.Cursor):
+            if self._stored_state(cursor, note.id) == self._note_state(note):
+                # Content and sync metadata are unchanged: skip the full-row rewrite and FTS reindex.
+                cursor.execute(
+                    "UPDATE notes SET updated_at = ? WHERE id = ?",
+                    (note.updated_at.isoformat(), note.id)
+                )
+                return
+            cursor.execute(self.NOTE_UPSERT_SQL, self._note_row(note, checklist_json))
+            self._update_fts(cursor, note)
+            self._update_note_labels(cursor, note)
+
+        return write
     
+    def save_notes(self, notes: List[Note]) -> bool:
+        """Save or update many notes in a single transaction."""
+        if not notes:
+            return True
+        now = datetime.now(timezone.utc)
+        rows = []
+        for note in notes:
+            note.updated_at = now
+            checklist_json = json_dumps(note.checklist_items)
+            note.update_hash(checklist_json)
+            rows.append(self._note_row(note, checklist_json))
+
+        def write(cursor: sqlite3.Cursor):
+            cursor.executemany(self.NOTE_UPSERT_SQL, rows)
+            self._update_fts_many(cursor, notes)
+            self._update_note_labels_many(cursor, notes)
+
+        try:
+            self._write(write)
+            return True
+        except Exception as e:
+            print(f"Error saving notes: {e}")
+            return False
+
+    def _note_row(self, note: Note, checklist_json: Optional[str] = None) -> tuple:
+        return (
+            note.id, note.title, note.content, note.note_type.value,
+            json_dumps(note.checklist_items) if checklist_json is None else checklist_json,
+            json_dumps(note.labels), int(note.pinned), int(note.archived),
+            int(note.trashed), note.color,
+            note.reminder_at.isoformat() if note.reminder_at else None,
+            note.reminder_location, int(note.reminder_notified),
+            json_dumps(note.shared_with),
+            json_dumps(note.attachments),
+            note.keep_id, note.sync_status.value,
+            note.local_modified.isoformat() if note.local_modified else None,
+            note.remote_modified.isoformat() if note.remote_modified else None,
+            note.content_hash, note.created_at.isoformat(), note.updated_at.isoformat()
+        )
+
+    def _stored_state(self, cursor: sqlite3.Cursor, note_id: str) -> Optional[tuple]:
+        cursor.execute(
+            f"SELECT {', '.join(self.NOTE_STATE_COLUMNS)} FROM notes WHERE id = ?",
+            (note_id,)
+        )
+        row = cursor.fetchone()
+        return tuple(row) if row else None
+
+    def _note_state(self, note: Note) -> tuple:
+        return (
+            note.content_hash,
+            note.keep_id,
+            note.sync_status.value,
+            note.local_modified.isoformat() if note.local_modified else None,
+            note.remote_modified.isoformat() if note.remote_modified else None,
+            int(note.reminder_notified),
+            note.created_at.isoformat(),
+        )
+
     def get_note(self, note_id: str) -> Optional[Note]:
         """Get a note by ID"""
         cursor = self.conn.cursor()
@@ -207,18 +593,131 @@ class DatabaseManager:
             return self._row_to_note(row)
         return None
     
+    def get_notes_by_ids(self, note_ids: Iterable[str]) -> Dict[str, Note]:
+        """Get many notes by ID with one IN (...) query per chunk; missing IDs are omitted."""
+        ids = list(dict.fromkeys(note_ids))
+        notes = {}
+        cursor = self.conn.cursor()
+        for start in range(0, len(ids), self.ID_QUERY_CHUNK_SIZE):
+            chunk = ids[start:start + self.ID_QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(f"SELECT * FROM notes WHERE id IN ({placeholders})", chunk)
+            for row in cursor.fetchall():
+                notes[row["id"]] = self._row_to_note(row)
+        return notes
+
+    def iter_notes_pending_push(self) -> Iterator[Note]:
+        """Stream untrashed notes that have local changes Google Keep has not seen."""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT * FROM notes WHERE sync_status IN (?, ?) AND trashed = 0",
+            (SyncStatus.PENDING_PUSH.value, SyncStatus.LOCAL_ONLY.value)
+        )
+        for row in cursor:
+            yield self._row_to_note(row)
+
+    def get_sync_index(self) -> Dict[str, Tuple[str, str, Optional[datetime]]]:
+        """Map keep_id to (note id, content hash, remote_modified) for every Keep-linked note."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT keep_id, id, content_hash, remote_modified FROM notes WHERE keep_id IS NOT NULL")
+        return {
+            row["keep_id"]: (
+                row["id"],
+                row["content_hash"] or "",
+                datetime.fromisoformat(row["remote_modified"]) if row["remote_modified"] else None,
+            )
+            for row in cursor.fetchall()
+        }
+    
+    @staticmethod
+    def _all_notes_query(include_trashed: bool, include_archived: bool) -> str:
+        query = "SELECT * FROM notes WHERE 1=1"
+        if not include_trashed:
+            query += " AND trashed = 0"
+        if not include_archived:
+            query += " AND archived = 0"
+        return query + " ORDER BY pinned DESC, updated_at DESC"
+
     def get_all_notes(self, include_trashed: bool = False, include_archived: bool = False) -> List[Note]:
         """Get all notes with optional filters"""
         cursor = self.conn.cursor()
-        query = "SELECT * FROM notes WHERE 1=1"
+        cursor.execute(self._all_notes_query(include_trashed, include_archived))
+        return [self._row_to_note(row) for row in cursor.fetchall()]
+
+    def _notes_matching(self, condition: str, params: tuple = ()) -> List[Note]:
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT * FROM notes WHERE {condition} ORDER BY pinned DESC, updated_at DESC", params)
+        return [self._row_to_note(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _text_match(query: str) -> Tuple[str, tuple]:
+        """SQL clause and params matching query anywhere in a note's title or content.
+
+        LIKE folds ASCII case only; an empty query matches everything.
+        """
+        if not query:
+            return "", ()
+        pattern = "%" + re.sub(r"([\\%_])", r"\\\1", query) + "%"
+        return (
+            " AND (notes.title LIKE ? ESCAPE '\\' OR notes.content LIKE ? ESCAPE '\\')",
+            (pattern, pattern),
+        )
+
+    def get_archived_notes(self) -> List[Note]:
+        """Get archived notes that are not in the trash"""
+        return self._notes_matching("archived = 1 AND trashed = 0")
+
+    def get_trashed_notes(self, query: str = "") -> List[Note]:
+        """Get every note in the trash, archived or not, optionally containing query"""
+        clause, params = self._text_match(query)
+        return self._notes_matching("trashed = 1" + clause, params)
+
+    def iter_all_notes(
+        self,
+        include_trashed: bool = False,
+        include_archived: bool = False,
+        batch_size: int = 500,
+    ) -> Iterator[Note]:
+        """Yield the same notes as get_all_notes, fetching batch_size rows at a time."""
+        cursor = self.conn.cursor()
+        cursor.execute(self._all_notes_query(include_trashed, include_archived))
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield self._row_to_note(row)
+
+    def get_all_note_summaries(self, include_trashed: bool = False, include_archived: bool = False) -> List[NoteSummary]:
+        """Get list-view summaries without parsing checklist, attachment or sharing JSON."""
+        cursor = self.conn.cursor()
+        query = (
+            "SELECT id, title, substr(content, 1, ?) AS snippet, note_type, labels, pinned, archived, trashed, "
+            "color, sync_status, updated_at FROM notes WHERE 1=1"
+        )
         if not include_trashed:
             query += " AND trashed = 0"
         if not include_archived:
             query += " AND archived = 0"
         query += " ORDER BY pinned DESC, updated_at DESC"
-        
-        cursor.execute(query)
-        return [self._row_to_note(row) for row in cursor.fetchall()]
+
+        cursor.execute(query, (self.SUMMARY_SNIPPET_LENGTH,))
+        return [
+            NoteSummary(
+                id=row["id"],
+                title=row["title"] or "",
+                snippet=row["snippet"] or "",
+                note_type=_NOTE_TYPES.get(row["note_type"], NoteType.NOTE),
+                labels=list(_parse_json_column(row["labels"])),
+                pinned=bool(row["pinned"]),
+                archived=bool(row["archived"]),
+                trashed=bool(row["trashed"]),
+                color=normalize_keep_color(row["color"] or ""),
+                sync_status=_SYNC_STATUSES.get(row["sync_status"], SyncStatus.LOCAL_ONLY),
+                updated_at=datetime.fromisoformat(row["updated_at"]) if row["updated_at"] else datetime.now(timezone.utc),
+            )
+            for row in cursor.fetchall()
+        ]
 
     def find_import_conflict(self, note: Note) -> Optional[Note]:
         """Find an existing local note that likely represents the same imported note."""
@@ -266,12 +765,16 @@ class DatabaseManager:
             return "imported"
         return "failed"
     
-    def get_notes_by_label(self, label: str) -> List[Note]:
-        """Get notes with a specific label"""
+    def get_notes_by_label(self, label: str, query: str = "") -> List[Note]:
+        """Get notes with a specific label, optionally containing query"""
+        clause, params = self._text_match(query)
         cursor = self.conn.cursor()
         cursor.execute(
-            "SELECT * FROM notes WHERE labels LIKE ? AND trashed = 0 ORDER BY pinned DESC, updated_at DESC",
-            (f'%"{label}"%',)
+            f"""SELECT notes.* FROM note_labels
+               JOIN notes ON notes.id = note_labels.note_id
+               WHERE note_labels.label = ? AND notes.trashed = 0{clause}
+               ORDER BY notes.pinned DESC, notes.updated_at DESC""",
+            (label, *params)
         )
         return [self._row_to_note(row) for row in cursor.fetchall()]
     
@@ -306,36 +809,46 @@ class DatabaseManager:
     
     def delete_note(self, note_id: str, permanent: bool = False) -> bool:
         """Delete a note (move to trash or permanent delete)"""
-        try:
-            cursor = self.conn.cursor()
+        def write(cursor: sqlite3.Cursor):
             if permanent:
                 cursor.execute("DELETE FROM notes WHERE id = ?", (note_id,))
-                self._delete_fts(cursor, note_id)
+                cursor.execute("DELETE FROM note_labels WHERE note_id = ?", (note_id,))
             else:
-                cursor.execute(
-                    "UPDATE notes SET trashed = 1, updated_at = ? WHERE id = ?",
-                    (datetime.now(timezone.utc).isoformat(), note_id)
-                )
-                self._delete_fts(cursor, note_id)
-            self.conn.commit()
+                self._set_trashed(cursor, note_id, True)
+            self._delete_fts(cursor, note_id)
+
+        try:
+            self._write(write)
             return True
         except Exception as e:
             print(f"Error deleting note: {e}")
             return False
     
+    def _set_trashed(self, cursor: sqlite3.Cursor, note_id: str, trashed: bool) -> Optional[Note]:
+        """Flip the trash flag and keep the stored content hash current."""
+        cursor.execute("SELECT * FROM notes WHERE id = ?", (note_id,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        note = self._row_to_note(row)
+        note.trashed = trashed
+        note.updated_at = datetime.now(timezone.utc)
+        note.update_hash()
+        cursor.execute(
+            "UPDATE notes SET trashed = ?, content_hash = ?, updated_at = ? WHERE id = ?",
+            (int(trashed), note.content_hash, note.updated_at.isoformat(), note_id)
+        )
+        return note
+
     def restore_note(self, note_id: str) -> bool:
         """Restore a note from trash"""
+        def write(cursor: sqlite3.Cursor):
+            note = self._set_trashed(cursor, note_id, False)
+            if note:
+                self._update_fts(cursor, note)
+
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "UPDATE notes SET trashed = 0, updated_at = ? WHERE id = ?",
-                (datetime.now(timezone.utc).isoformat(), note_id)
-            )
-            cursor.execute("SELECT * FROM notes WHERE id = ?", (note_id,))
-            row = cursor.fetchone()
-            if row:
-                self._update_fts(cursor, self._row_to_note(row))
-            self.conn.commit()
+            self._write(write)
             return True
         except Exception as e:
             print(f"Error restoring note: {e}")
@@ -356,56 +869,91 @@ class DatabaseManager:
         )
         return [self._row_to_note(row) for row in cursor.fetchall()]
 
+    def mark_notes_synced(self, updates: List[Tuple[str, str, datetime]]) -> bool:
+        """Record (note id, keep_id, remote_modified) after a push with one executemany."""
+        if not updates:
+            return True
+        now = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (keep_id, SyncStatus.SYNCED.value, remote_modified.isoformat(), now, note_id)
+            for note_id, keep_id, remote_modified in updates
+        ]
+        try:
+            self._write(lambda cursor: cursor.executemany(
+                "UPDATE notes SET keep_id = ?, sync_status = ?, remote_modified = ?, updated_at = ? WHERE id = ?",
+                rows
+            ))
+            return True
+        except Exception as e:
+            print(f"Error marking notes synced: {e}")
+            return False
+
+    def mark_notes_unlinked(self, note_ids: List[str]) -> bool:
+        """Flag notes whose Google Keep copy was deleted, so pushes stop targeting it."""
+        if not note_ids:
+            return True
+        try:
+            self._write(lambda cursor: cursor.executemany(
+                "UPDATE notes SET sync_status = ? WHERE id = ?",
+                [(SyncStatus.DELETED_REMOTE.value, note_id) for note_id in note_ids]
+            ))
+            return True
+        except Exception as e:
+            print(f"Error unlinking notes: {e}")
+            return False
+
     def mark_reminder_notified(self, note_id: str) -> bool:
         """Mark a reminder notification as delivered."""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
+            self._write(lambda cursor: cursor.execute(
                 "UPDATE notes SET reminder_notified = 1, updated_at = ? WHERE id = ?",
                 (datetime.now(timezone.utc).isoformat(), note_id)
-            )
-            self.conn.commit()
+            ))
             return True
         except Exception as e:
             print(f"Error marking reminder notified: {e}")
             return False
     
     def _row_to_note(self, row: sqlite3.Row) -> Note:
-        """Convert database row to Note object"""
+        """Convert a SELECT * notes row to a Note using column positions resolved at open."""
+        col = self._note_columns
+        reminder_at = row[col["reminder_at"]]
+        local_modified = row[col["local_modified"]]
+        remote_modified = row[col["remote_modified"]]
+        created_at = row[col["created_at"]]
+        updated_at = row[col["updated_at"]]
         return Note(
-            id=row["id"],
-            title=row["title"] or "",
-            content=row["content"] or "",
-            note_type=NoteType(row["note_type"]) if row["note_type"] else NoteType.NOTE,
-            checklist_items=[ChecklistItem.from_dict(i) for i in json.loads(row["checklist_items"] or "[]")],
-            labels=json.loads(row["labels"] or "[]"),
-            pinned=bool(row["pinned"]),
-            archived=bool(row["archived"]),
-            trashed=bool(row["trashed"]),
-            color=normalize_keep_color(row["color"] or ""),
-            reminder_at=datetime.fromisoformat(row["reminder_at"]) if row["reminder_at"] else None,
-            reminder_location=row["reminder_location"] or "",
-            reminder_notified=bool(row["reminder_notified"]),
-            shared_with=normalize_people(json.loads(row["shared_with"] or "[]")),
-            attachments=[Attachment.from_dict(a) for a in json.loads(row["attachments"] or "[]")],
-            keep_id=row["keep_id"],
-            sync_status=SyncStatus(row["sync_status"]) if row["sync_status"] else SyncStatus.LOCAL_ONLY,
-            local_modified=datetime.fromisoformat(row["local_modified"]) if row["local_modified"] else None,
-            remote_modified=datetime.fromisoformat(row["remote_modified"]) if row["remote_modified"] else None,
-            content_hash=row["content_hash"] or "",
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else datetime.now(timezone.utc),
-            updated_at=datetime.fromisoformat(row["updated_at"]) if row["updated_at"] else datetime.now(timezone.utc),
+            id=row[col["id"]],
+            title=row[col["title"]] or "",
+            content=row[col["content"]] or "",
+            note_type=_NOTE_TYPES.get(row[col["note_type"]], NoteType.NOTE),
+            checklist_items=[ChecklistItem.from_dict(i) for i in _parse_json_column(row[col["checklist_items"]])],
+            labels=list(_parse_json_column(row[col["labels"]])),
+            pinned=bool(row[col["pinned"]]),
+            archived=bool(row[col["archived"]]),
+            trashed=bool(row[col["trashed"]]),
+            color=normalize_keep_color(row[col["color"]] or ""),
+            reminder_at=datetime.fromisoformat(reminder_at) if reminder_at else None,
+            reminder_location=row[col["reminder_location"]] or "",
+            reminder_notified=bool(row[col["reminder_notified"]]),
+            shared_with=normalize_people(list(_parse_json_column(row[col["shared_with"]]))),
+            attachments=[Attachment.from_dict(a) for a in _parse_json_column(row[col["attachments"]])],
+            keep_id=row[col["keep_id"]],
+            sync_status=_SYNC_STATUSES.get(row[col["sync_status"]], SyncStatus.LOCAL_ONLY),
+            local_modified=datetime.fromisoformat(local_modified) if local_modified else None,
+            remote_modified=datetime.fromisoformat(remote_modified) if remote_modified else None,
+            content_hash=row[col["content_hash"]] or "",
+            created_at=datetime.fromisoformat(created_at) if created_at else datetime.now(timezone.utc),
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else datetime.now(timezone.utc),
         )
     
     # Label operations
     def save_label(self, label: Label) -> bool:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
+            self._write(lambda cursor: cursor.execute(
                 "INSERT OR REPLACE INTO labels (id, name, color, keep_id) VALUES (?, ?, ?, ?)",
                 (label.id, label.name, label.color, label.keep_id)
-            )
-            self.conn.commit()
+            ))
             return True
         except Exception as e:
             print(f"Error saving label: {e}")
@@ -415,21 +963,41 @@ class DatabaseManager:
         label_name = str(name or "").strip()
         if not label_name:
             return False
-        try:
-            cursor = self.conn.cursor()
+        def write(cursor: sqlite3.Cursor):
             cursor.execute("SELECT id FROM labels WHERE name = ?", (label_name,))
-            if cursor.fetchone():
-                return True
-            cursor.execute(
-                "INSERT INTO labels (id, name, color, keep_id) VALUES (?, ?, ?, ?)",
-                (str(uuid.uuid4()), label_name, "", None)
-            )
-            self.conn.commit()
+            if not cursor.fetchone():
+                cursor.execute(
+                    "INSERT INTO labels (id, name, color, keep_id) VALUES (?, ?, ?, ?)",
+                    (str(uuid.uuid4()), label_name, "", None)
+                )
+
+        try:
+            self._write(write)
             return True
         except Exception as e:
             print(f"Error ensuring label: {e}")
             return False
     
+    def ensure_labels(self, names: Iterable[str]) -> bool:
+        """Create any missing labels in one write instead of one transaction per label."""
+        label_names = list(dict.fromkeys(name for name in (str(value or "").strip() for value in names) if name))
+        if not label_names:
+            return True
+        def write(cursor: sqlite3.Cursor):
+            cursor.execute("SELECT name FROM labels")
+            existing = {row[0] for row in cursor.fetchall()}
+            cursor.executemany(
+                "INSERT INTO labels (id, name, color, keep_id) VALUES (?, ?, ?, ?)",
+                [(str(uuid.uuid4()), label_name, "", None) for label_name in label_names if label_name not in existing]
+            )
+
+        try:
+            self._write(write)
+            return True
+        except Exception as e:
+            print(f"Error ensuring labels: {e}")
+            return False
+
     def get_all_labels(self) -> List[Label]:
         cursor = self.conn.cursor()
         cursor.execute("SELECT * FROM labels ORDER BY name")
@@ -438,44 +1006,66 @@ class DatabaseManager:
     
     def delete_label(self, label_id: str) -> bool:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("DELETE FROM labels WHERE id = ?", (label_id,))
-            self.conn.commit()
+            self._write(lambda cursor: cursor.execute("DELETE FROM labels WHERE id = ?", (label_id,)))
             return True
         except Exception as e:
             print(f"Error deleting label: {e}")
             return False
     
     # Settings operations
+    @staticmethod
+    def _decode_setting(value: str) -> Any:
+        try:
+            return json_loads(value)
+        except:
+            return value
+
     def get_setting(self, key: str, default: Any = None) -> Any:
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-        row = cursor.fetchone()
-        if row:
-            try:
-                return json.loads(row["value"])
-            except:
-                return row["value"]
-        return default
+        value = self._settings.get(key)
+        if value is None:
+            return default
+        return self._decode_setting(value)
+
+    def get_settings_many(self, defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """Read several settings; keys that are not stored keep their default."""
+        values = dict(defaults)
+        for key in defaults:
+            stored = self._settings.get(key)
+            if stored is not None:
+                values[key] = self._decode_setting(stored)
+        return values
     
     def set_setting(self, key: str, value: Any) -> bool:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
+            stored = json_dumps(value) if not isinstance(value, str) else value
+            self._write(lambda cursor: cursor.execute(
                 "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
-                (key, json.dumps(value) if not isinstance(value, str) else value)
-            )
-            self.conn.commit()
+                (key, stored)
+            ))
+            self._settings[key] = stored
             return True
         except Exception as e:
             print(f"Error saving setting: {e}")
             return False
 
+    def set_settings_many(self, values: Dict[str, Any]) -> bool:
+        """Save several settings in one transaction."""
+        try:
+            rows = [(key, json_dumps(value) if not isinstance(value, str) else value) for key, value in values.items()]
+            self._write(lambda cursor: cursor.executemany(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                rows
+            ))
+            self._settings.update(rows)
+            return True
+        except Exception as e:
+            print(f"Error saving settings: {e}")
+            return False
+
     def delete_setting(self, key: str) -> bool:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("DELETE FROM settings WHERE key = ?", (key,))
-            self.conn.commit()
+            self._write(lambda cursor: cursor.execute("DELETE FROM settings WHERE key = ?", (key,)))
+            self._settings.pop(key, None)
             return True
         except Exception as e:
             print(f"Error deleting setting: {e}")
@@ -484,16 +1074,19 @@ class DatabaseManager:
     def log_sync(self, action: str, note_id: str, status: str, message: str):
         """Log sync activity"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
+            self._write(lambda cursor: cursor.execute(
                 "INSERT INTO sync_log (timestamp, action, note_id, status, message) VALUES (?, ?, ?, ?, ?)",
                 (datetime.now(timezone.utc).isoformat(), action, note_id, status, message)
-            )
-            self.conn.commit()
+            ))
         except Exception as e:
             print(f"Error logging sync: {e}")
     
     def close(self):
+        writer = self._writer_thread
+        if writer is not None:
+            self._write_queue.put(None)
+            writer.join()
+            self._writer_thread = None
         if self.conn:
             self.conn.close()
             self.conn = None
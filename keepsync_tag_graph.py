@@ -8,13 +8,13 @@ from typing import Dict, Iterable, List, Tuple
 from keepsync_models import Note
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TagNode:
     label: str
     count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TagEdge:
     left: str
     right: str
@@ -22,7 +22,7 @@ class TagEdge:
     note_ids: Tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TagGraph:
     nodes: Tuple[TagNode, ...]
     edges: Tuple[TagEdge, ...]
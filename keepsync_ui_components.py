@@ -1,7 +1,9 @@
 """Reusable note card and status UI components."""
 
+import math
 from datetime import datetime
-from typing import Callable, Dict, Iterable
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Tuple
 
 import customtkinter as ctk
 from PIL import Image, ImageDraw
@@ -42,104 +44,159 @@ def configure_note_card_helpers(
         format_reminder_datetime = format_reminder_datetime_func
 
 
+RGBA = Tuple[int, int, int, int]
+
+
+@lru_cache(maxsize=64)
+def _parse_icon_color(color: str) -> RGBA:
+    """Opaque RGBA for a #rrggbb color; anything else gets the default slate."""
+    if color.startswith("#"):
+        return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16), 255
+    return 148, 163, 184, 255
+
+
+def _draw_search(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.ellipse([3, 3, size-7, size-7], outline=icon_color, width=2)
+    draw.line([size-8, size-8, size-3, size-3], fill=icon_color, width=2)
+
+
+def _draw_plus(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    mid = size // 2
+    draw.line([mid, 4, mid, size-4], fill=icon_color, width=2)
+    draw.line([4, mid, size-4, mid], fill=icon_color, width=2)
+
+
+def _draw_pin(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.polygon([(size//2, 2), (size-4, size//2), (size//2, size-2), (4, size//2)],
+                 fill=icon_color)
+
+
+def _draw_trash(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.rectangle([5, 5, size-5, 7], fill=icon_color)
+    draw.rectangle([6, 8, size-6, size-3], outline=icon_color, width=1)
+
+
+def _draw_archive(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.rectangle([3, 3, size-3, 8], fill=icon_color)
+    draw.rectangle([5, 9, size-5, size-3], outline=icon_color, width=1)
+
+
+def _draw_sync(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.arc([3, 3, size-3, size-3], 0, 270, fill=icon_color, width=2)
+    draw.polygon([(size-5, size//2-3), (size-5, size//2+3), (size-2, size//2)], fill=icon_color)
+
+
+def _draw_settings(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.ellipse([size//2-4, size//2-4, size//2+4, size//2+4], outline=icon_color, width=2)
+    for angle in range(0, 360, 45):
+        x1 = size//2 + int(6 * math.cos(math.radians(angle)))
+        y1 = size//2 + int(6 * math.sin(math.radians(angle)))
+        x2 = size//2 + int(9 * math.cos(math.radians(angle)))
+        y2 = size//2 + int(9 * math.sin(math.radians(angle)))
+        draw.line([x1, y1, x2, y2], fill=icon_color, width=2)
+
+
+def _draw_label(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.polygon([(4, size//2), (10, 4), (size-3, 4), (size-3, size-4), (10, size-4)],
+                 outline=icon_color, width=1)
+
+
+def _draw_check(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.line([4, size//2, size//2-2, size-5], fill=icon_color, width=2)
+    draw.line([size//2-2, size-5, size-3, 5], fill=icon_color, width=2)
+
+
+def _draw_close(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.line([5, 5, size-5, size-5], fill=icon_color, width=2)
+    draw.line([5, size-5, size-5, 5], fill=icon_color, width=2)
+
+
+def _draw_edit(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.polygon([(4, size-4), (4, size-8), (size-8, 4), (size-4, 4)],
+                 outline=icon_color, width=1)
+
+
+def _draw_cloud(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.ellipse([3, size//2-2, size//2, size-3], outline=icon_color, width=1)
+    draw.ellipse([size//2-3, size//2-4, size-3, size-3], outline=icon_color, width=1)
+    draw.ellipse([size//3, 4, size-size//3, size//2+2], outline=icon_color, width=1)
+
+
+def _draw_local(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.rectangle([4, 6, size-4, size-4], outline=icon_color, width=1)
+    draw.line([size//2, 6, size//2, size-4], fill=icon_color, width=1)
+    draw.line([4, size//2+1, size-4, size//2+1], fill=icon_color, width=1)
+
+
+def _draw_checklist(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    for y in [5, size//2, size-5]:
+        draw.rectangle([4, y-2, 8, y+2], outline=icon_color, width=1)
+        draw.line([11, y, size-4, y], fill=icon_color, width=1)
+
+
+def _draw_note(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.rectangle([4, 3, size-4, size-3], outline=icon_color, width=1)
+    for y in [7, 11, 15]:
+        if y < size - 5:
+            draw.line([7, y, size-7, y], fill=icon_color, width=1)
+
+
+def _draw_export(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.rectangle([5, 8, size-5, size-3], outline=icon_color, width=1)
+    draw.line([size//2, 3, size//2, 12], fill=icon_color, width=2)
+    draw.polygon([(size//2-3, 6), (size//2+3, 6), (size//2, 2)], fill=icon_color)
+
+
+def _draw_import(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.rectangle([5, 8, size-5, size-3], outline=icon_color, width=1)
+    draw.line([size//2, 3, size//2, 12], fill=icon_color, width=2)
+    draw.polygon([(size//2-3, 9), (size//2+3, 9), (size//2, 13)], fill=icon_color)
+
+
+def _draw_default(draw: ImageDraw.ImageDraw, size: int, icon_color: RGBA):
+    draw.ellipse([4, 4, size-4, size-4], outline=icon_color, width=2)
+
+
+_ICON_DRAWERS: Dict[str, Callable[[ImageDraw.ImageDraw, int, RGBA], None]] = {
+    "search": _draw_search,
+    "plus": _draw_plus,
+    "pin": _draw_pin,
+    "trash": _draw_trash,
+    "archive": _draw_archive,
+    "sync": _draw_sync,
+    "settings": _draw_settings,
+    "label": _draw_label,
+    "check": _draw_check,
+    "close": _draw_close,
+    "edit": _draw_edit,
+    "cloud": _draw_cloud,
+    "local": _draw_local,
+    "checklist": _draw_checklist,
+    "note": _draw_note,
+    "export": _draw_export,
+    "import": _draw_import,
+}
+
+
 class IconManager:
     """Generate and cache icons for the application"""
 
-    _cache: Dict[str, ctk.CTkImage] = {}
+    _cache: Dict[Tuple[str, int, str], ctk.CTkImage] = {}
 
     @classmethod
     def get_icon(cls, name: str, size: int = 20, color: str = None) -> ctk.CTkImage:
         """Get or create an icon"""
-        cache_key = f"{name}_{size}_{color}"
-        if cache_key not in cls._cache:
-            cls._cache[cache_key] = cls._create_icon(name, size, color or COLORS["text_secondary"])
-        return cls._cache[cache_key]
+        cache_key = (name, size, color or COLORS["text_secondary"])
+        icon = cls._cache.get(cache_key)
+        if icon is None:
+            icon = cls._cache[cache_key] = cls._create_icon(*cache_key)
+        return icon
 
     @classmethod
     def _create_icon(cls, name: str, size: int, color: str) -> ctk.CTkImage:
         """Create an icon image"""
         img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-
-        # Parse color
-        if color.startswith("#"):
-            r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
-        else:
-            r, g, b = 148, 163, 184  # Default
-
-        icon_color = (r, g, b, 255)
-
-        # Draw icons based on name
-        if name == "search":
-            draw.ellipse([3, 3, size-7, size-7], outline=icon_color, width=2)
-            draw.line([size-8, size-8, size-3, size-3], fill=icon_color, width=2)
-        elif name == "plus":
-            mid = size // 2
-            draw.line([mid, 4, mid, size-4], fill=icon_color, width=2)
-            draw.line([4, mid, size-4, mid], fill=icon_color, width=2)
-        elif name == "pin":
-            draw.polygon([(size//2, 2), (size-4, size//2), (size//2, size-2), (4, size//2)],
-                        fill=icon_color)
-        elif name == "trash":
-            draw.rectangle([5, 5, size-5, 7], fill=icon_color)
-            draw.rectangle([6, 8, size-6, size-3], outline=icon_color, width=1)
-        elif name == "archive":
-            draw.rectangle([3, 3, size-3, 8], fill=icon_color)
-            draw.rectangle([5, 9, size-5, size-3], outline=icon_color, width=1)
-        elif name == "sync":
-            draw.arc([3, 3, size-3, size-3], 0, 270, fill=icon_color, width=2)
-            draw.polygon([(size-5, size//2-3), (size-5, size//2+3), (size-2, size//2)], fill=icon_color)
-        elif name == "settings":
-            draw.ellipse([size//2-4, size//2-4, size//2+4, size//2+4], outline=icon_color, width=2)
-            for angle in range(0, 360, 45):
-                import math
-                x1 = size//2 + int(6 * math.cos(math.radians(angle)))
-                y1 = size//2 + int(6 * math.sin(math.radians(angle)))
-                x2 = size//2 + int(9 * math.cos(math.radians(angle)))
-                y2 = size//2 + int(9 * math.sin(math.radians(angle)))
-                draw.line([x1, y1, x2, y2], fill=icon_color, width=2)
-        elif name == "label":
-            draw.polygon([(4, size//2), (10, 4), (size-3, 4), (size-3, size-4), (10, size-4)],
-                        outline=icon_color, width=1)
-        elif name == "check":
-            draw.line([4, size//2, size//2-2, size-5], fill=icon_color, width=2)
-            draw.line([size//2-2, size-5, size-3, 5], fill=icon_color, width=2)
-        elif name == "close":
-            draw.line([5, 5, size-5, size-5], fill=icon_color, width=2)
-            draw.line([5, size-5, size-5, 5], fill=icon_color, width=2)
-        elif name == "edit":
-            draw.polygon([(4, size-4), (4, size-8), (size-8, 4), (size-4, 4)],
-                        outline=icon_color, width=1)
-        elif name == "cloud":
-            draw.ellipse([3, size//2-2, size//2, size-3], outline=icon_color, width=1)
-            draw.ellipse([size//2-3, size//2-4, size-3, size-3], outline=icon_color, width=1)
-            draw.ellipse([size//3, 4, size-size//3, size//2+2], outline=icon_color, width=1)
-        elif name == "local":
-            draw.rectangle([4, 6, size-4, size-4], outline=icon_color, width=1)
-            draw.line([size//2, 6, size//2, size-4], fill=icon_color, width=1)
-            draw.line([4, size//2+1, size-4, size//2+1], fill=icon_color, width=1)
-        elif name == "checklist":
-            y_positions = [5, size//2, size-5]
-            for y in y_positions:
-                draw.rectangle([4, y-2, 8, y+2], outline=icon_color, width=1)
-                draw.line([11, y, size-4, y], fill=icon_color, width=1)
-        elif name == "note":
-            draw.rectangle([4, 3, size-4, size-3], outline=icon_color, width=1)
-            for y in [7, 11, 15]:
-                if y < size - 5:
-                    draw.line([7, y, size-7, y], fill=icon_color, width=1)
-        elif name == "export":
-            draw.rectangle([5, 8, size-5, size-3], outline=icon_color, width=1)
-            draw.line([size//2, 3, size//2, 12], fill=icon_color, width=2)
-            draw.polygon([(size//2-3, 6), (size//2+3, 6), (size//2, 2)], fill=icon_color)
-        elif name == "import":
-            draw.rectangle([5, 8, size-5, size-3], outline=icon_color, width=1)
-            draw.line([size//2, 3, size//2, 12], fill=icon_color, width=2)
-            draw.polygon([(size//2-3, 9), (size//2+3, 9), (size//2, 13)], fill=icon_color)
-        else:
-            # Default circle
-            draw.ellipse([4, 4, size-4, size-4], outline=icon_color, width=2)
-
+        _ICON_DRAWERS.get(name, _draw_default)(ImageDraw.Draw(img), size, _parse_icon_color(color))
         return ctk.CTkImage(light_image=img, dark_image=img, size=(size, size))
 
 
@@ -155,17 +212,34 @@ class SyncStatusBadge(ctk.CTkFrame):
         SyncStatus.DELETED_REMOTE: ("Unlinked", COLORS["text_muted"], "local"),
         SyncStatus.ERROR: ("Error", COLORS["sync_error"], "close"),
     }
+    UNKNOWN_CONFIG = ("Unknown", COLORS["text_muted"], "cloud")
+
+    # status -> (text, color, icon), filled on first use so importing draws nothing
+    _PREBUILT: Dict[SyncStatus, Tuple[str, str, ctk.CTkImage]] = {}
+
+    @classmethod
+    def _status_display(cls, status: SyncStatus) -> Tuple[str, str, ctk.CTkImage]:
+        if not cls._PREBUILT:
+            cls._PREBUILT.update({
+                config_status: (text, color, IconManager.get_icon(icon_name, 14, color))
+                for config_status, (text, color, icon_name) in cls.STATUS_CONFIG.items()
+            })
+        display = cls._PREBUILT.get(status)
+        if display is None:
+            text, color, icon_name = cls.UNKNOWN_CONFIG
+            display = (text, color, IconManager.get_icon(icon_name, 14, color))
+        return display
 
     def __init__(self, parent, status: SyncStatus = SyncStatus.LOCAL_ONLY, **kwargs):
         super().__init__(parent, fg_color="transparent", **kwargs)
 
         self.status = status
-        text, color, icon_name = self.STATUS_CONFIG.get(status, ("Unknown", COLORS["text_muted"], "cloud"))
+        text, color, image = self._status_display(status)
 
         self.icon = ctk.CTkLabel(
             self,
             text="",
-            image=IconManager.get_icon(icon_name, 14, color),
+            image=image,
             width=14
         )
         self.icon.pack(side="left", padx=(0, 4))
@@ -181,8 +255,8 @@ class SyncStatusBadge(ctk.CTkFrame):
     def update_status(self, status: SyncStatus):
         """Update displayed status"""
         self.status = status
-        text, color, icon_name = self.STATUS_CONFIG.get(status, ("Unknown", COLORS["text_muted"], "cloud"))
-        self.icon.configure(image=IconManager.get_icon(icon_name, 14, color))
+        text, color, image = self._status_display(status)
+        self.icon.configure(image=image)
         self.label.configure(text=text, text_color=color)
 
 
@@ -207,18 +281,39 @@ class NoteCard(ctk.CTkFrame):
         self.on_archive = on_archive
 
         self._is_hovered = False
+        self.actions_frame = None
+        self._build_ui()
+        self._bind_events()
+
+    def update_from_note(self, note: Note):
+        """Show note in this card, rebuilding its contents only when what it renders changed."""
+        self.note = note
+        # content_hash covers every rendered field except the sync status, which updates in place.
+        # Compare with what was drawn, not with the old Note: editors and pin/archive change that
+        # same object and rehash it on save, so it always matches the refreshed note.
+        if note.content_hash == self._rendered_hash:
+            if note.sync_status != self.sync_badge.status:
+                self.sync_badge.update_status(note.sync_status)
+            return
+        for widget in (self.color_strip, self.content_frame, self.actions_frame):
+            if widget is not None:
+                widget.destroy()
+        self.actions_frame = None
         self._build_ui()
         self._bind_events()
 
     def _build_ui(self):
+        self._rendered_hash = self.note.content_hash
+        self.color_strip = None
+        self.preview_label = None
         if normalize_keep_color(self.note.color):
-            color_strip = ctk.CTkFrame(
+            self.color_strip = ctk.CTkFrame(
                 self,
                 fg_color=keep_color_hex(self.note.color),
                 height=5,
                 corner_radius=2
             )
-            color_strip.pack(fill="x", padx=1, pady=(1, 0))
+            self.color_strip.pack(fill="x", padx=1, pady=(1, 0))
 
         # Main content area
         self.content_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -260,20 +355,10 @@ class NoteCard(ctk.CTkFrame):
         type_icon.pack(side="right")
 
         # Content preview
-        if self.note.note_type == NoteType.CHECKLIST:
-            preview_text = "\n".join([
-                f"{'  ' * min(item.indent, 3)}{'[x]' if item.checked else '[ ]'} {item.text}"
-                for item in self.note.checklist_items[:3]
-            ])
-            if len(self.note.checklist_items) > 3:
-                preview_text += f"\n  +{len(self.note.checklist_items) - 3} more..."
+        if self.note.note_type != NoteType.CHECKLIST and note_uses_markdown(self.note.labels):
+            preview_text = markdown_preview_text(self.note.content)
         else:
-            if note_uses_markdown(self.note.labels):
-                preview_text = markdown_preview_text(self.note.content)
-            else:
-                preview_text = self.note.content[:150]
-                if len(self.note.content) > 150:
-                    preview_text += "..."
+            preview_text = self.note.preview
 
         if preview_text:
             self.preview_label = ctk.CTkLabel(
@@ -369,7 +454,8 @@ class NoteCard(ctk.CTkFrame):
         self.sync_badge = SyncStatusBadge(footer, self.note.sync_status)
         self.sync_badge.pack(side="right")
 
-        # Action buttons (hidden until hover)
+    def _build_actions(self) -> ctk.CTkFrame:
+        """Action buttons, built on first hover since most cards in a grid are never hovered."""
         self.actions_frame = ctk.CTkFrame(self, fg_color=COLORS["bg_light"], corner_radius=8)
 
         pin_text = "Unpin" if self.note.pinned else "Pin"
@@ -411,13 +497,14 @@ class NoteCard(ctk.CTkFrame):
             command=lambda: self.on_delete(self.note)
         )
         self.delete_btn.pack(side="left", padx=2, pady=2)
+        return self.actions_frame
 
     def _bind_events(self):
         # Click to open
         for widget in [self, self.content_frame, self.title_label]:
             widget.bind("<Button-1>", lambda e: self.on_click(self.note))
 
-        if hasattr(self, 'preview_label'):
+        if self.preview_label is not None:
             self.preview_label.bind("<Button-1>", lambda e: self.on_click(self.note))
 
         # Hover effects
@@ -427,9 +514,11 @@ class NoteCard(ctk.CTkFrame):
     def _on_enter(self, event):
         self._is_hovered = True
         self.configure(border_color=COLORS["accent_blue"])
-        self.actions_frame.place(relx=1.0, rely=0, anchor="ne", x=-8, y=8)
+        actions_frame = self.actions_frame or self._build_actions()
+        actions_frame.place(relx=1.0, rely=0, anchor="ne", x=-8, y=8)
 
     def _on_leave(self, event):
         self._is_hovered = False
         self.configure(border_color=COLORS["border"])
-        self.actions_frame.place_forget()
+        if self.actions_frame is not None:
+            self.actions_frame.place_forget()
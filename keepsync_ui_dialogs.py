@@ -4,7 +4,7 @@ import threading
 import webbrowser
 from pathlib import Path
 from tkinter import messagebox
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional
 
 import customtkinter as ctk
 
@@ -12,6 +12,7 @@ from keepsync_diagnostics import DiagnosticsManager
 from keepsync_models import KEEP_COLOR_PALETTE, Note, normalize_keep_color
 from keepsync_note_ops import default_advanced_filters, note_conflict_diff
 from keepsync_theme import COLORS
+from keepsync_ui_fonts import MONO_FAMILY, ui_font
 from keepsync_ui_modal import configure_modal_dialog
 
 
@@ -39,7 +40,7 @@ class AdvancedFilterDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             frame,
             text="Advanced Filters",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=ui_font(size=20, weight="bold"),
             text_color=COLORS["text_primary"]
         ).pack(anchor="w", pady=(0, 16))
 
@@ -84,7 +85,7 @@ class AdvancedFilterDialog(ctk.CTkToplevel):
                 frame,
                 text=label,
                 variable=variable,
-                font=ctk.CTkFont(size=13),
+                font=ui_font(size=13),
                 text_color=COLORS["text_secondary"],
                 fg_color=COLORS["accent_green"],
                 hover_color=COLORS["accent_green_hover"]
@@ -117,7 +118,7 @@ class AdvancedFilterDialog(ctk.CTkToplevel):
         entry = ctk.CTkEntry(
             parent,
             placeholder_text=placeholder,
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             height=36,
             fg_color=COLORS["bg_medium"],
             border_color=COLORS["border"],
@@ -175,21 +176,21 @@ class ImportConflictDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             header,
             text="Import Conflict",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=ui_font(size=20, weight="bold"),
             text_color=COLORS["text_primary"]
         ).pack(anchor="w")
 
         ctk.CTkLabel(
             header,
             text=self.imported_note.title or "Untitled",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             text_color=COLORS["text_secondary"],
             anchor="w"
         ).pack(anchor="w", pady=(4, 0))
 
         diff_box = ctk.CTkTextbox(
             self,
-            font=ctk.CTkFont(size=12, family="Consolas"),
+            font=ui_font(size=12, family=MONO_FAMILY),
             fg_color=COLORS["bg_medium"],
             border_width=1,
             border_color=COLORS["border"],
@@ -213,7 +214,7 @@ class ImportConflictDialog(ctk.CTkToplevel):
             button = ctk.CTkButton(
                 actions,
                 text=label,
-                font=ctk.CTkFont(size=13, weight="bold"),
+                font=ui_font(size=13, weight="bold"),
                 height=38,
                 fg_color=color,
                 hover_color=COLORS["bg_hover"] if result == "local" else color,
@@ -230,6 +231,32 @@ class ImportConflictDialog(ctk.CTkToplevel):
 class TakeoutInstructionsDialog(ctk.CTkToplevel):
     """Dialog showing Google Takeout export instructions"""
 
+    # The content is static, so one built dialog is hidden and re-shown while its parent lives
+    _instance: Optional["TakeoutInstructionsDialog"] = None
+
+    STEPS = (
+        ("1", "Go to Google Takeout", "takeout.google.com"),
+        ("2", "Click 'Deselect all'", "Then scroll down and select only 'Keep'"),
+        ("3", "Click 'Next step'", "Choose 'Export once' and '.zip' format"),
+        ("4", "Click 'Create export'", "Wait for Google to prepare your data"),
+        ("5", "Download the ZIP", "Check your email for the download link"),
+        ("6", "Extract the ZIP", "Find the 'Keep' folder inside"),
+        ("7", "Import JSON files", "Use Settings → Import Notes in this app"),
+    )
+
+    @classmethod
+    def show(cls, parent) -> "TakeoutInstructionsDialog":
+        """Re-show the cached dialog for parent, building it only on first use."""
+        dialog = cls._instance
+        if dialog is not None and dialog.master is parent and dialog.winfo_exists():
+            dialog.deiconify()
+            dialog.transient(parent)
+            dialog.grab_set()
+            dialog.focus_set()
+        else:
+            dialog = cls._instance = cls(parent)
+        return dialog
+
     def __init__(self, parent):
         super().__init__(parent)
 
@@ -241,14 +268,23 @@ class TakeoutInstructionsDialog(ctk.CTkToplevel):
         self.grab_set()
 
         self._build_ui()
-        configure_modal_dialog(self, parent)
+        configure_modal_dialog(self, parent, on_close=self.hide)
+
+    def hide(self):
+        """Withdraw instead of destroying so the next show() reuses the built steps."""
+        self.grab_release()
+        self.withdraw()
+        try:
+            self.master.focus_set()
+        except Exception:
+            pass
 
     def _build_ui(self):
         # Header
         header = ctk.CTkLabel(
             self,
             text="📦 Import via Google Takeout",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=ui_font(size=20, weight="bold"),
             text_color=COLORS["text_primary"]
         )
         header.pack(pady=(20, 10))
@@ -256,7 +292,7 @@ class TakeoutInstructionsDialog(ctk.CTkToplevel):
         subtitle = ctk.CTkLabel(
             self,
             text="The most reliable way to get your Google Keep notes",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             text_color=COLORS["text_secondary"]
         )
         subtitle.pack(pady=(0, 20))
@@ -265,49 +301,36 @@ class TakeoutInstructionsDialog(ctk.CTkToplevel):
         instructions_frame = ctk.CTkFrame(self, fg_color=COLORS["bg_medium"], corner_radius=12)
         instructions_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
 
-        steps = [
-            ("1", "Go to Google Takeout", "takeout.google.com"),
-            ("2", "Click 'Deselect all'", "Then scroll down and select only 'Keep'"),
-            ("3", "Click 'Next step'", "Choose 'Export once' and '.zip' format"),
-            ("4", "Click 'Create export'", "Wait for Google to prepare your data"),
-            ("5", "Download the ZIP", "Check your email for the download link"),
-            ("6", "Extract the ZIP", "Find the 'Keep' folder inside"),
-            ("7", "Import JSON files", "Use Settings → Import Notes in this app"),
-        ]
-
-        for num, title, desc in steps:
-            step_frame = ctk.CTkFrame(instructions_frame, fg_color="transparent")
-            step_frame.pack(fill="x", padx=16, pady=8)
-
-            num_label = ctk.CTkLabel(
-                step_frame,
+        # One grid for all steps: the number spans its step's title and description rows
+        instructions_frame.grid_columnconfigure(1, weight=1)
+        number_color = COLORS["accent_green"]
+        title_color = COLORS["text_primary"]
+        desc_color = COLORS["text_muted"]
+        for index, (num, title, desc) in enumerate(self.STEPS):
+            row = index * 2
+            ctk.CTkLabel(
+                instructions_frame,
                 text=num,
-                font=ctk.CTkFont(size=16, weight="bold"),
-                text_color=COLORS["accent_green"],
+                font=ui_font(size=16, weight="bold"),
+                text_color=number_color,
                 width=30
-            )
-            num_label.pack(side="left")
+            ).grid(row=row, column=0, rowspan=2, padx=(16, 8), pady=8)
 
-            text_frame = ctk.CTkFrame(step_frame, fg_color="transparent")
-            text_frame.pack(side="left", fill="x", expand=True, padx=(8, 0))
-
-            title_label = ctk.CTkLabel(
-                text_frame,
+            ctk.CTkLabel(
+                instructions_frame,
                 text=title,
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color=COLORS["text_primary"],
+                font=ui_font(size=13, weight="bold"),
+                text_color=title_color,
                 anchor="w"
-            )
-            title_label.pack(anchor="w")
+            ).grid(row=row, column=1, sticky="w", padx=(0, 16), pady=(8, 0))
 
-            desc_label = ctk.CTkLabel(
-                text_frame,
+            ctk.CTkLabel(
+                instructions_frame,
                 text=desc,
-                font=ctk.CTkFont(size=11),
-                text_color=COLORS["text_muted"],
+                font=ui_font(size=11),
+                text_color=desc_color,
                 anchor="w"
-            )
-            desc_label.pack(anchor="w")
+            ).grid(row=row + 1, column=1, sticky="w", padx=(0, 16), pady=(0, 8))
 
         # Buttons
         btn_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -316,7 +339,7 @@ class TakeoutInstructionsDialog(ctk.CTkToplevel):
         open_takeout_btn = ctk.CTkButton(
             btn_frame,
             text="Open Google Takeout",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=ui_font(size=13, weight="bold"),
             height=40,
             fg_color=COLORS["accent_blue"],
             hover_color=COLORS["accent_blue_hover"],
@@ -328,14 +351,14 @@ class TakeoutInstructionsDialog(ctk.CTkToplevel):
         close_btn = ctk.CTkButton(
             btn_frame,
             text="Close",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             height=40,
             fg_color="transparent",
             hover_color=COLORS["bg_hover"],
             text_color=COLORS["text_secondary"],
             border_width=1,
             border_color=COLORS["border"],
-            command=self.destroy
+            command=self.hide
         )
         close_btn.pack(side="left", fill="x", expand=True)
 
@@ -343,6 +366,19 @@ class TakeoutInstructionsDialog(ctk.CTkToplevel):
 class TokenGeneratorDialog(ctk.CTkToplevel):
     """Dialog to generate Google Master Token"""
 
+    # gpsoauth module once imported, False once found missing, None before the first attempt
+    _gpsoauth: Any = None
+
+    @classmethod
+    def _load_gpsoauth(cls):
+        if cls._gpsoauth is None:
+            try:
+                import gpsoauth
+                cls._gpsoauth = gpsoauth
+            except ImportError:
+                cls._gpsoauth = False
+        return cls._gpsoauth or None
+
     def __init__(self, parent, prefill_email: str = ""):
         super().__init__(parent)
 
@@ -365,7 +401,7 @@ class TokenGeneratorDialog(ctk.CTkToplevel):
         title = ctk.CTkLabel(
             header,
             text="🔑 Master Token Generator",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=ui_font(size=20, weight="bold"),
             text_color=COLORS["text_primary"]
         )
         title.pack(anchor="w")
@@ -375,7 +411,7 @@ class TokenGeneratorDialog(ctk.CTkToplevel):
             self,
             text="Google requires a Master Token for Keep sync.\n"
                  "This will authenticate with Google and generate your token.",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             text_color=COLORS["text_secondary"],
             justify="left"
         )
@@ -389,14 +425,14 @@ class TokenGeneratorDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             form_frame,
             text="Google Email",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             text_color=COLORS["text_secondary"]
         ).pack(anchor="w", padx=16, pady=(16, 4))
 
         self.email_entry = ctk.CTkEntry(
             form_frame,
             placeholder_text="your.email@gmail.com",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             height=40,
             fg_color=COLORS["bg_dark"],
             border_color=COLORS["border"]
@@ -409,14 +445,14 @@ class TokenGeneratorDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             form_frame,
             text="Password (or App Password if 2FA enabled)",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             text_color=COLORS["text_secondary"]
         ).pack(anchor="w", padx=16, pady=(12, 4))
 
         self.password_entry = ctk.CTkEntry(
             form_frame,
             placeholder_text="Your password",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             height=40,
             fg_color=COLORS["bg_dark"],
             border_color=COLORS["border"],
@@ -429,7 +465,7 @@ class TokenGeneratorDialog(ctk.CTkToplevel):
             form_frame,
             text="⚠️ If you have 2FA enabled, create an App Password at:\n"
                  "   myaccount.google.com/apppasswords",
-            font=ctk.CTkFont(size=11),
+            font=ui_font(size=11),
             text_color=COLORS["accent_yellow"],
             justify="left"
         )
@@ -439,7 +475,7 @@ class TokenGeneratorDialog(ctk.CTkToplevel):
         self.generate_btn = ctk.CTkButton(
             self,
             text="Generate Master Token",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=ui_font(size=14, weight="bold"),
             height=44,
             fg_color=COLORS["accent_green"],
             hover_color=COLORS["accent_green_hover"],
@@ -454,14 +490,14 @@ class TokenGeneratorDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             self.result_frame,
             text="✓ Master Token Generated!",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=ui_font(size=14, weight="bold"),
             text_color=COLORS["accent_green"]
         ).pack(anchor="w", padx=16, pady=(16, 8))
 
         self.token_display = ctk.CTkTextbox(
             self.result_frame,
             height=80,
-            font=ctk.CTkFont(size=11, family="Consolas"),
+            font=ui_font(size=11, family=MONO_FAMILY),
             fg_color=COLORS["bg_dark"],
             text_color=COLORS["text_primary"]
         )
@@ -473,7 +509,7 @@ class TokenGeneratorDialog(ctk.CTkToplevel):
         self.copy_btn = ctk.CTkButton(
             btn_frame,
             text="Copy & Use Token",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=ui_font(size=13, weight="bold"),
             height=36,
             fg_color=COLORS["accent_blue"],
             hover_color=COLORS["accent_blue_hover"],
@@ -485,7 +521,7 @@ class TokenGeneratorDialog(ctk.CTkToplevel):
         close_btn = ctk.CTkButton(
             btn_frame,
             text="Close",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             height=36,
             fg_color="transparent",
             hover_color=COLORS["bg_hover"],
@@ -500,7 +536,7 @@ class TokenGeneratorDialog(ctk.CTkToplevel):
         self.status_label = ctk.CTkLabel(
             self,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             text_color=COLORS["text_muted"]
         )
         self.status_label.pack(pady=(8, 20))
@@ -516,24 +552,19 @@ class TokenGeneratorDialog(ctk.CTkToplevel):
             messagebox.showerror("Error", "Please enter both email and password")
             return
 
+        gpsoauth = self._load_gpsoauth()
+        if gpsoauth is None:
+            self._show_error("gpsoauth is not installed. Run: python -m pip install -r requirements.txt")
+            return
+
         self.generate_btn.configure(state="disabled", text="Generating...")
-        self.status_label.configure(text="Checking gpsoauth...", text_color=COLORS["text_muted"])
-        self.update()
+        self.status_label.configure(text="Authenticating with Google...", text_color=COLORS["text_muted"])
+        # Only flush the redraw; update() would also dispatch queued clicks before the worker starts
+        self.update_idletasks()
 
-        # Run in thread to not block UI
+        # Run in thread to not block UI; the disabled button keeps it to one worker at a time
         def generate():
             try:
-                try:
-                    import gpsoauth
-                except ImportError:
-                    self.after(0, lambda: self._show_error(
-                        "gpsoauth is not installed. Run: python -m pip install -r requirements.txt"
-                    ))
-                    return
-
-                self.after(0, lambda: self.status_label.configure(
-                    text="Authenticating with Google...", text_color=COLORS["text_muted"]))
-
                 # Generate token
                 android_id = "0123456789abcdef"
                 master_response = gpsoauth.perform_master_login(email, password, android_id)
@@ -612,14 +643,14 @@ class ImportProgressDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             self,
             text=title,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=ui_font(size=16, weight="bold"),
             text_color=COLORS["text_primary"],
         ).pack(anchor="w", padx=20, pady=(20, 8))
 
         self.status_label = ctk.CTkLabel(
             self,
             text="Preparing import...",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             text_color=COLORS["text_secondary"],
         )
         self.status_label.pack(anchor="w", padx=20, pady=(0, 12))
@@ -631,7 +662,7 @@ class ImportProgressDialog(ctk.CTkToplevel):
         self.cancel_btn = ctk.CTkButton(
             self,
             text="Cancel",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             height=34,
             fg_color=COLORS["bg_light"],
             hover_color=COLORS["bg_hover"],
@@ -675,14 +706,14 @@ class DiagnosticsDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             header,
             text="Diagnostics",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=ui_font(size=18, weight="bold"),
             text_color=COLORS["text_primary"],
         ).pack(side="left")
 
         ctk.CTkButton(
             header,
             text="Open Log",
-            font=ctk.CTkFont(size=12),
+            font=ui_font(size=12),
             width=100,
             height=32,
             fg_color=COLORS["bg_light"],
@@ -693,7 +724,7 @@ class DiagnosticsDialog(ctk.CTkToplevel):
 
         self.textbox = ctk.CTkTextbox(
             self,
-            font=ctk.CTkFont(family="Consolas", size=12),
+            font=ui_font(family=MONO_FAMILY, size=12),
             fg_color=COLORS["bg_darkest"],
             text_color=COLORS["text_primary"],
             border_color=COLORS["border"],
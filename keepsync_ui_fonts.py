@@ -0,0 +1,25 @@
+"""Shared CTkFont instances for the KeepSyncNotes UI."""
+
+import sys
+from functools import lru_cache
+from typing import Optional
+
+import customtkinter as ctk
+
+# A monospace family that ships with each platform, so Tk never has to fall back from a missing one
+if sys.platform == "win32":
+    MONO_FAMILY = "Consolas"
+elif sys.platform == "darwin":
+    MONO_FAMILY = "Menlo"
+else:
+    MONO_FAMILY = "DejaVu Sans Mono"
+
+
+@lru_cache(maxsize=None)
+def ui_font(size: int, weight: Optional[str] = None, family: Optional[str] = None) -> ctk.CTkFont:
+    """One CTkFont per (size, weight, family), shared by every widget that asks for it.
+
+    Widgets only read the fonts they are given, so sharing is safe; callers must not
+    configure() a returned font in place.
+    """
+    return ctk.CTkFont(family=family, size=size, weight=weight)
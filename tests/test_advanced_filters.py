@@ -60,6 +60,17 @@ class AdvancedFilterTests(unittest.TestCase):
 
         self.assertTrue(note_ops.note_matches_advanced_filters(note, filters))
 
+    def test_filter_dates_are_parsed_once_per_value(self):
+        note_ops.parse_filter_date.cache_clear()
+        filters = note_ops.default_advanced_filters()
+        filters["date_from"] = "2026-01-01"
+        notes = [app.Note(id=str(index), title="", content="") for index in range(5)]
+
+        matches = [note for note in notes if note_ops.note_matches_advanced_filters(note, filters)]
+
+        self.assertEqual(len(matches), 5)
+        self.assertEqual(note_ops.parse_filter_date.cache_info().misses, 2)
+
     def test_app_reexports_note_ops_for_compatibility(self):
         self.assertIs(app.default_advanced_filters, note_ops.default_advanced_filters)
         self.assertIs(app.note_matches_advanced_filters, note_ops.note_matches_advanced_filters)
@@ -1,4 +1,6 @@
+import queue
 import unittest
+from unittest import mock
 
 import keepsync_app as app_shell
 import keepsync_app_info as app_info
@@ -18,6 +20,215 @@ class AppShellModuleTests(unittest.TestCase):
         self.assertEqual(app.APP_VERSION, app_info.APP_VERSION)
         self.assertEqual(app.DB_VERSION, app_info.DB_VERSION)
 
+    def test_search_keystrokes_refresh_once_after_typing_pauses(self):
+        view = mock.Mock(_search_after_id=None, search_query="", SEARCH_DEBOUNCE_MS=200)
+        view.after.side_effect = ["after#1", "after#2", "after#3"]
+
+        app_shell.KeepSyncNotesApp._on_search(view)
+        app_shell.KeepSyncNotesApp._on_search(view)
+
+        view.after_cancel.assert_called_once_with("after#1")
+        view.after.assert_called_with(200, view._run_search)
+        view._refresh_notes_list.assert_not_called()
+
+        view.search_entry.get.return_value = "plan"
+        app_shell.KeepSyncNotesApp._run_search(view)
+        app_shell.KeepSyncNotesApp._run_search(view)
+
+        self.assertIsNone(view._search_after_id)
+        self.assertEqual(view.search_query, "plan")
+        view._refresh_notes_list.assert_called_once_with()
+
+    def test_note_list_refresh_reuses_cards_and_only_builds_the_shortfall(self):
+        def note(note_id):
+            return app.Note(id=note_id, title=note_id, content="")
+
+        def fake_card(parent, shown, **callbacks):
+            card = mock.Mock(note=shown)
+            card.update_from_note.side_effect = lambda new: setattr(card, "note", new)
+            return card
+
+        view = mock.Mock(note_cards=[], _spare_note_cards=[], _note_card_page_size=None, NOTE_CARD_CHUNK_SIZE=25)
+        view._render_note_cards.side_effect = lambda limit: app_shell.KeepSyncNotesApp._render_note_cards(view, limit)
+        listed = [note("a"), note("b"), note("c")]
+        view._get_filtered_notes_for_current_view.side_effect = lambda: listed
+
+        with mock.patch.object(app_shell, "NoteCard", side_effect=fake_card) as card_class:
+            app_shell.KeepSyncNotesApp._refresh_notes_list(view)
+            first = list(view.note_cards)
+
+            listed = [note("b"), note("d")]
+            app_shell.KeepSyncNotesApp._refresh_notes_list(view)
+
+            listed = [note("b"), note("d")]
+            app_shell.KeepSyncNotesApp._refresh_notes_list(view)
+
+        self.assertEqual(card_class.call_count, 3)
+        self.assertIs(view.note_cards[0], first[1])
+        self.assertEqual([card.note.id for card in view.note_cards], ["b", "d"])
+        self.assertEqual(len(view._spare_note_cards), 1)
+        self.assertEqual(first[1].pack.call_count, 2)
+        view.notes_count_label.configure.assert_called_with(text="2 notes")
+
+    def test_note_cards_are_built_a_page_at_a_time_as_the_list_scrolls(self):
+        view = mock.Mock(
+            note_cards=[], _spare_note_cards=[], _note_card_page_size=2,
+            _note_page_after_id=None, NOTE_CARD_PAGE_THRESHOLD=0.85,
+        )
+        view._render_note_cards.side_effect = lambda limit: app_shell.KeepSyncNotesApp._render_note_cards(view, limit)
+        view._get_filtered_notes_for_current_view.return_value = [
+            app.Note(id=str(index), title="", content="") for index in range(5)
+        ]
+        view.after_idle.return_value = "idle#1"
+        scrollbar = mock.Mock()
+
+        with mock.patch.object(app_shell, "NoteCard", side_effect=lambda parent, note, **callbacks: mock.Mock(note=note)):
+            app_shell.KeepSyncNotesApp._refresh_notes_list(view)
+            first_page = list(view.note_cards)
+
+            app_shell.KeepSyncNotesApp._on_notes_scrolled(view, scrollbar, "0.0", "0.5")
+            view.after_idle.assert_not_called()
+            app_shell.KeepSyncNotesApp._on_notes_scrolled(view, scrollbar, "0.1", "0.9")
+            app_shell.KeepSyncNotesApp._on_notes_scrolled(view, scrollbar, "0.1", "0.95")
+            view.after_idle.assert_called_once_with(view._show_next_note_page)
+
+            app_shell.KeepSyncNotesApp._show_next_note_page(view)
+
+        scrollbar.set.assert_called_with("0.1", "0.95")
+        self.assertEqual([card.note.id for card in view.note_cards], ["0", "1", "2", "3"])
+        self.assertEqual(view.note_cards[:2], first_page)
+        self.assertEqual([card.pack.call_count for card in view.note_cards], [1, 1, 1, 1])
+        view.notes_count_label.configure.assert_called_with(text="5 notes")
+
+    def test_note_cards_stream_in_idle_chunks_without_the_scroll_hook(self):
+        view = mock.Mock(
+            note_cards=[], _spare_note_cards=[], _note_card_page_size=None,
+            _note_page_after_id=None, NOTE_CARD_CHUNK_SIZE=25,
+        )
+        view._render_note_cards.side_effect = lambda limit: app_shell.KeepSyncNotesApp._render_note_cards(view, limit)
+        view._stream_note_cards.side_effect = lambda: app_shell.KeepSyncNotesApp._stream_note_cards(view)
+        view._get_filtered_notes_for_current_view.return_value = [
+            app.Note(id=str(index), title="", content="") for index in range(60)
+        ]
+        view.after_idle.return_value = "idle#1"
+
+        with mock.patch.object(app_shell, "NoteCard", side_effect=lambda parent, note, **callbacks: mock.Mock(note=note)):
+            app_shell.KeepSyncNotesApp._refresh_notes_list(view)
+            shown = [len(view.note_cards)]
+            while view._note_page_after_id:
+                app_shell.KeepSyncNotesApp._show_next_note_page(view)
+                shown.append(len(view.note_cards))
+
+        self.assertEqual(shown, [25, 50, 60])
+        self.assertEqual(view.after_idle.call_count, 2)
+        view.after_idle.assert_called_with(view._show_next_note_page)
+
+    def test_pin_and_archive_clicks_are_saved_and_refreshed_together(self):
+        pinned = app.Note(id="a", title="", content="")
+        archived = app.Note(id="b", title="", content="", keep_id="keep-b")
+        cards = [mock.Mock(note=pinned), mock.Mock(note=archived)]
+        view = mock.Mock(
+            note_cards=cards, _pending_mutations={}, _mutation_flush_id=None, MUTATION_FLUSH_MS=100,
+        )
+        view._queue_note_mutation.side_effect = lambda note: app_shell.KeepSyncNotesApp._queue_note_mutation(view, note)
+        view._save_note_mutations.side_effect = lambda: app_shell.KeepSyncNotesApp._save_note_mutations(view)
+        view._refresh_notes_list.side_effect = lambda: view._save_note_mutations()
+        view.after.return_value = "after#1"
+
+        app_shell.KeepSyncNotesApp._toggle_pin(view, pinned)
+        app_shell.KeepSyncNotesApp._toggle_pin(view, pinned)
+        app_shell.KeepSyncNotesApp._archive_note(view, archived)
+
+        view.after.assert_called_once_with(100, view._flush_note_mutations)
+        view.db.save_notes.assert_not_called()
+        cards[0].pin_btn.configure.assert_called_with(text="Pin")
+        cards[1].pack_forget.assert_called_once_with()
+        self.assertEqual(archived.sync_status, app.SyncStatus.PENDING_PUSH)
+
+        app_shell.KeepSyncNotesApp._flush_note_mutations(view)
+
+        view.db.save_notes.assert_called_once_with([pinned, archived])
+        view._refresh_notes_list.assert_called_once_with()
+        self.assertFalse(pinned.pinned)
+        self.assertEqual(view._pending_mutations, {})
+        self.assertIsNone(view._mutation_flush_id)
+        view.after_cancel.assert_not_called()
+
+    def test_label_sidebar_is_rebuilt_only_when_label_names_change(self):
+        view = mock.Mock(_rendered_labels=None)
+        view.db.get_all_labels.return_value = [app.Label(id="1", name="home"), app.Label(id="2", name="work")]
+        view.labels_frame.winfo_children.return_value = []
+
+        with mock.patch.object(app_shell.ctk, "CTkButton") as button, \
+                mock.patch.object(app_shell.ctk, "CTkFont"), \
+                mock.patch.object(app_shell.IconManager, "get_icon"):
+            app_shell.KeepSyncNotesApp._refresh_labels(view)
+            app_shell.KeepSyncNotesApp._refresh_labels(view)
+            view.db.get_all_labels.return_value = [app.Label(id="1", name="home")]
+            app_shell.KeepSyncNotesApp._refresh_labels(view)
+
+        self.assertEqual(button.call_count, 3)
+        self.assertEqual(view._refresh_folders.call_count, 2)
+        self.assertEqual(view._rendered_labels, ("home",))
+
+    def test_cloud_status_label_is_reconfigured_only_when_it_would_change(self):
+        shown = {"text": "Local only", "text_color": app_shell.COLORS["text_muted"]}
+        view = mock.Mock()
+        view.cloud_sync.is_connected.return_value = False
+        view.sync_engine.is_authenticated = False
+        view.sync_status_label.cget.side_effect = shown.get
+        view.sync_status_label.configure.side_effect = shown.update
+
+        app_shell.KeepSyncNotesApp._update_cloud_status_display(view)
+        view.sync_status_label.configure.assert_not_called()
+
+        shown["text"] = "Moved to trash"
+        app_shell.KeepSyncNotesApp._update_cloud_status_display(view)
+        view.cloud_sync.is_connected.return_value = True
+        view.cloud_sync.get_status.return_value = {"provider": "GitHub"}
+        app_shell.KeepSyncNotesApp._update_cloud_status_display(view)
+        app_shell.KeepSyncNotesApp._update_cloud_status_display(view)
+
+        self.assertEqual(view.sync_status_label.configure.call_count, 2)
+        self.assertEqual(shown, {"text": "☁️ GitHub", "text_color": app_shell.COLORS["accent_green"]})
+
+    def test_failed_pin_and_archive_save_restores_the_stored_state(self):
+        note = app.Note(id="a", title="", content="")
+        view = mock.Mock(_pending_mutations={}, _mutation_flush_id="after#1")
+        view._revert_note_mutations.side_effect = lambda notes: app_shell.KeepSyncNotesApp._revert_note_mutations(view, notes)
+        view.db.save_notes.return_value = False
+        view.db.get_notes_by_ids.return_value = {"a": app.Note(id="a", title="", content="")}
+        note.pinned = note.archived = True
+        view._pending_mutations["a"] = note
+
+        with mock.patch.object(app_shell, "log_diagnostic_event") as log_event:
+            app_shell.KeepSyncNotesApp._save_note_mutations(view)
+
+        view.after_cancel.assert_called_once_with("after#1")
+        self.assertFalse(note.pinned or note.archived)
+        self.assertEqual(view._pending_mutations, {})
+        log_event.assert_called_once()
+        view.sync_status_label.configure.assert_called_once_with(
+            text="Changes not saved", text_color=app_shell.COLORS["accent_red"]
+        )
+
+    def test_background_jobs_run_one_at_a_time_in_order(self):
+        view = mock.Mock(_background_queue=queue.Queue())
+        ran = []
+
+        def broken():
+            ran.append("broken")
+            raise RuntimeError("boom")
+
+        for job in (lambda: ran.append("first"), broken, lambda: ran.append("second")):
+            app_shell.KeepSyncNotesApp._run_in_background(view, job)
+        view._background_queue.put(None)
+        with mock.patch.object(app_shell, "log_diagnostic_exception") as log_exception:
+            app_shell.KeepSyncNotesApp._background_loop(view)
+
+        self.assertEqual(ran, ["first", "broken", "second"])
+        log_exception.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
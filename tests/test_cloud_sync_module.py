@@ -1,8 +1,11 @@
 import json
 import tempfile
+import threading
 import unittest
 import zipfile
 from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
 import keepsync_cloud_sync as cloud_sync
 import keepsync_notes as app
@@ -28,6 +31,100 @@ class FakeCloudProvider(cloud_sync.CloudSyncProvider):
         return "Fake Cloud"
 
 
+class FakeDriveRequest:
+    def __init__(self, result):
+        self.result = result
+
+    def execute(self):
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+    def next_chunk(self, num_retries=0):
+        self.num_retries = num_retries
+        return None, self.execute()
+
+
+class FakeDriveFiles:
+    def __init__(self, folders):
+        self.folders = folders
+        self.calls = []
+
+    def get(self, fileId, fields):
+        self.calls.append("get")
+        folder = self.folders.get(fileId)
+        return FakeDriveRequest(folder if folder else LookupError(fileId))
+
+    def list(self, **kwargs):
+        self.calls.append("list")
+        self.list_kwargs = kwargs
+        if "in parents" in kwargs["q"]:
+            return FakeDriveRequest({"files": []})
+        live = [folder for folder in self.folders.values() if not folder["trashed"]]
+        return FakeDriveRequest({"files": live})
+
+    def create(self, body, fields, media_body=None):
+        self.calls.append("create")
+        self.media_body = media_body
+        self.folders["created"] = {"id": "created", "trashed": False}
+        self.last_request = FakeDriveRequest({"id": "created"})
+        return self.last_request
+
+    def update(self, fileId, media_body):
+        self.calls.append("update")
+        self.media_body = media_body
+        self.last_request = FakeDriveRequest({"id": fileId})
+        return self.last_request
+
+
+class FakeDriveService:
+    def __init__(self, folders):
+        self._files = FakeDriveFiles(folders)
+
+    def files(self):
+        return self._files
+
+
+class FakeGitHubRepo:
+    default_branch = "main"
+
+    def __init__(self, files=None):
+        self.files = dict(files or {})
+        self.calls = []
+        self.trees = []
+
+    def get_contents(self, path):
+        self.calls.append(("get_contents", path))
+        prefix = f"{path}/"
+        return [
+            SimpleNamespace(name=name[len(prefix):], decoded_content=content.encode("utf-8"), sha=cloud_sync.git_blob_sha(content))
+            for name, content in self.files.items()
+            if name.startswith(prefix)
+        ]
+
+    def get_git_ref(self, ref):
+        self.calls.append(("get_git_ref", ref))
+        return SimpleNamespace(object=SimpleNamespace(sha="base"), edit=lambda sha: self.calls.append(("edit", sha)))
+
+    def get_git_commit(self, sha):
+        self.calls.append(("get_git_commit", sha))
+        return SimpleNamespace(sha=sha, tree="base-tree")
+
+    def create_git_tree(self, elements, base_tree):
+        self.calls.append(("create_git_tree", base_tree))
+        self.trees.append({element._identity["path"]: element._identity for element in elements})
+        return "tree"
+
+    def create_git_commit(self, message, tree, parents):
+        self.calls.append(("create_git_commit", message))
+        return SimpleNamespace(sha="new")
+
+    def __getattr__(self, name):
+        if name in ("create_file", "update_file", "delete_file"):
+            raise AssertionError(f"unexpected per-file call: {name}")
+        raise AttributeError(name)
+
+
 class CloudSyncModuleTests(unittest.TestCase):
     def setUp(self):
         self.tmp = tempfile.TemporaryDirectory()
@@ -76,5 +173,362 @@ class CloudSyncModuleTests(unittest.TestCase):
         self.assertEqual(manifest["reason"], "before Fake Cloud sync")
 
 
+    def test_notify_does_not_wait_for_slow_callbacks(self):
+        provider = FakeCloudProvider(self.db)
+        release = threading.Event()
+        received = []
+
+        def slow_callback(status, message):
+            release.wait(5)
+            received.append((status, message))
+
+        provider.add_callback(slow_callback)
+        provider._notify("syncing", "first")
+        provider._notify("synced", "second")
+
+        self.assertEqual(received, [])
+        release.set()
+        provider.flush_notifications()
+        self.assertEqual(received, [("syncing", "first"), ("synced", "second")])
+
+
+    def test_drive_folder_id_is_remembered_between_connects(self):
+        provider = cloud_sync.GoogleDriveSync(self.db)
+        provider.service = FakeDriveService({"folder-1": {"id": "folder-1", "trashed": False}})
+
+        provider._ensure_folder()
+        provider._ensure_folder()
+
+        self.assertEqual(provider.folder_id, "folder-1")
+        self.assertEqual(provider.service.files().calls, ["list", "get"])
+        self.assertEqual(provider.service.files().list_kwargs["fields"], "files(id)")
+        self.assertEqual(provider.service.files().list_kwargs["pageSize"], 1)
+        self.assertEqual(self.db.get_setting("gdrive_folder_id"), "folder-1")
+
+    def test_trashed_drive_folder_falls_back_to_search(self):
+        self.db.set_setting("gdrive_folder_id", "old")
+        provider = cloud_sync.GoogleDriveSync(self.db)
+        provider.service = FakeDriveService({"old": {"id": "old", "trashed": True}})
+
+        provider._ensure_folder()
+
+        self.assertEqual(provider.folder_id, "created")
+        self.assertEqual(provider.service.files().calls, ["get", "list", "create"])
+        self.assertEqual(self.db.get_setting("gdrive_folder_id"), "created")
+
+
+    def test_github_connect_reports_missing_pygithub_without_importing(self):
+        provider = cloud_sync.GitHubSync(self.db)
+
+        with mock.patch.object(cloud_sync, "PYGITHUB_AVAILABLE", False), \
+                mock.patch.object(cloud_sync, "migrate_setting_secret") as read_token:
+            ok, message = provider.connect(token="token", repo_name="notes-backup")
+
+        self.assertFalse(ok)
+        self.assertIn("requirements.txt", message)
+        read_token.assert_not_called()
+        self.assertEqual(cloud_sync.PYGITHUB_AVAILABLE, cloud_sync.importlib.util.find_spec("github") is not None)
+
+    def test_github_reconnect_opens_verified_repo_without_requests(self):
+        try:
+            import github
+        except ImportError:
+            self.skipTest("PyGithub is not installed")
+        self.db.set_setting("github_repo", "notes-backup")
+        self.db.set_setting("github_repo_full_name", "octo/notes-backup")
+        client = mock.Mock()
+        provider = cloud_sync.GitHubSync(self.db)
+
+        with mock.patch.object(github, "Github", return_value=client), \
+                mock.patch.object(cloud_sync, "migrate_setting_secret", return_value="saved-token"):
+            ok, _message = provider.connect(repo_name="notes-backup")
+
+        self.assertTrue(ok)
+        self.assertTrue(provider.is_connected)
+        client.get_repo.assert_called_once_with("octo/notes-backup", lazy=True)
+        client.get_user.assert_not_called()
+        self.assertIs(provider.repo, client.get_repo.return_value)
+
+        with mock.patch.object(cloud_sync.credentials_state.SECURE_CREDENTIALS, "delete_secret"):
+            provider.disconnect()
+        self.assertIsNone(self.db.get_setting("github_repo_full_name"))
+
+    def test_github_sync_writes_all_changes_in_one_commit(self):
+        try:
+            import github  # noqa: F401
+        except ImportError:
+            self.skipTest("PyGithub is not installed")
+        for index in range(3):
+            self.db.save_note(app.Note(id=f"note-{index}", title=f"Note {index}", content="body"))
+        provider = cloud_sync.GitHubSync(self.db)
+        provider.is_connected = True
+        provider.repo = FakeGitHubRepo()
+
+        ok, message, stats = provider.sync()
+
+        self.assertTrue(ok, message)
+        self.assertEqual(stats["uploaded"], 3)
+        self.assertEqual([call[0] for call in provider.repo.calls].count("create_git_commit"), 1)
+        self.assertEqual(provider.repo.calls[-1], ("edit", "new"))
+        tree = provider.repo.trees[0]
+        self.assertEqual(
+            set(tree),
+            {"notes/note-0.json", "notes/note-1.json", "notes/note-2.json", "labels.json", "metadata.json"},
+        )
+        self.assertEqual(json.loads(tree["notes/note-1.json"]["content"])["title"], "Note 1")
+
+
+    def test_github_sync_downloads_remote_notes_concurrently(self):
+        try:
+            import github  # noqa: F401
+        except ImportError:
+            self.skipTest("PyGithub is not installed")
+        remote = [app.Note(id=f"remote-{index}", title=f"Remote {index}", content="") for index in range(4)]
+        repo = FakeGitHubRepo({f"notes/{note.id}.json": json.dumps(note.to_dict()) for note in remote})
+        barrier = threading.Barrier(len(remote), timeout=5)
+
+        class BlockingContent:
+            def __init__(self, content):
+                self.name, self.sha, self._content = content.name, content.sha, content.decoded_content
+
+            @property
+            def decoded_content(self):
+                barrier.wait()  # only passes if every download is in flight at once
+                return self._content
+
+        listing = repo.get_contents
+        repo.get_contents = lambda path: [BlockingContent(content) for content in listing(path)]
+        provider = cloud_sync.GitHubSync(self.db)
+        provider.is_connected = True
+        provider.repo = repo
+
+        ok, message, stats = provider.sync()
+
+        self.assertTrue(ok, message)
+        self.assertEqual(stats["downloaded"], 4)
+        self.assertEqual(sorted(note.id for note in self.db.get_all_notes()), [note.id for note in remote])
+
+
+    def test_github_sync_skips_unchanged_files_and_idle_commits(self):
+        try:
+            import github  # noqa: F401
+        except ImportError:
+            self.skipTest("PyGithub is not installed")
+        self.assertEqual(cloud_sync.git_blob_sha("hello\n"), "ce013625030ba8dba906f756967f9e9ca394464a")
+        provider = cloud_sync.GitHubSync(self.db)
+        provider.is_connected = True
+        notes = [app.Note(id=f"note-{index}", title=f"Note {index}", content="body") for index in range(2)]
+        for note in notes:
+            self.db.save_note(note)
+        stored = {note.id: self.db.get_note(note.id) for note in notes}
+        files = {f"notes/{note_id}.json": app.json_dumps(note.to_dict()) for note_id, note in stored.items()}
+        files["labels.json"] = app.json_dumps([])
+        provider.repo = FakeGitHubRepo(files)
+        self.db.set_setting("cloud_base_github", {note_id: note.content_hash for note_id, note in stored.items()})
+        edited = stored["note-0"]
+        edited.content = "edited"
+        self.db.save_note(edited)
+
+        ok, message, stats = provider.sync()
+
+        self.assertTrue(ok, message)
+        self.assertEqual(stats["uploaded"], 1)
+        self.assertEqual(set(provider.repo.trees[0]), {"notes/note-0.json", "labels.json", "metadata.json"})
+        self.assertNotIn("\n", provider.repo.trees[0]["notes/note-0.json"]["content"])
+        self.assertIn("\n  ", provider.repo.trees[0]["metadata.json"]["content"])
+
+        files["notes/note-0.json"] = app.json_dumps(self.db.get_note("note-0").to_dict())
+        provider.repo = FakeGitHubRepo(files)
+        ok, message, stats = provider.sync()
+
+        self.assertTrue(ok, message)
+        self.assertEqual(provider.repo.trees, [])
+        self.assertEqual([call for call in provider.repo.calls if call[0] == "get_contents"], [("get_contents", "notes")])
+
+
+    def test_drive_sync_uploads_compact_json_resumably_from_memory(self):
+        try:
+            from googleapiclient.http import MediaIoBaseUpload
+        except ImportError:
+            self.skipTest("google-api-python-client is not installed")
+        self.db.save_note(app.Note(id="note-1", title="Drive", content="body"))
+        provider = cloud_sync.GoogleDriveSync(self.db)
+        provider.is_connected = True
+        provider.folder_id = "folder-1"
+        provider.service = FakeDriveService({})
+
+        ok, message, stats = provider.sync()
+
+        self.assertTrue(ok, message)
+        media = provider.service.files().media_body
+        self.assertIsInstance(media, MediaIoBaseUpload)
+        self.assertTrue(media.resumable())
+        self.assertEqual(media.chunksize(), cloud_sync.GoogleDriveSync.UPLOAD_CHUNK_SIZE)
+        self.assertEqual(provider.service.files().last_request.num_retries, cloud_sync.GoogleDriveSync.UPLOAD_RETRIES)
+        payload = media.getbytes(0, media.size())
+        self.assertNotIn(b"\n", payload)
+        self.assertEqual([note["id"] for note in json.loads(payload)["notes"]], ["note-1"])
+
+    def test_drive_sync_remembers_notes_file_id(self):
+        try:
+            import googleapiclient.http  # noqa: F401
+        except ImportError:
+            self.skipTest("google-api-python-client is not installed")
+        provider = cloud_sync.GoogleDriveSync(self.db)
+        provider.is_connected = True
+        provider.folder_id = "folder-1"
+        provider.service = FakeDriveService({})
+
+        ok, message, _stats = provider.sync()
+        self.assertTrue(ok, message)
+        self.assertEqual(self.db.get_setting("gdrive_notes_file_id"), "created")
+
+        provider.service.files().calls.clear()
+        self.assertEqual(provider._notes_file(), ("created", None))
+        self.assertEqual(provider.service.files().calls, ["get"])
+
+    def test_trashed_drive_notes_file_falls_back_to_search(self):
+        self.db.set_setting("gdrive_notes_file_id", "old")
+        provider = cloud_sync.GoogleDriveSync(self.db)
+        provider.folder_id = "folder-1"
+        provider.service = FakeDriveService({"old": {"id": "old", "trashed": True}})
+
+        self.assertEqual(provider._notes_file(), (None, None))
+        self.assertEqual(provider.service.files().calls, ["get", "list"])
+        self.assertIsNone(self.db.get_setting("gdrive_notes_file_id"))
+
+    def test_drive_sync_skips_download_when_remote_is_its_own_upload(self):
+        try:
+            import googleapiclient.http  # noqa: F401
+        except ImportError:
+            self.skipTest("google-api-python-client is not installed")
+        kept = app.Note(id="kept", title="Kept", content="body")
+        self.db.save_note(kept)
+        self.db.set_setting("cloud_base_gdrive", {"kept": kept.content_hash, "gone": "old-hash"})
+        self.db.set_setting("gdrive_notes_file_id", "notes-file")
+        self.db.set_setting("gdrive_notes_md5", "abc")
+        provider = cloud_sync.GoogleDriveSync(self.db)
+        provider.is_connected = True
+        provider.folder_id = "folder-1"
+        provider.service = FakeDriveService({"notes-file": {"id": "notes-file", "trashed": False, "md5Checksum": "abc"}})
+
+        ok, message, stats = provider.sync()
+
+        self.assertTrue(ok, message)
+        self.assertEqual(provider.service.files().calls, ["get", "update"])
+        self.assertEqual(stats["dry_run"], {"create": 0, "update": 0, "delete": 1, "conflict": 0})
+        payload = provider.service.files().media_body.getbytes(0, provider.service.files().media_body.size())
+        self.assertEqual(self.db.get_setting("gdrive_notes_md5"), cloud_sync.hashlib.md5(payload).hexdigest())
+
+    def test_github_sync_downloads_only_changed_note_files(self):
+        try:
+            import github  # noqa: F401
+        except ImportError:
+            self.skipTest("PyGithub is not installed")
+        provider = cloud_sync.GitHubSync(self.db)
+        provider.is_connected = True
+        provider.repo = FakeGitHubRepo()
+        for index in range(3):
+            self.db.save_note(app.Note(id=f"note-{index}", title=f"Note {index}", content="body"))
+        ok, message, _stats = provider.sync()
+        self.assertTrue(ok, message)
+        for path, element in provider.repo.trees[0].items():
+            provider.repo.files[path] = element["content"]
+        remote_edit = json.loads(provider.repo.files["notes/note-1.json"])
+        remote_edit["content"] = "edited elsewhere"
+        provider.repo.files["notes/note-1.json"] = app.json_dumps(remote_edit)
+        fetched = []
+
+        class CountingContent:
+            def __init__(self, content):
+                self.name, self.sha, self._content = content.name, content.sha, content.decoded_content
+
+            @property
+            def decoded_content(self):
+                fetched.append(self.name)
+                return self._content
+
+        listing = provider.repo.get_contents
+        provider.repo.get_contents = lambda path: [CountingContent(content) for content in listing(path)]
+
+        ok, message, stats = provider.sync()
+
+        self.assertTrue(ok, message)
+        self.assertEqual(fetched, ["note-1.json"])
+        self.assertEqual(stats["downloaded"], 1)
+        self.assertEqual(self.db.get_note("note-1").content, "edited elsewhere")
+        self.assertEqual(len(provider.repo.trees), 1)
+
+    def test_serialized_notes_are_reused_until_the_note_is_written(self):
+        provider = FakeCloudProvider(self.db)
+        note = app.Note(id="note-1", title="Cached", content="body")
+        self.db.save_note(note)
+        stored = self.db.get_note("note-1")
+
+        with mock.patch.object(provider, "_encode_note", wraps=provider._encode_note) as encode:
+            first = provider._note_json(stored)
+            self.assertIs(provider._note_json(self.db.get_note("note-1")), first)
+            stored.content = "edited"
+            self.db.save_note(stored)
+            second = provider._note_json(self.db.get_note("note-1"))
+
+        self.assertEqual(encode.call_count, 2)
+        self.assertEqual(json.loads(second)["content"], "edited")
+        provider._prune_json_cache([])
+        self.assertEqual(provider._json_cache, {})
+
+    def test_serialized_notes_follow_writes_that_keep_updated_at(self):
+        provider = FakeCloudProvider(self.db)
+        self.db.save_note(app.Note(id="note-1", title="Cached", content="body", keep_id="keep-1"))
+        first = provider._note_json(self.db.get_note("note-1"))
+
+        self.db.mark_notes_unlinked(["note-1"])
+        unlinked = self.db.get_note("note-1")
+        second = provider._note_json(unlinked)
+        self.db.conn.execute("UPDATE notes SET content_hash = 'rehashed' WHERE id = 'note-1'")
+        third = provider._note_json(self.db.get_note("note-1"))
+
+        self.assertEqual(json.loads(first)["updated_at"], json.loads(second)["updated_at"])
+        self.assertEqual(json.loads(second)["sync_status"], app.SyncStatus.DELETED_REMOTE.value)
+        self.assertEqual(json.loads(third)["content_hash"], "rehashed")
+
+    def test_drive_client_requests_gzip_responses(self):
+        try:
+            from googleapiclient.discovery import build
+        except ImportError:
+            self.skipTest("google-api-python-client is not installed")
+        service = build("drive", "v3", developerKey="unit-test")
+
+        for request in (service.files().list(q="x", fields="files(id)"), service.files().get_media(fileId="f")):
+            self.assertIn("gzip", request.headers["accept-encoding"])
+            self.assertIn("(gzip)", request.headers["user-agent"])
+
+
+    def test_manager_auto_sync_waits_from_last_sync_and_wakes_on_trigger(self):
+        manager = cloud_sync.CloudSyncManager(self.db)
+        provider = FakeCloudProvider(self.db)
+        manager.active_provider = provider
+        second = threading.Event()
+        calls = []
+
+        def fake_sync():
+            calls.append(1)
+            if len(calls) == 2:
+                second.set()
+            return provider.sync()
+
+        manager.sync = fake_sync
+        manager.start_auto_sync(interval_minutes=60)
+        try:
+            manager.trigger_sync()
+            self.assertTrue(second.wait(5))
+        finally:
+            manager.stop_auto_sync()
+
+        self.assertFalse(manager.auto_sync_thread.is_alive())
+        manager._last_sync_end = cloud_sync.time.monotonic() - 60
+        self.assertAlmostEqual(manager._seconds_until_next_sync(300), 240, delta=5)
+
+
 if __name__ == "__main__":
     unittest.main()
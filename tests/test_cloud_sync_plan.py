@@ -1,5 +1,6 @@
 import tempfile
 import unittest
+from datetime import datetime, timezone
 from pathlib import Path
 
 import keepsync_cloud_plan as cloud_plan
@@ -94,6 +95,16 @@ class CloudSyncPlanTests(unittest.TestCase):
         self.assertEqual([note["id"] for note in plan["delete_remote"]], ["shared"])
         self.assertEqual(cloud_plan.cloud_plan_counts(plan)["delete"], 1)
 
+    def test_plan_uses_known_remote_hashes_for_undownloaded_notes(self):
+        base = self.make_note("shared", content="Base")
+        edited = self.make_note("shared", content="Edited")
+        base_versions = cloud_plan.cloud_base_versions([base])
+
+        plan = cloud_plan.build_cloud_sync_plan([edited], {"shared": {"id": "shared"}}, base_versions, base_versions)
+
+        self.assertEqual([note.id for note in plan["upload_updates"]], ["shared"])
+        self.assertEqual(plan["conflicts"], [])
+
     def test_cloud_conflict_copy_marks_remote_copy(self):
         with tempfile.TemporaryDirectory() as tmp:
             db = app.DatabaseManager(str(Path(tmp) / "notes.db"))
@@ -115,6 +126,19 @@ class CloudSyncPlanTests(unittest.TestCase):
             finally:
                 db.close()
 
+    def test_note_data_hash_matches_full_note_decode_without_reading_timestamps(self):
+        note = app.Note(
+            id="n1", title="Trip", content="", note_type=app.NoteType.CHECKLIST,
+            checklist_items=[app.ChecklistItem(text="Pack", checked=True, indent=1)],
+            labels=["travel"], pinned=True, color="BLUE", shared_with=["A@Example.com"],
+            reminder_at=datetime(2026, 5, 1, 9, tzinfo=timezone.utc), reminder_location="Home",
+            attachments=[app.Attachment(id="a1", filename="map.png", stored_path="att/map.png", mime_type="image/png")],
+        )
+        data = note.to_dict()
+        data.update(created_at="not a timestamp", updated_at="not a timestamp", sync_status="unknown")
+
+        self.assertEqual(cloud_plan.note_data_hash(data), app.Note.from_dict(note.to_dict()).content_hash)
+
     def test_app_reexports_cloud_plan_api_for_compatibility(self):
         self.assertIs(app.build_cloud_sync_plan, cloud_plan.build_cloud_sync_plan)
         self.assertIs(app.cloud_base_versions, cloud_plan.cloud_base_versions)
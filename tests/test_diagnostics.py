@@ -1,6 +1,7 @@
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import keepsync_diagnostics as diagnostics_module
 import keepsync_notes as app
@@ -46,6 +47,19 @@ class DiagnosticsTests(unittest.TestCase):
         self.assertIn("unit failure", diagnostics.last_exception)
         self.assertIn("boom", diagnostics.recent_log())
 
+    def test_dependency_state_is_probed_once_until_refreshed(self):
+        diagnostics = diagnostics_module.DiagnosticsManager(self.root)
+
+        with mock.patch.object(diagnostics_module.importlib.util, "find_spec", return_value=None) as find_spec:
+            first = diagnostics.dependency_state()
+            diagnostics.dependency_state()
+            probes = find_spec.call_count
+            diagnostics.dependency_state(refresh=True)
+
+        self.assertEqual(probes, len(diagnostics.DEPENDENCIES))
+        self.assertEqual(find_spec.call_count, 2 * len(diagnostics.DEPENDENCIES))
+        self.assertEqual(set(first.values()), {"missing"})
+
     def test_app_reexports_diagnostics_api_for_compatibility(self):
         self.assertIs(app.DiagnosticsManager, diagnostics_module.DiagnosticsManager)
         self.assertIs(app.log_diagnostic_event, diagnostics_module.log_diagnostic_event)
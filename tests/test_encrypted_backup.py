@@ -2,6 +2,7 @@ import sqlite3
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import keepsync_encrypted_backup as enc_backup
 
@@ -88,6 +89,19 @@ class EncryptedBackupTests(unittest.TestCase):
         enc_backup.restore_encrypted_backup(backup, "pw", str(restore_path))
         self.assertTrue(restore_path.with_suffix(".db.pre-restore").exists())
 
+    def test_copy_database_only_falls_back_to_a_raw_copy_for_non_databases(self):
+        target = self.root / "copy.db"
+        with mock.patch.object(enc_backup.sqlite3, "connect", side_effect=sqlite3.OperationalError("database is locked")), \
+                mock.patch.object(enc_backup.shutil, "copy2") as copy2:
+            with self.assertRaises(sqlite3.OperationalError):
+                enc_backup._copy_database(self.db_path, str(target))
+        copy2.assert_not_called()
+
+        source = self.root / "plain.bin"
+        source.write_bytes(b"not sqlite at all, just some bytes in a file")
+        enc_backup._copy_database(str(source), str(target))
+        self.assertEqual(target.read_bytes(), source.read_bytes())
+
 
 if __name__ == "__main__":
     unittest.main()
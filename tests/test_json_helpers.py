@@ -0,0 +1,103 @@
+import io
+import unittest
+from unittest import mock
+
+import keepsync_json as json_helpers
+import keepsync_notes as app
+
+
+class JsonHelperTests(unittest.TestCase):
+    def test_dumps_dataclasses_compactly_with_and_without_orjson(self):
+        items = [app.ChecklistItem(id="item-1", text="Café", checked=True, indent=1)]
+        expected = [{"id": "item-1", "text": "Café", "checked": True, "indent": 1}]
+
+        fast = json_helpers.json_dumps(items)
+        with mock.patch.object(json_helpers, "ORJSON_AVAILABLE", False):
+            fallback = json_helpers.json_dumps(items)
+            self.assertEqual(json_helpers.json_loads(fallback), expected)
+
+        self.assertEqual(json_helpers.json_loads(fast), expected)
+        self.assertNotIn(" ", fallback.replace("Café", ""))
+        self.assertIn("Café", fallback)
+
+    def test_non_string_keys_fall_back_to_stdlib(self):
+        self.assertEqual(json_helpers.json_loads(json_helpers.json_dumps({1: "one"})), {"1": "one"})
+
+    def test_dumps_bytes_matches_text_encoding(self):
+        value = {"title": "Café", "items": [app.ChecklistItem(id="item-1", text="a")]}
+
+        fast = json_helpers.json_dumps_bytes(value)
+        with mock.patch.object(json_helpers, "ORJSON_AVAILABLE", False):
+            fallback = json_helpers.json_dumps_bytes(value)
+
+        self.assertIsInstance(fast, bytes)
+        self.assertEqual(json_helpers.json_loads(fast), json_helpers.json_loads(fallback))
+        self.assertEqual(fallback, json_helpers.json_dumps(value).encode("utf-8"))
+
+    def test_compact_note_json_is_identical_with_and_without_orjson(self):
+        note = app.Note(id="n1", title="Café ✓", content="line\n\"quoted\"", labels=["a/b"],
+                        checklist_items=[app.ChecklistItem(id="i1", text="x")])
+
+        fast = json_helpers.json_dumps(note.to_dict())
+        with mock.patch.object(json_helpers, "ORJSON_AVAILABLE", False):
+            fallback = json_helpers.json_dumps(note.to_dict())
+
+        self.assertEqual(fast, fallback)
+
+    def test_dumps_pretty_is_identical_with_and_without_orjson(self):
+        value = {"title": "Café ✓", "labels": [], "items": [{"checked": True, "id": None}], "meta": {}}
+
+        fast = json_helpers.json_dumps_pretty(value)
+        with mock.patch.object(json_helpers, "ORJSON_AVAILABLE", False):
+            fallback = json_helpers.json_dumps_pretty(value)
+
+        self.assertEqual(fast, fallback)
+        self.assertTrue(fallback.startswith('{\n  "title": "Café ✓"'))
+
+    def test_dumps_pretty_bytes_matches_pretty_text(self):
+        value = {"title": "Café ✓", "labels": ["a"], "meta": {}}
+
+        fast = json_helpers.json_dumps_pretty_bytes(value)
+        with mock.patch.object(json_helpers, "ORJSON_AVAILABLE", False):
+            fallback = json_helpers.json_dumps_pretty_bytes(value)
+
+        self.assertEqual(fast, fallback)
+        self.assertEqual(fallback, json_helpers.json_dumps_pretty(value).encode("utf-8"))
+
+    def test_peek_reports_container_without_consuming_the_stream(self):
+        stream = io.BytesIO(b" \n\t" + b" " * 100 + b'[{"title": "a"}]')
+
+        self.assertEqual(json_helpers.peek_json_container(stream), "[")
+        self.assertEqual(stream.tell(), 0)
+        self.assertEqual(json_helpers.peek_json_container(io.BytesIO(b"")), "")
+
+    def test_iter_json_items_walks_prefix_without_ijson(self):
+        document = b'{"version": 1, "notes": [{"title": "a"}, {"title": "b"}]}'
+
+        with mock.patch.object(json_helpers, "IJSON_AVAILABLE", False):
+            wrapped = list(json_helpers.iter_json_items(io.BytesIO(document), "notes.item"))
+            listed = list(json_helpers.iter_json_items(io.BytesIO(b'[1, 2.5]')))
+            missing = list(json_helpers.iter_json_items(io.BytesIO(b'{"title": "x"}'), "notes.item"))
+
+        self.assertEqual(wrapped, [{"title": "a"}, {"title": "b"}])
+        self.assertEqual(listed, [1, 2.5])
+        self.assertEqual(missing, [])
+
+    @unittest.skipUnless(json_helpers.IJSON_AVAILABLE, "ijson is not installed")
+    def test_iter_json_items_streams_with_ijson(self):
+        items = json_helpers.iter_json_items(io.BytesIO(b'{"notes": [{"pinned": true, "score": 1.5}]}'), "notes.item")
+
+        self.assertEqual(list(items), [{"pinned": True, "score": 1.5}])
+
+    def test_app_reexports_json_helpers_for_compatibility(self):
+        self.assertIs(app.json_dumps, json_helpers.json_dumps)
+        self.assertIs(app.json_dumps_bytes, json_helpers.json_dumps_bytes)
+        self.assertIs(app.json_dumps_pretty, json_helpers.json_dumps_pretty)
+        self.assertIs(app.json_dumps_pretty_bytes, json_helpers.json_dumps_pretty_bytes)
+        self.assertIs(app.json_loads, json_helpers.json_loads)
+        self.assertIs(app.iter_json_items, json_helpers.iter_json_items)
+        self.assertIs(app.peek_json_container, json_helpers.peek_json_container)
+
+
+if __name__ == "__main__":
+    unittest.main()
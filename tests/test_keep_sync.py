@@ -0,0 +1,457 @@
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import keepsync_keep_sync as keep_sync
+import keepsync_notes as app
+
+
+class FakeLabels:
+    def __init__(self, names=()):
+        self.items = [SimpleNamespace(name=name) for name in names]
+
+    def all(self):
+        return list(self.items)
+
+    def add(self, label):
+        self.items.append(label)
+
+
+class FakeKeepNote:
+    def __init__(self, keep_id, title="", text="", labels=(), updated=None):
+        self.id = keep_id
+        self.title = title
+        self.text = text
+        self.items = []
+        self.labels = FakeLabels(labels)
+        self.pinned = False
+        self.archived = False
+        self.trashed = False
+        self.color = None
+        stamp = updated or datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.timestamps = SimpleNamespace(created=stamp, updated=stamp)
+
+
+class FakeKeep:
+    def __init__(self, notes=()):
+        self.notes = {note.id: note for note in notes}
+        self.created = 0
+        self.label_lookups = 0
+        self.label_scans = 0
+        self.keep_labels = []
+
+    def all(self):
+        return list(self.notes.values())
+
+    def get(self, keep_id):
+        return self.notes.get(keep_id)
+
+    def sync(self):
+        pass
+
+    def createNote(self, title, text):
+        self.created += 1
+        note = FakeKeepNote(f"created-{self.created}", title, text)
+        self.notes[note.id] = note
+        return note
+
+    def createList(self, title, items):
+        note = self.createNote(title, "")
+        note.items = list(items)
+        return note
+
+    def findLabel(self, name):
+        self.label_lookups += 1
+        return next((label for label in self.keep_labels if label.name.lower() == name.lower()), None)
+
+    def labels(self):
+        self.label_scans += 1
+        return list(self.keep_labels)
+
+    def createLabel(self, name):
+        label = SimpleNamespace(name=name)
+        self.keep_labels.append(label)
+        return label
+
+
+class KeepSyncEngineTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = app.DatabaseManager(str(Path(self.tmp.name) / "notes.db"))
+        self.engine = keep_sync.KeepSyncEngine(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def test_pull_creates_updates_and_skips_by_remote_timestamp(self):
+        older = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.engine.keep = FakeKeep([
+            FakeKeepNote("keep-a", "Alpha", "first", labels=["work"], updated=older),
+            FakeKeepNote("keep-b", "Beta", "second", updated=older),
+        ])
+
+        self.assertEqual(self.engine._pull_from_keep(), {"new": 2, "updated": 0, "skipped": 0})
+
+        self.engine.keep.notes["keep-a"].text = "changed"
+        self.engine.keep.notes["keep-a"].timestamps.updated = older + timedelta(hours=1)
+
+        self.assertEqual(self.engine._pull_from_keep(), {"new": 0, "updated": 1, "skipped": 1})
+        notes = {note.keep_id: note for note in self.db.get_all_notes()}
+        self.assertEqual(notes["keep-a"].content, "changed")
+        self.assertEqual(notes["keep-a"].labels, ["work"])
+        self.assertEqual(notes["keep-b"].sync_status, app.SyncStatus.SYNCED)
+
+    def test_pull_stamps_the_whole_batch_with_one_timestamp(self):
+        self.engine.keep = FakeKeep([FakeKeepNote(f"keep-{index}", f"Note {index}") for index in range(5)])
+
+        self.engine._pull_from_keep()
+
+        self.assertEqual(len({note.updated_at for note in self.db.get_all_notes()}), 1)
+
+    def test_pull_updates_changed_rows_in_place(self):
+        older = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.engine.keep = FakeKeep([FakeKeepNote("keep-a", "Alpha", "first", updated=older)])
+        self.engine._pull_from_keep()
+        rowid = self.db.conn.execute("SELECT rowid FROM notes WHERE keep_id = 'keep-a'").fetchone()[0]
+
+        self.engine.keep.notes["keep-a"].text = "changed"
+        self.engine.keep.notes["keep-a"].timestamps.updated = older + timedelta(hours=1)
+        self.engine._pull_from_keep()
+
+        row = self.db.conn.execute("SELECT rowid, content FROM notes WHERE keep_id = 'keep-a'").fetchone()
+        self.assertEqual(tuple(row), (rowid, "changed"))
+        self.assertEqual(
+            [row[0] for row in self.db.conn.execute("SELECT content FROM notes_fts WHERE notes_fts MATCH 'changed'")],
+            ["changed"],
+        )
+
+    def test_auto_sync_wait_counts_from_the_last_sync(self):
+        self.assertEqual(self.engine._seconds_until_next_sync(300), 300)
+
+        self.engine._last_sync_end = time.monotonic() - 120
+
+        self.assertAlmostEqual(self.engine._seconds_until_next_sync(300), 180, delta=5)
+        self.engine._last_sync_end = time.monotonic() - 600
+        self.assertEqual(self.engine._seconds_until_next_sync(300), 0)
+
+    def test_trigger_sync_wakes_the_auto_sync_loop(self):
+        calls = []
+        second = threading.Event()
+        self.engine.is_authenticated = True
+
+        def fake_sync():
+            calls.append(1)
+            if len(calls) == 2:
+                second.set()
+
+        self.engine.sync = fake_sync
+        self.engine.start_auto_sync(interval_minutes=60)
+        try:
+            self.engine.trigger_sync()
+            self.assertTrue(second.wait(5))
+        finally:
+            self.engine.stop_auto_sync()
+
+        self.assertFalse(self.engine._sync_thread.is_alive())
+
+    def test_pull_reads_linked_notes_with_one_index_query(self):
+        self.engine.keep = FakeKeep([FakeKeepNote(f"keep-{index}", f"Note {index}") for index in range(3)])
+        self.engine._pull_from_keep()
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        try:
+            stats = self.engine._pull_from_keep()
+        finally:
+            self.db.conn.set_trace_callback(None)
+
+        self.assertEqual(stats["skipped"], 3)
+        self.assertEqual(sum("FROM notes" in statement for statement in statements), 1)
+        self.assertEqual(set(self.db.get_sync_index()), {"keep-0", "keep-1", "keep-2"})
+
+    def test_pull_skips_unchanged_notes_without_materializing_rows(self):
+        self.engine.keep = FakeKeep([FakeKeepNote(f"keep-{index}", f"Note {index}") for index in range(3)])
+        self.engine._pull_from_keep()
+        built = []
+        original_row_to_note = self.db._row_to_note
+        self.db._row_to_note = lambda row: built.append(row) or original_row_to_note(row)
+
+        stats = self.engine._pull_from_keep()
+
+        self.assertEqual(stats["skipped"], 3)
+        self.assertEqual(built, [])
+
+    def test_pull_loads_changed_locals_with_one_bulk_query(self):
+        older = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.engine.keep = FakeKeep([FakeKeepNote(f"keep-{index}", f"Note {index}", updated=older) for index in range(3)])
+        self.engine._pull_from_keep()
+        for keep_note in self.engine.keep.all():
+            keep_note.text = "edited"
+            keep_note.timestamps.updated = older + timedelta(hours=1)
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        try:
+            stats = self.engine._pull_from_keep()
+        finally:
+            self.db.conn.set_trace_callback(None)
+
+        self.assertEqual(stats["updated"], 3)
+        self.assertEqual(sum("WHERE id IN" in statement for statement in statements), 1)
+        self.assertFalse(any("WHERE id = " in statement and "SELECT" in statement for statement in statements))
+
+    def test_pull_records_reemitted_unchanged_notes_without_rewriting_rows(self):
+        older = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        newer = older + timedelta(hours=1)
+        self.engine.keep = FakeKeep([FakeKeepNote("keep-a", "Alpha", "same", labels=["work"], updated=older)])
+        self.engine._pull_from_keep()
+        self.engine.keep.notes["keep-a"].timestamps.updated = newer
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        try:
+            stats = self.engine._pull_from_keep()
+        finally:
+            self.db.conn.set_trace_callback(None)
+
+        self.assertEqual(stats, {"new": 0, "updated": 0, "skipped": 1})
+        self.assertFalse(any("INSERT INTO notes" in statement for statement in statements))
+        self.assertEqual(self.db.get_sync_index()["keep-a"][2], newer)
+
+    def test_pull_keeps_unchanged_checklists_and_their_item_ids(self):
+        older = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        keep_note = FakeKeepNote("keep-list", "Groceries", updated=older)
+        keep_note.items = [SimpleNamespace(text="milk", checked=False), SimpleNamespace(text="eggs", checked=True)]
+        self.engine.keep = FakeKeep([keep_note])
+        self.engine._pull_from_keep()
+        ids = [item.id for item in self.db.get_all_notes()[0].checklist_items]
+
+        keep_note.timestamps.updated = older + timedelta(hours=1)
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        try:
+            stats = self.engine._pull_from_keep()
+        finally:
+            self.db.conn.set_trace_callback(None)
+
+        self.assertEqual(stats, {"new": 0, "updated": 0, "skipped": 1})
+        self.assertFalse(any("INSERT INTO notes" in statement for statement in statements))
+        self.assertEqual([item.id for item in self.db.get_all_notes()[0].checklist_items], ids)
+
+        keep_note.items[0].checked = True
+        keep_note.timestamps.updated = older + timedelta(hours=2)
+        self.assertEqual(self.engine._pull_from_keep()["updated"], 1)
+        items = self.db.get_all_notes()[0].checklist_items
+        self.assertTrue(items[0].checked)
+        self.assertEqual(items[1].id, ids[1])
+
+    def test_pull_converts_each_changed_note_once(self):
+        older = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.engine.keep = FakeKeep([FakeKeepNote("keep-a", "Alpha", "first", labels=["work"], updated=older)])
+        self.engine._pull_from_keep()
+        created_at = self.db.get_all_notes()[0].created_at
+        keep_note = self.engine.keep.notes["keep-a"]
+        keep_note.text = "changed"
+        keep_note.timestamps.updated = older + timedelta(hours=1)
+
+        with mock.patch.object(keep_note.labels, "all", wraps=keep_note.labels.all) as labels_all:
+            self.assertEqual(self.engine._pull_from_keep()["updated"], 1)
+
+        self.assertEqual(labels_all.call_count, 1)
+        notes = self.db.get_all_notes()
+        self.assertEqual(len(notes), 1)
+        self.assertEqual((notes[0].content, notes[0].created_at), ("changed", created_at))
+
+    def test_failed_batch_save_retries_notes_individually(self):
+        self.engine.keep = FakeKeep([FakeKeepNote(f"keep-{index}", f"Note {index}") for index in range(3)])
+        original_save_note = self.db.save_note
+        self.db.save_notes = lambda notes: False
+        self.db.save_note = lambda note: note.keep_id != "keep-1" and original_save_note(note)
+
+        stats = self.engine._pull_from_keep()
+
+        self.assertEqual(stats["new"], 2)
+        self.assertEqual(sorted(note.keep_id for note in self.db.get_all_notes()), ["keep-0", "keep-2"])
+        logged = self.db.conn.execute("SELECT note_id FROM sync_log WHERE status = 'error'").fetchall()
+        self.assertEqual([row[0] for row in logged], ["keep-1"])
+
+    def test_push_records_sync_state_in_one_bulk_update(self):
+        self.engine.keep = FakeKeep()
+        for index in range(3):
+            self.db.save_note(app.Note(id=f"local-{index}", title=f"Local {index}", content="body"))
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        try:
+            stats = self.engine._push_to_keep()
+        finally:
+            self.db.conn.set_trace_callback(None)
+
+        self.assertEqual(stats["created"], 3)
+        self.assertEqual(sum(statement.startswith("UPDATE notes SET keep_id") for statement in statements), 3)
+        self.assertEqual(statements.count("COMMIT"), 1)
+        notes = self.db.get_all_notes()
+        self.assertTrue(all(note.keep_id and note.sync_status == app.SyncStatus.SYNCED for note in notes))
+        self.assertTrue(all(note.remote_modified for note in notes))
+
+    def test_push_unlinks_notes_deleted_in_keep(self):
+        self.engine.keep = FakeKeep([FakeKeepNote("keep-live", "Live")])
+        for note_id, keep_id in (("live", "keep-live"), ("gone", "keep-gone")):
+            self.db.save_note(app.Note(
+                id=note_id, title="Local", content="edited", keep_id=keep_id,
+                sync_status=app.SyncStatus.PENDING_PUSH,
+            ))
+
+        stats = self.engine._push_to_keep()
+
+        self.assertEqual((stats["updated"], stats["unlinked"]), (1, 1))
+        self.assertEqual(self.db.get_note("live").sync_status, app.SyncStatus.SYNCED)
+        gone = self.db.get_note("gone")
+        self.assertEqual(gone.sync_status, app.SyncStatus.DELETED_REMOTE)
+        self.assertEqual(gone.content, "edited")
+        self.assertEqual(self.engine._push_to_keep()["unlinked"], 0)
+
+    def test_sync_reports_notes_unlinked_during_push(self):
+        self.engine.keep = FakeKeep()
+        self.engine.is_authenticated = True
+        notices = []
+        self.engine.add_sync_callback(lambda status, message: notices.append((status, message)))
+        with mock.patch.object(self.engine, "_pull_from_keep", return_value={}), \
+                mock.patch.object(self.engine, "_push_to_keep", return_value={"created": 0, "updated": 1, "unlinked": 2}), \
+                mock.patch.object(keep_sync, "LocalBackupManager"):
+            success, message, stats = self.engine.sync()
+
+        self.assertTrue(success)
+        self.assertEqual(stats["unlinked"], 2)
+        self.assertIn("2 deleted in Keep", message)
+        self.assertEqual(notices[-1], ("synced", "Synced: ↓0 ↑1 (2 deleted in Keep, kept locally as unlinked)"))
+
+    def test_push_resolves_each_label_once(self):
+        self.engine.keep = FakeKeep()
+        existing = self.engine.keep.createLabel("work")
+        for index in range(3):
+            self.db.save_note(app.Note(id=f"local-{index}", title="Local", content="", labels=["Work", "home"]))
+
+        self.engine._push_to_keep()
+
+        self.assertEqual(self.engine.keep.label_scans, 1)
+        self.assertEqual(self.engine.keep.label_lookups, 0)
+        self.assertEqual([label.name for label in self.engine.keep.keep_labels], ["work", "home"])
+        created = self.engine.keep.all()
+        self.assertIs(created[0].labels.items[0], existing)
+        self.assertIs(created[0].labels.items[1], created[1].labels.items[1])
+
+    def test_pending_push_skips_synced_and_trashed_notes(self):
+        self.db.save_note(app.Note(id="local", title="Local", content=""))
+        self.db.save_note(app.Note(id="pending", title="Pending", content="", sync_status=app.SyncStatus.PENDING_PUSH))
+        self.db.save_note(app.Note(id="synced", title="Synced", content="", sync_status=app.SyncStatus.SYNCED))
+        self.db.save_note(app.Note(id="trashed", title="Trashed", content="", trashed=True))
+
+        self.assertEqual(sorted(note.id for note in self.db.iter_notes_pending_push()), ["local", "pending"])
+
+    def test_notes_by_ids_chunks_large_requests(self):
+        self.db.ID_QUERY_CHUNK_SIZE = 2
+        for index in range(5):
+            self.db.save_note(app.Note(id=f"note-{index}", title=str(index), content=""))
+
+        notes = self.db.get_notes_by_ids(["note-0", "note-4", "missing", "note-2", "note-3", "note-1"])
+
+        self.assertEqual(sorted(notes), [f"note-{index}" for index in range(5)])
+
+    def test_sync_index_query_is_served_by_covering_index(self):
+        plan = self.db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT keep_id, id, content_hash, remote_modified FROM notes WHERE keep_id IS NOT NULL"
+        ).fetchall()
+
+        self.assertIn("COVERING INDEX idx_notes_keep_sync", " ".join(row[-1] for row in plan))
+
+    def test_pull_flushes_in_batches(self):
+        original_batch_size = keep_sync.PULL_SAVE_BATCH_SIZE
+        keep_sync.PULL_SAVE_BATCH_SIZE = 2
+        self.addCleanup(setattr, keep_sync, "PULL_SAVE_BATCH_SIZE", original_batch_size)
+        self.engine.keep = FakeKeep([FakeKeepNote(f"keep-{index}", f"Note {index}") for index in range(5)])
+
+        stats = self.engine._pull_from_keep()
+
+        self.assertEqual(stats["new"], 5)
+        self.assertEqual(len(self.db.get_all_notes()), 5)
+
+
+
+class BrowserCookieTests(unittest.TestCase):
+    def test_collect_keep_cookies_stops_once_all_names_are_found(self):
+        seen = []
+
+        def jar():
+            for name in ("NID", "SID", "HSID", "SSID", "APISID", "SAPISID", "LATE"):
+                seen.append(name)
+                yield SimpleNamespace(name=name, value=f"{name}-value")
+
+        found = keep_sync._collect_keep_cookies(jar(), {})
+
+        self.assertEqual(set(found), keep_sync._KEEP_COOKIE_NAMES)
+        self.assertNotIn("LATE", seen)
+        self.assertIs(keep_sync._collect_keep_cookies(jar(), found), found)
+        self.assertEqual(seen.count("NID"), 1)
+
+
+class KeepWebScraperTests(unittest.TestCase):
+    def test_missing_browser_cookie3_is_probed_once(self):
+        keep_sync._optional_module.cache_clear()
+        self.addCleanup(keep_sync._optional_module.cache_clear)
+        with mock.patch.object(keep_sync.importlib, "import_module", side_effect=ImportError) as import_module:
+            first = keep_sync.KeepWebScraper().authenticate_from_browser()
+            second = keep_sync.KeepWebScraper().authenticate_from_browser()
+
+        self.assertFalse(first[0])
+        self.assertEqual(first, second)
+        self.assertEqual(import_module.call_count, 1)
+
+    def test_fetch_notes_parses_html_fallback(self):
+        html = (
+            '<div data-id="n1" class="note"><div class="title">Groceries</div>'
+            '<div class="content">Milk</div></div>'
+        )
+        scraper = keep_sync.KeepWebScraper()
+        scraper.is_authenticated = True
+        scraper.session = SimpleNamespace(get=lambda url, timeout: SimpleNamespace(status_code=200, text=html))
+
+        ok, _, notes = scraper.fetch_notes()
+
+        self.assertTrue(ok)
+        self.assertEqual(notes, [{"id": "n1", "title": "Groceries", "content": "Milk", "type": "note"}])
+
+
+    def test_note_html_parser_handles_nested_markup_and_void_tags(self):
+        html = (
+            '<main><div data-id="n1"><img src="x"><div class="note-title">Trip <b>plan</b></div>'
+            '<div class="note-content">Pack<br>bags &amp; go</div></div>'
+            '<div data-id="no-content"><div class="title">Orphan</div></div>'
+            '<div data-id="n2"><div class="content">Only body</div></div></main>'
+        )
+
+        self.assertEqual(
+            keep_sync._parse_keep_note_html(html),
+            [("n1", "Trip plan", "Packbags & go"), ("n2", "", "Only body")],
+        )
+
+    def test_fetch_notes_skips_malformed_embedded_payloads(self):
+        html = (
+            "<script>AF_initDataCallback({key: 'ds:0', data:[oops]});</script>"
+            "<script>AF_initDataCallback({key: 'ds:1', data:[[\"n1\",\"Title\",\"Body\"]]});</script>"
+        )
+        scraper = keep_sync.KeepWebScraper()
+        scraper.is_authenticated = True
+        scraper.session = SimpleNamespace(get=lambda url, timeout: SimpleNamespace(status_code=200, text=html))
+
+        with mock.patch.object(keep_sync, "json_loads", wraps=keep_sync.json_loads) as loads:
+            _, message, _ = scraper.fetch_notes()
+
+        self.assertNotIn("Error fetching notes", message)
+        self.assertEqual(loads.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
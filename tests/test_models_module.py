@@ -1,5 +1,7 @@
 import unittest
+from unittest import mock
 
+import keepsync_json
 import keepsync_models as models
 import keepsync_notes as app
 
@@ -34,6 +36,53 @@ class ModelsModuleTests(unittest.TestCase):
         self.assertEqual(round_tripped.attachments[0].mime_type, "image/png")
         self.assertEqual(round_tripped.content_hash, note.content_hash)
 
+    def test_content_hash_tracks_checklist_and_label_changes(self):
+        note = models.Note(
+            id="note-1",
+            title="Groceries",
+            content="",
+            note_type=models.NoteType.CHECKLIST,
+            checklist_items=[models.ChecklistItem(id="item-1", text="Milk")],
+            labels=["home"],
+        )
+        original_hash = note.content_hash
+
+        note.checklist_items[0].checked = True
+        note.update_hash()
+        checked_hash = note.content_hash
+        note.labels = ["home", "errands"]
+        note.update_hash()
+
+        self.assertEqual(len(original_hash), 32)
+        self.assertNotEqual(checked_hash, original_hash)
+        self.assertNotEqual(note.content_hash, checked_hash)
+
+    def test_preview_truncates_content_and_checklists(self):
+        text = models.Note(id="n1", title="", content="x" * 151)
+        checklist = models.Note(
+            id="n2", title="", content="", note_type=models.NoteType.CHECKLIST,
+            checklist_items=[models.ChecklistItem(text=f"item {i}", checked=i == 0, indent=i) for i in range(5)],
+        )
+
+        self.assertEqual(text.preview, "x" * 150 + "...")
+        self.assertEqual(models.Note(id="n3", title="", content="short").preview, "short")
+        self.assertEqual(checklist.preview, "[x] item 0\n  [ ] item 1\n    [ ] item 2\n  +2 more...")
+
+    def test_content_hash_does_not_depend_on_orjson(self):
+        note = models.Note(
+            id="hash",
+            title="Hash",
+            content="",
+            note_type=models.NoteType.CHECKLIST,
+            checklist_items=[models.ChecklistItem(id="item", text="Café", checked=True, indent=1)],
+        )
+        fast_hash = note.content_hash
+
+        with mock.patch.object(keepsync_json, "ORJSON_AVAILABLE", False):
+            note.update_hash()
+
+        self.assertEqual(note.content_hash, fast_hash)
+
     def test_color_and_filename_helpers_are_standalone(self):
         self.assertEqual(models.normalize_keep_color("ColorValue.Dark Blue"), "darkblue")
         self.assertEqual(models.keep_color_name("dark_blue"), "Dark blue")
@@ -46,5 +95,25 @@ class ModelsModuleTests(unittest.TestCase):
         self.assertEqual(models.Label.from_dict(label.to_dict()), label)
 
 
+    def test_models_use_slots(self):
+        note = models.Note(id="slots", title="Slots", content="", checklist_items=[models.ChecklistItem(text="a")])
+
+        self.assertFalse(hasattr(note, "__dict__"))
+        self.assertFalse(hasattr(note.checklist_items[0], "__dict__"))
+        with self.assertRaises(AttributeError):
+            note.not_a_field = True
+        note.unsupported_fields = ["location"]
+        self.assertEqual(models.Note.from_dict(note.to_dict()), note)
+
+    def test_note_from_dict_applies_overrides_at_construction(self):
+        data = models.Note(id="orig", title="Synced", content="", keep_id="keep-1", sync_status=models.SyncStatus.SYNCED).to_dict()
+        del data["id"]
+
+        note = models.Note.from_dict(data, id="fresh", keep_id=None, sync_status=models.SyncStatus.LOCAL_ONLY)
+
+        self.assertEqual((note.id, note.keep_id, note.sync_status), ("fresh", None, models.SyncStatus.LOCAL_ONLY))
+        self.assertEqual(note.title, "Synced")
+
+
 if __name__ == "__main__":
     unittest.main()
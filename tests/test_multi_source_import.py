@@ -69,6 +69,7 @@ class MultiSourceImporterTests(unittest.TestCase):
             ]
         }
         with zipfile.ZipFile(export_path, "w") as zf:
+            zf.writestr("broken.json", "{not json")
             zf.writestr("notes.json", json.dumps(payload))
 
         notes = self.importer.import_simplenote_export(export_path)
@@ -97,6 +98,30 @@ class MultiSourceImporterTests(unittest.TestCase):
         self.assertTrue(notes[0].pinned)
         self.assertIn("keep-label", notes[0].labels)
 
+    def test_takeout_folder_parses_files_on_a_pool_in_file_order(self):
+        folder = self.root / "Keep"
+        folder.mkdir()
+        for index in range(12):
+            (folder / f"note-{index:02}.json").write_text(json.dumps({"title": f"Note {index}", "textContent": ""}))
+        (folder / "note-99.json").write_text("{broken")
+        progress = []
+        importer = importers.MultiSourceImporter(self.db, progress_callback=lambda message, current, total: progress.append(current))
+
+        notes = importer.import_takeout_folder(folder)
+
+        self.assertEqual([note.title for note in notes], [f"Note {index}" for index in range(12)])
+        self.assertEqual(progress, list(range(1, 14)))
+
+    def test_takeout_folder_reads_smallest_files_first(self):
+        folder = self.root / "Keep"
+        folder.mkdir()
+        for name, body in (("a.json", "x" * 500), ("b.json", ""), ("c.json", "x" * 50)):
+            (folder / name).write_text(json.dumps({"title": name, "textContent": body}))
+
+        notes = importers.MultiSourceImporter(self.db).import_takeout_folder(folder)
+
+        self.assertEqual([note.title for note in notes], ["b.json", "c.json", "a.json"])
+
     def test_rejects_zip_path_traversal(self):
         export_path = self.root / "traversal.zip"
         with zipfile.ZipFile(export_path, "w") as zf:
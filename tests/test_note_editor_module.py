@@ -1,4 +1,6 @@
 import unittest
+from types import SimpleNamespace
+from unittest import mock
 
 import keepsync_note_editor as editor
 import keepsync_note_text as note_text
@@ -16,6 +18,195 @@ class NoteEditorModuleTests(unittest.TestCase):
         self.assertIs(app.markdown_preview_blocks, note_text.markdown_preview_blocks)
         self.assertIs(app.markdown_preview_text, note_text.markdown_preview_text)
 
+    def test_pin_button_reconfigures_only_when_pin_state_changes(self):
+        pin_btn = mock.Mock()
+        panel = SimpleNamespace(pin_btn=pin_btn, _pin_icon_pinned=False)
+
+        for pinned in (False, True, True, False):
+            editor.NoteEditor._show_pin_state(panel, pinned)
+
+        images = [call.kwargs["image"] for call in pin_btn.configure.call_args_list]
+        self.assertEqual(len(images), 2)
+        self.assertIs(images[0], editor.IconManager.get_icon("pin", 18, editor.COLORS["accent_yellow"]))
+        self.assertIs(images[1], editor.IconManager.get_icon("pin", 18, editor.COLORS["text_secondary"]))
+
+    def test_checklist_rows_repack_in_order_with_indentation(self):
+        rows = [SimpleNamespace(indent=indent, pack=mock.Mock(), pack_forget=mock.Mock()) for indent in (0, 2)]
+        panel = SimpleNamespace(checklist_items_widgets=rows, _pack_checklist_item=editor.NoteEditor._pack_checklist_item)
+
+        editor.NoteEditor._repack_checklist_items(panel)
+
+        for row in rows:
+            row.pack_forget.assert_called_once_with()
+        rows[1].pack.assert_called_once_with(fill="x", pady=2, padx=(52, 4))
+
+    def test_label_edits_touch_only_their_own_chip(self):
+        chips = {"home": mock.Mock()}
+        panel = SimpleNamespace(
+            current_note=app.Note(id="n1", title="", content="", labels=["home"]),
+            _label_chips=chips,
+            label_entry=mock.Mock(get=mock.Mock(return_value=" work ")),
+            _make_label_chip=mock.Mock(side_effect=lambda label: mock.Mock(name=label)),
+            _refresh_markdown_controls=mock.Mock(),
+            _on_modify=mock.Mock(),
+        )
+        panel._ensure_current_note = lambda: panel.current_note
+        home_chip = chips["home"]
+
+        editor.NoteEditor._add_label(panel)
+        editor.NoteEditor._remove_label(panel, "home")
+
+        panel._make_label_chip.assert_called_once_with("work")
+        home_chip.destroy.assert_called_once_with()
+        self.assertEqual(list(chips), ["work"])
+        self.assertEqual(panel.current_note.labels, ["work"])
+
+    def test_reloading_labels_destroys_tracked_chips_without_querying_tk(self):
+        old_chip = mock.Mock()
+        panel = SimpleNamespace(
+            labels_display=mock.Mock(),
+            _label_chips={"home": old_chip},
+            _make_label_chip=mock.Mock(side_effect=lambda label: mock.Mock(name=label)),
+            _refresh_markdown_controls=mock.Mock(),
+        )
+
+        editor.NoteEditor._load_labels(panel, ["work", "later"])
+
+        old_chip.destroy.assert_called_once_with()
+        panel.labels_display.winfo_children.assert_not_called()
+        self.assertEqual(list(panel._label_chips), ["work", "later"])
+
+    def test_checklist_entries_are_read_in_one_tcl_call(self):
+        def row(path, placeholder):
+            entry = SimpleNamespace(_entry=SimpleNamespace(_w=path), _placeholder_text_active=placeholder)
+            return SimpleNamespace(entry=entry)
+
+        tk = mock.Mock(eval=mock.Mock(return_value="{buy milk} {List item}"), splitlist=lambda value: ("buy milk", "List item"))
+        panel = SimpleNamespace(tk=tk, checklist_items_widgets=[row(".a.!entry", False), row(".b.!entry", True)])
+
+        texts = editor.NoteEditor._checklist_entry_texts(panel)
+
+        tk.eval.assert_called_once_with("list [.a.!entry get] [.b.!entry get]")
+        self.assertEqual(texts, ["buy milk", ""])
+        self.assertEqual(editor.NoteEditor._checklist_entry_texts(SimpleNamespace(tk=tk, checklist_items_widgets=[])), [])
+
+    def test_new_note_is_created_on_first_keystroke(self):
+        panel = SimpleNamespace(current_note=None, is_modified=False, tk=mock.Mock(), _modify_tag="NoteEditorModify1")
+        panel._ensure_current_note = lambda: editor.NoteEditor._ensure_current_note(panel)
+
+        editor.NoteEditor._on_modify(panel)
+        self.assertIsNone(panel.current_note)
+        self.assertTrue(panel.is_modified)
+
+        editor.NoteEditor._on_modify(panel, SimpleNamespace())
+        note = panel.current_note
+        editor.NoteEditor._on_modify(panel, SimpleNamespace())
+
+        self.assertIs(panel.current_note, note)
+        self.assertEqual(note.sync_status, app.SyncStatus.LOCAL_ONLY)
+        self.assertEqual((note.title, note.content), ("", ""))
+
+    def test_checklist_editor_is_built_on_first_switch_to_checklist(self):
+        panel = SimpleNamespace(
+            checklist_frame=None,
+            text_frame=mock.Mock(),
+            note_type_var=mock.Mock(get=mock.Mock(return_value="note")),
+            _refresh_markdown_controls=mock.Mock(),
+            _on_modify=mock.Mock(),
+        )
+        panel._build_checklist_ui = mock.Mock(side_effect=lambda: setattr(panel, "checklist_frame", mock.Mock()) or panel.checklist_frame)
+
+        editor.NoteEditor._on_type_change(panel)
+        panel._build_checklist_ui.assert_not_called()
+
+        panel.note_type_var.get.return_value = "checklist"
+        editor.NoteEditor._on_type_change(panel)
+        editor.NoteEditor._on_type_change(panel)
+
+        panel._build_checklist_ui.assert_called_once_with()
+        self.assertEqual(panel.checklist_frame.tkraise.call_count, 2)
+        panel.text_frame.tkraise.assert_called_once_with()
+        panel.text_frame.pack_forget.assert_not_called()
+        panel.checklist_frame.pack.assert_not_called()
+
+    def test_keystroke_binding_is_dropped_once_modified_and_rearmed_on_reset(self):
+        tk = mock.Mock()
+        panel = SimpleNamespace(
+            current_note=app.Note(id="n1", title="", content=""),
+            is_modified=False,
+            tk=tk,
+            _modify_tag="NoteEditorModify1",
+            _modify_script="handler",
+        )
+        panel._ensure_current_note = lambda: panel.current_note
+
+        for _ in range(3):
+            editor.NoteEditor._on_modify(panel, SimpleNamespace())
+        editor.NoteEditor._clear_modified(panel)
+
+        self.assertFalse(panel.is_modified)
+        self.assertEqual(
+            tk.call.call_args_list,
+            [
+                mock.call("bind", "NoteEditorModify1", "<KeyRelease>", ""),
+                mock.call("bind", "NoteEditorModify1", "<KeyRelease>", "handler"),
+            ],
+        )
+
+    def test_finished_background_save_updates_only_the_note_still_shown(self):
+        note = app.Note(id="n1", title="", content="", sync_status=app.SyncStatus.PENDING_PUSH)
+        panel = SimpleNamespace(
+            current_note=note,
+            winfo_exists=mock.Mock(return_value=True),
+            sync_badge=mock.Mock(),
+            on_save_callback=mock.Mock(),
+            _on_modify=mock.Mock(),
+        )
+
+        editor.NoteEditor._finish_save(panel, note, True)
+        panel.current_note = app.Note(id="n2", title="", content="")
+        editor.NoteEditor._finish_save(panel, note, True)
+        with mock.patch.object(editor.messagebox, "showerror") as showerror, \
+                mock.patch.object(editor, "log_diagnostic_event") as log_event:
+            editor.NoteEditor._finish_save(panel, note, False)
+
+        panel.sync_badge.update_status.assert_called_once_with(app.SyncStatus.PENDING_PUSH)
+        self.assertEqual(panel.on_save_callback.call_args_list, [mock.call(note), mock.call(note)])
+        panel._on_modify.assert_not_called()
+        # A failed save of a note no longer shown is reported, since the editor cannot flag it
+        showerror.assert_called_once_with("Save Failed", 'Your latest changes to "Untitled" could not be saved.')
+        log_event.assert_called_once_with("error", "Failed to save note n1")
+
+        panel.current_note = note
+        with mock.patch.object(editor.messagebox, "showerror") as showerror, \
+                mock.patch.object(editor, "log_diagnostic_event"):
+            editor.NoteEditor._finish_save(panel, note, False)
+        panel._on_modify.assert_called_once_with()
+        showerror.assert_not_called()
+
+    def test_background_save_is_polled_from_the_ui_thread(self):
+        root = mock.Mock()
+        note = app.Note(id="n1", title="", content="")
+        save = editor.Future()
+        panel = SimpleNamespace(SAVE_POLL_MS=15, _finish_save=mock.Mock())
+        panel._poll_save = lambda *args: editor.NoteEditor._poll_save(panel, *args)
+
+        editor.NoteEditor._poll_save(panel, root, note, save)
+        root.after.assert_called_once_with(15, panel._poll_save, root, note, save)
+        panel._finish_save.assert_not_called()
+
+        save.set_result(True)
+        editor.NoteEditor._poll_save(panel, root, note, save)
+        panel._finish_save.assert_called_once_with(note, True)
+
+    def test_modification_tracking_prepends_the_editor_bindtag_to_inner_widgets(self):
+        inner = mock.Mock(bindtags=mock.Mock(return_value=(".entry", "Entry", ".", "all")))
+        panel = SimpleNamespace(_modify_tag="NoteEditorModify1")
+
+        editor.NoteEditor._track_modifications(panel, SimpleNamespace(_entry=inner))
+
+        inner.bindtags.assert_called_with(("NoteEditorModify1", ".entry", "Entry", ".", "all"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,70 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import keepsync_notes as app
+
+
+class NoteLabelIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.tmp.name) / "notes.db")
+        self.db = app.DatabaseManager(self.db_path)
+
+    def tearDown(self):
+        if self.db:
+            self.db.close()
+        self.tmp.cleanup()
+
+    def test_notes_by_label_uses_exact_label_matches(self):
+        self.db.save_note(app.Note(id="work", title="Work", content="", labels=["Work"]))
+        self.db.save_note(app.Note(id="homework", title="Homework", content="", labels=["Homework"]))
+        self.db.save_note(app.Note(id="both", title="Both", content="", labels=["Homework", "Work"]))
+
+        self.assertEqual(sorted(note.id for note in self.db.get_notes_by_label("Work")), ["both", "work"])
+        self.assertEqual(sorted(note.id for note in self.db.get_notes_by_label("work")), ["both", "work"])
+
+    def test_label_rows_follow_edits_trash_and_permanent_delete(self):
+        note = app.Note(id="note", title="Note", content="", labels=["old"])
+        self.db.save_note(note)
+        note.labels = ["new"]
+        self.db.save_note(note)
+
+        self.assertEqual(self.db.get_notes_by_label("old"), [])
+        self.assertEqual([found.id for found in self.db.get_notes_by_label("new")], ["note"])
+
+        self.db.delete_note("note")
+        self.assertEqual(self.db.get_notes_by_label("new"), [])
+
+        self.db.delete_note("note", permanent=True)
+        count = self.db.conn.execute("SELECT COUNT(*) FROM note_labels").fetchone()[0]
+        self.assertEqual(count, 0)
+
+    def test_existing_database_is_backfilled_on_open(self):
+        self.db.save_note(app.Note(id="legacy", title="Legacy", content="", labels=["archive-me"]))
+        self.db.conn.execute("DROP TABLE note_labels")
+        self.db.conn.commit()
+        self.db.close()
+
+        self.db = app.DatabaseManager(self.db_path)
+
+        self.assertEqual([note.id for note in self.db.get_notes_by_label("archive-me")], ["legacy"])
+
+    def test_join_table_is_indexed_by_label(self):
+        indexes = {
+            row[1] for row in self.db.conn.execute("PRAGMA index_list(note_labels)").fetchall()
+        }
+
+        self.assertIn("idx_note_labels_label", indexes)
+
+
+    def test_ensure_labels_creates_missing_labels_once(self):
+        self.db.ensure_label("Work")
+
+        self.assertTrue(self.db.ensure_labels(["Work", " Home ", "", "Home", None]))
+
+        self.assertEqual([label.name for label in self.db.get_all_labels()], ["Home", "Work"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,10 +14,10 @@ class SavedSearchFilteringTests(unittest.TestCase):
         self.db.close()
         self.tmp.cleanup()
 
-    def make_view(self, query="", filters=None):
+    def make_view(self, query="", filters=None, current_filter="saved:test"):
         view = object.__new__(app.KeepSyncNotesApp)
         view.db = self.db
-        view.current_filter = "saved:test"
+        view.current_filter = current_filter
         view.search_query = query
         view.advanced_filters = dict(app.default_advanced_filters())
         view.advanced_filters.update(filters or {})
@@ -60,6 +60,35 @@ class SavedSearchFilteringTests(unittest.TestCase):
 
         self.assertEqual([note.id for note in results], ["archived-hit"])
 
+    def test_archive_and_trash_views_query_only_their_notes(self):
+        self.db.save_note(app.Note(id="live", title="Live roadmap", content=""))
+        self.db.save_note(app.Note(id="shelved", title="Shelved roadmap", content="", archived=True))
+        self.db.save_note(app.Note(id="binned", title="Binned roadmap", content="", trashed=True))
+        self.db.save_note(app.Note(id="both", title="Archived then binned", content="", archived=True, trashed=True))
+
+        def ids(current_filter, query=""):
+            view = self.make_view(query=query, current_filter=current_filter)
+            return sorted(note.id for note in view._get_filtered_notes_for_current_view())
+
+        self.assertEqual(ids("archived"), ["shelved"])
+        self.assertEqual(ids("archived", "roadmap"), ["shelved"])
+        self.assertEqual(ids("trash"), ["binned", "both"])
+        self.assertEqual(ids("trash", "roadmap"), ["binned"])
+
+    def test_trash_and_label_searches_match_in_sql(self):
+        self.db.save_note(app.Note(id="plan", title="Q3 PLAN", content="", labels=["work"], trashed=True))
+        self.db.save_note(app.Note(id="pct", title="", content="100% done", labels=["work"]))
+        self.db.save_note(app.Note(id="other", title="", content="1000 done", labels=["work"]))
+
+        def ids(current_filter, query):
+            view = self.make_view(query=query, current_filter=current_filter)
+            return sorted(note.id for note in view._get_filtered_notes_for_current_view())
+
+        self.assertEqual(ids("trash", "plan"), ["plan"])
+        self.assertEqual(ids("trash", "missing"), [])
+        self.assertEqual(ids("label:work", "0%"), ["pct"])
+        self.assertEqual(ids("label:work", "DONE"), ["other", "pct"])
+
 
 if __name__ == "__main__":
     unittest.main()
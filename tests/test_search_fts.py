@@ -1,7 +1,10 @@
+import hashlib
+import sqlite3
 import tempfile
 import unittest
 from pathlib import Path
 
+import keepsync_cloud_plan as cloud_plan
 import keepsync_notes as app
 import keepsync_storage as storage
 
@@ -29,9 +32,88 @@ class SearchFtsTests(unittest.TestCase):
         self.assertEqual([note.id for note in content_results], ["alpha"])
         self.assertEqual([note.id for note in label_results], ["alpha"])
 
+    def test_database_uses_wal_journal(self):
+        self.assertEqual(self.db.journal_mode, "wal")
+        self.assertEqual(self.db.conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
     def test_app_reexports_storage_api_for_compatibility(self):
         self.assertIs(app.DatabaseManager, storage.DatabaseManager)
 
+    def test_search_stems_terms_and_keeps_unicode_words(self):
+        self.db.save_note(app.Note(id="stem", title="Errands", content="Running to the café"))
+
+        self.assertEqual([note.id for note in self.db.search_notes("runs")], ["stem"])
+        self.assertEqual([note.id for note in self.db.search_notes("café")], ["stem"])
+
+    def test_reopening_database_preserves_index_without_rebuild(self):
+        self.db.save_note(app.Note(id="persist", title="Persist", content="needle"))
+        self.db.close()
+
+        self.db = storage.DatabaseManager(self.db.db_path)
+
+        self.assertFalse(self.db._fts_needs_rebuild(self.db.conn.cursor()))
+        self.assertEqual([note.id for note in self.db.search_notes("needle")], ["persist"])
+
+    def test_note_summaries_skip_heavy_columns(self):
+        self.db.save_note(app.Note(
+            id="summary",
+            title="Groceries",
+            content="x" * 500,
+            note_type=app.NoteType.CHECKLIST,
+            checklist_items=[app.ChecklistItem(text="Milk")],
+            labels=["home"],
+            pinned=True,
+        ))
+        self.db.save_note(app.Note(id="gone", title="Gone", content="", trashed=True))
+
+        summaries = self.db.get_all_note_summaries()
+
+        self.assertEqual([summary.id for summary in summaries], ["summary"])
+        summary = summaries[0]
+        self.assertIsInstance(summary, app.NoteSummary)
+        self.assertEqual(len(summary.snippet), self.db.SUMMARY_SNIPPET_LENGTH)
+        self.assertEqual(summary.labels, ["home"])
+        self.assertTrue(summary.pinned)
+        self.assertEqual(summary.note_type, app.NoteType.CHECKLIST)
+        self.assertEqual(self.db.get_note("summary").checklist_items[0].text, "Milk")
+
+    def test_repeated_reads_reuse_parsed_json_without_sharing_lists(self):
+        self.db.save_note(app.Note(id="cached", title="Cached", content="", labels=["one"]))
+        storage._parse_json_column.cache_clear()
+
+        first = self.db.get_note("cached")
+        first.labels.append("local-only")
+        second = self.db.get_note("cached")
+
+        self.assertEqual(second.labels, ["one"])
+        self.assertGreater(storage._parse_json_column.cache_info().hits, 0)
+
+    def test_rows_load_by_position_when_legacy_columns_were_appended(self):
+        legacy_path = str(Path(self.tmp.name) / "legacy.db")
+        conn = sqlite3.connect(legacy_path)
+        conn.execute(
+            "CREATE TABLE notes (id TEXT PRIMARY KEY, title TEXT DEFAULT '', content TEXT DEFAULT '', "
+            "note_type TEXT DEFAULT 'note', checklist_items TEXT DEFAULT '[]', labels TEXT DEFAULT '[]', "
+            "pinned INTEGER DEFAULT 0, archived INTEGER DEFAULT 0, trashed INTEGER DEFAULT 0, color TEXT DEFAULT '', "
+            "keep_id TEXT, sync_status TEXT DEFAULT 'local_only', local_modified TEXT, remote_modified TEXT, "
+            "content_hash TEXT DEFAULT '', created_at TEXT, updated_at TEXT)"
+        )
+        conn.execute("INSERT INTO notes (id, title, note_type, labels, sync_status) VALUES ('old', 'Old', 'checklist', '[\"a\"]', 'synced')")
+        conn.commit()
+        conn.close()
+
+        legacy = storage.DatabaseManager(legacy_path)
+        try:
+            note = legacy.get_note("old")
+        finally:
+            legacy.close()
+
+        self.assertEqual(note.title, "Old")
+        self.assertEqual(note.note_type, app.NoteType.CHECKLIST)
+        self.assertEqual(note.labels, ["a"])
+        self.assertEqual(note.sync_status, app.SyncStatus.SYNCED)
+        self.assertEqual(note.attachments, [])
+
     def test_search_indexes_checklist_items(self):
         self.db.save_note(app.Note(
             id="checklist",
@@ -60,6 +142,91 @@ class SearchFtsTests(unittest.TestCase):
 
         self.assertEqual([note.id for note in self.db.search_notes("needle")], ["restore"])
 
+    def test_resaving_unchanged_note_keeps_index_and_persists_sync_metadata(self):
+        note = app.Note(id="resave", title="Resave", content="needle")
+        self.db.save_note(note)
+
+        self.assertTrue(self.db.save_note(note))
+        self.assertEqual([found.id for found in self.db.search_notes("needle")], ["resave"])
+
+        note.sync_status = app.SyncStatus.SYNCED
+        note.keep_id = "keep-resave"
+        self.assertTrue(self.db.save_note(note))
+        stored = self.db.get_note("resave")
+
+        self.assertEqual(stored.sync_status, app.SyncStatus.SYNCED)
+        self.assertEqual(stored.keep_id, "keep-resave")
+
+    def test_bulk_save_indexes_every_note(self):
+        notes = [app.Note(id=f"bulk-{index}", title=f"Bulk {index}", content="haystack") for index in range(3)]
+
+        self.assertTrue(self.db.save_notes(notes))
+
+        self.assertEqual(
+            sorted(note.id for note in self.db.search_notes("haystack")),
+            ["bulk-0", "bulk-1", "bulk-2"],
+        )
+
+    def test_loaded_notes_reuse_stored_hash_and_legacy_hashes_are_migrated(self):
+        note = app.Note(id="hashed", title="Hashed", content="body")
+        self.db.save_note(note)
+        self.db.conn.execute("UPDATE notes SET content_hash = 'legacy-md5' WHERE id = 'hashed'")
+        self.db.conn.execute("DELETE FROM settings WHERE key = 'content_hash_version'")
+        self.db.conn.commit()
+        self.db.close()
+
+        self.db = storage.DatabaseManager(self.db.db_path)
+
+        self.assertEqual(self.db.get_note("hashed").content_hash, note.content_hash)
+
+    def test_hash_migration_carries_cloud_bases_to_the_new_hash(self):
+        for note_id in ("kept", "deleted-remotely", "deleted-locally", "edited-remotely"):
+            self.db.save_note(app.Note(id=note_id, title=note_id, content="body"))
+        md5 = {note_id: hashlib.md5(note_id.encode()).hexdigest() for note_id in
+               ("kept", "deleted-remotely", "deleted-locally", "edited-remotely")}
+        for note_id, legacy in md5.items():
+            self.db.conn.execute("UPDATE notes SET content_hash = ? WHERE id = ?", (legacy, note_id))
+        bases = dict(md5, stale="not-a-note")
+        self.db.set_setting("cloud_base_gdrive", bases)
+        self.db.set_setting("cloud_base_github", bases)
+        self.db.set_setting("github_note_blobs", {"kept": ["sha-1", md5["kept"]], "edited-remotely": ["sha-2", "older"]})
+        self.db.conn.execute("DELETE FROM settings WHERE key = 'content_hash_version'")
+        self.db.close()
+
+        self.db = storage.DatabaseManager(self.db.db_path)
+
+        local_notes = self.db.get_all_notes()
+        hashes = {note.id: note.content_hash for note in local_notes}
+        self.assertNotIn(md5["kept"], hashes.values())
+        self.assertEqual(self.db.get_setting("cloud_base_gdrive"), hashes)
+        self.assertEqual(self.db.get_setting("cloud_base_github"), hashes)
+        self.assertEqual(self.db.get_setting("github_note_blobs"), {"kept": ["sha-1", hashes["kept"]]})
+
+        remote = {note.id: note.to_dict() for note in local_notes if note.id != "deleted-remotely"}
+        remote["edited-remotely"]["content"] = "changed remotely"
+        local_notes = [note for note in local_notes if note.id != "deleted-locally"]
+        plan = cloud_plan.build_cloud_sync_plan(local_notes, remote, self.db.get_setting("cloud_base_gdrive"))
+
+        self.assertEqual([note.id for note in plan["delete_local"]], ["deleted-remotely"])
+        self.assertEqual([data["id"] for data in plan["delete_remote"]], ["deleted-locally"])
+        self.assertEqual([data["id"] for data in plan["download_updates"]], ["edited-remotely"])
+        self.assertEqual(plan["conflicts"], [])
+        self.assertEqual(plan["upload_creates"] + plan["upload_updates"] + plan["download_creates"], [])
+
+    def test_trash_and_restore_keep_stored_hash_current(self):
+        note = app.Note(id="trash-hash", title="Trash", content="body")
+        self.db.save_note(note)
+
+        self.db.delete_note("trash-hash")
+        trashed = self.db.get_note("trash-hash")
+        expected = app.Note.from_dict(trashed.to_dict()).content_hash
+
+        self.assertTrue(trashed.trashed)
+        self.assertEqual(trashed.content_hash, expected)
+        self.assertNotEqual(trashed.content_hash, note.content_hash)
+        self.db.restore_note("trash-hash")
+        self.assertEqual(self.db.get_note("trash-hash").content_hash, note.content_hash)
+
     def test_search_can_include_archived_notes(self):
         self.db.save_note(app.Note(
             id="archived",
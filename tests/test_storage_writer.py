@@ -0,0 +1,159 @@
+import tempfile
+import threading
+import unittest
+from concurrent.futures import Future
+from pathlib import Path
+from unittest import mock
+
+import keepsync_notes as app
+
+
+class StorageWriterTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = app.DatabaseManager(str(Path(self.tmp.name) / "notes.db"))
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def test_writes_from_many_threads_are_all_committed(self):
+        def save(index):
+            self.db.save_note(app.Note(id=f"note-{index}", title=f"Note {index}", content="body"))
+
+        threads = [threading.Thread(target=save, args=(index,)) for index in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.db.get_all_notes()), 20)
+        self.assertFalse(self.db.conn.in_transaction)
+
+    def test_connection_uses_explicit_transactions(self):
+        self.assertIsNone(self.db.conn.isolation_level)
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        try:
+            self.db.save_notes([app.Note(id=f"bulk-{index}", title="Bulk", content="") for index in range(3)])
+        finally:
+            self.db.conn.set_trace_callback(None)
+
+        self.assertEqual(statements.count("BEGIN IMMEDIATE"), 1)
+        self.assertEqual(statements.count("COMMIT"), 1)
+        self.assertFalse(self.db.conn.in_transaction)
+
+    def test_bulk_save_indexes_and_labels_every_note(self):
+        notes = [app.Note(id=f"bulk-{index}", title="Bulk", content="", labels=["work"]) for index in range(5)]
+        notes[0].trashed = True
+        self.assertTrue(self.db.save_notes(notes))
+        notes[1].labels = ["home"]
+        self.assertTrue(self.db.save_notes(notes[1:3]))
+
+        expected = [f"bulk-{index}" for index in range(2, 5)]
+        self.assertEqual(sorted(note.id for note in self.db.get_notes_by_label("work")), expected)
+        self.assertEqual([note.id for note in self.db.get_notes_by_label("home")], ["bulk-1"])
+        if self.db.fts_available:
+            self.assertEqual(sorted(note.id for note in self.db.search_notes("bulk")), ["bulk-1"] + expected)
+
+    def test_failed_write_does_not_discard_its_batch(self):
+        good, bad = Future(), Future()
+
+        def insert(cursor):
+            cursor.execute("INSERT INTO settings (key, value) VALUES ('kept', '1')")
+
+        def fail(cursor):
+            cursor.execute("INSERT INTO settings (key, value) VALUES ('dropped', '1')")
+            raise ValueError("boom")
+
+        self.db._apply_write_batch([(insert, good), (fail, bad)])
+
+        self.assertIsNone(good.result())
+        self.assertIsInstance(bad.exception(), ValueError)
+        stored = {row["key"] for row in self.db.conn.execute("SELECT key FROM settings")}
+        self.assertIn("kept", stored)
+        self.assertNotIn("dropped", stored)
+
+    def test_async_save_writes_a_snapshot_of_the_note(self):
+        release = threading.Event()
+        blocker = self.db._submit_write(lambda cursor: release.wait(5))
+        note = app.Note(id="async", title="Before", content="body", labels=["work"])
+
+        saved = self.db.save_note_async(note)
+        note.title = "After"
+        note.labels.append("late")
+        release.set()
+
+        self.assertTrue(saved.result(timeout=5))
+        self.assertTrue(blocker.result(timeout=5))
+        stored = self.db.get_note("async")
+        self.assertEqual(stored.title, "Before")
+        self.assertEqual(stored.labels, ["work"])
+
+    def test_async_save_reports_failure_as_false(self):
+        with mock.patch.object(self.db, "_update_note_labels", side_effect=ValueError("boom")), \
+                mock.patch("builtins.print"):
+            saved = self.db.save_note_async(app.Note(id="broken", title="", content=""))
+
+            self.assertFalse(saved.result(timeout=5))
+        self.assertIsNone(self.db.get_note("broken"))
+
+    def test_settings_many_reads_stored_values_without_querying(self):
+        self.db.set_setting("cloud_sync_interval", 30)
+        self.db.set_setting("github_repo", "notes")
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        try:
+            settings = self.db.get_settings_many({"cloud_auto_sync": True, "cloud_sync_interval": 15, "github_repo": ""})
+        finally:
+            self.db.conn.set_trace_callback(None)
+
+        self.assertEqual(settings, {"cloud_auto_sync": True, "cloud_sync_interval": 30, "github_repo": "notes"})
+        self.assertEqual(statements, [])
+        self.assertEqual(self.db.get_settings_many({}), {})
+
+    def test_settings_many_are_saved_in_one_transaction(self):
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        try:
+            saved = self.db.set_settings_many({"cloud_auto_sync": False, "cloud_sync_interval": 30, "github_repo": "notes"})
+        finally:
+            self.db.conn.set_trace_callback(None)
+
+        self.assertTrue(saved)
+        self.assertEqual(statements.count("BEGIN IMMEDIATE"), 1)
+        self.assertEqual(
+            self.db.get_settings_many({"cloud_auto_sync": True, "cloud_sync_interval": 15, "github_repo": ""}),
+            {"cloud_auto_sync": False, "cloud_sync_interval": 30, "github_repo": "notes"},
+        )
+
+    def test_settings_are_loaded_once_and_kept_current_by_writes(self):
+        self.db.set_setting("theme", "light")
+        self.db.set_setting("saved_searches", [{"id": "s"}])
+        self.db.close()
+        self.db = app.DatabaseManager(self.db.db_path)
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        try:
+            self.assertEqual(self.db.get_setting("theme"), "light")
+            self.db.get_setting("saved_searches").append({"id": "mutated"})
+            self.assertEqual(self.db.get_setting("saved_searches"), [{"id": "s"}])
+            self.assertEqual(self.db.get_setting("missing", 5), 5)
+        finally:
+            self.db.conn.set_trace_callback(None)
+        self.assertEqual(statements, [])
+
+        self.db.delete_setting("theme")
+        self.assertIsNone(self.db.get_setting("theme"))
+
+    def test_close_stops_writer_thread(self):
+        writer = self.db._writer_thread
+        self.db.set_setting("theme", "dark")
+
+        self.db.close()
+
+        self.assertFalse(writer.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
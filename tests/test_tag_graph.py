@@ -31,6 +31,13 @@ class TagGraphTests(unittest.TestCase):
 
         self.assertIn("alpha + beta: 1 note", summary)
 
+    def test_graph_records_use_slots(self):
+        graph = tag_graph.build_tag_graph([app.Note(id="a", title="A", content="", labels=["alpha", "beta"])])
+
+        self.assertFalse(hasattr(graph, "__dict__"))
+        self.assertFalse(hasattr(graph.nodes[0], "__dict__"))
+        self.assertFalse(hasattr(graph.edges[0], "__dict__"))
+
     def test_app_reexports_tag_graph_helpers_for_compatibility(self):
         self.assertIs(app.build_tag_graph, tag_graph.build_tag_graph)
         self.assertIs(app.tag_graph_summary_lines, tag_graph.tag_graph_summary_lines)
@@ -1,4 +1,8 @@
+import tempfile
 import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
 import keepsync_notes as app
 import keepsync_ui_components as components
@@ -16,6 +20,101 @@ class UIComponentsModuleTests(unittest.TestCase):
         self.assertIs(components.markdown_preview_text, app.markdown_preview_text)
         self.assertIs(components.format_reminder_datetime, app.format_reminder_datetime)
 
+    def test_icons_are_cached_per_name_size_and_resolved_color(self):
+        default = components.IconManager.get_icon("pin", 18)
+
+        self.assertIs(components.IconManager.get_icon("pin", 18, components.COLORS["text_secondary"]), default)
+        self.assertIsNot(components.IconManager.get_icon("pin", 14), default)
+        self.assertEqual(components._parse_icon_color("#112233"), (17, 34, 51, 255))
+        self.assertEqual(components._parse_icon_color("red"), (148, 163, 184, 255))
+
+    def test_every_icon_drawer_renders_pixels(self):
+        for name in [*components._ICON_DRAWERS, "unknown"]:
+            with self.subTest(name=name):
+                icon = components.IconManager._create_icon(name, 16, "#ffffff")
+                self.assertIsNotNone(icon.cget("light_image").getbbox())
+
+    def test_sync_badge_displays_are_built_once_per_status(self):
+        badge = components.SyncStatusBadge
+        with mock.patch.object(badge, "_PREBUILT", {}):
+            with mock.patch.object(components.IconManager, "get_icon", wraps=components.IconManager.get_icon) as get_icon:
+                synced = badge._status_display(app.SyncStatus.SYNCED)
+                badge._status_display(app.SyncStatus.CONFLICT)
+                self.assertIs(badge._status_display(app.SyncStatus.SYNCED), synced)
+
+            self.assertEqual(get_icon.call_count, len(badge.STATUS_CONFIG))
+            self.assertEqual(synced[:2], ("Synced", components.COLORS["sync_synced"]))
+            self.assertEqual(badge._status_display("bogus")[0], "Unknown")
+
+    def test_note_card_builds_action_buttons_on_first_hover(self):
+        frame = mock.Mock()
+        card = SimpleNamespace(actions_frame=None, configure=mock.Mock())
+        card._build_actions = mock.Mock(side_effect=lambda: setattr(card, "actions_frame", frame) or frame)
+
+        components.NoteCard._on_leave(card, None)
+        components.NoteCard._on_enter(card, None)
+        components.NoteCard._on_leave(card, None)
+        components.NoteCard._on_enter(card, None)
+
+        card._build_actions.assert_called_once_with()
+        self.assertEqual(frame.place.call_count, 2)
+        frame.place_forget.assert_called_once_with()
+
+    def test_note_card_update_rebuilds_only_when_rendered_fields_change(self):
+        note = app.Note(id="n", title="Plan", content="body")
+        card = SimpleNamespace(
+            note=note, color_strip=None, content_frame=mock.Mock(), actions_frame=mock.Mock(),
+            sync_badge=mock.Mock(status=note.sync_status), _build_ui=mock.Mock(), _bind_events=mock.Mock(),
+            _rendered_hash=note.content_hash,
+        )
+        content_frame, actions_frame = card.content_frame, card.actions_frame
+
+        synced = app.Note(id="n", title="Plan", content="body", sync_status=app.SyncStatus.SYNCED)
+        components.NoteCard.update_from_note(card, synced)
+
+        self.assertIs(card.note, synced)
+        card.sync_badge.update_status.assert_called_once_with(app.SyncStatus.SYNCED)
+        card._build_ui.assert_not_called()
+
+        components.NoteCard.update_from_note(card, app.Note(id="n", title="Plan v2", content="body"))
+
+        content_frame.destroy.assert_called_once_with()
+        actions_frame.destroy.assert_called_once_with()
+        self.assertIsNone(card.actions_frame)
+        card._build_ui.assert_called_once_with()
+        card._bind_events.assert_called_once_with()
+
+    def test_note_card_redraws_after_its_own_note_is_edited_and_saved(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = app.DatabaseManager(str(Path(tmp) / "notes.db"))
+            try:
+                note = app.Note(id="n", title="Plan", content="body")
+                db.save_note(note)
+                card = SimpleNamespace(
+                    note=note, color_strip=None, content_frame=mock.Mock(), actions_frame=None,
+                    sync_badge=mock.Mock(status=note.sync_status), _bind_events=mock.Mock(),
+                )
+                # Stand-in for _build_ui's bookkeeping; the widgets themselves need a display
+                card._build_ui = lambda: setattr(card, "_rendered_hash", card.note.content_hash)
+                card._build_ui()
+                builds = []
+                card._bind_events.side_effect = lambda: builds.append(card.note.title)
+
+                # The editor and pin action change and save the very object the card holds
+                note.title = "Plan v2"
+                db.save_note(note)
+                components.NoteCard.update_from_note(card, db.get_note("n"))
+                note = card.note
+                note.pinned = True
+                db.save_notes([note])
+                components.NoteCard.update_from_note(card, db.get_note("n"))
+                components.NoteCard.update_from_note(card, db.get_note("n"))
+            finally:
+                db.close()
+
+        self.assertEqual(builds, ["Plan v2", "Plan v2"])
+        self.assertTrue(card.note.pinned)
+
 
 if __name__ == "__main__":
     unittest.main()
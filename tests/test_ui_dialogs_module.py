@@ -1,4 +1,10 @@
+import io
+import sys
+import tempfile
 import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
 
 import keepsync_notes as app
 import keepsync_settings_dialog as settings_dialog
@@ -21,6 +27,424 @@ class UIDialogsModuleTests(unittest.TestCase):
         self.assertIs(app.DiagnosticsDialog, dialogs.DiagnosticsDialog)
         self.assertIs(app.SettingsDialog, settings_dialog.SettingsDialog)
 
+    def test_token_dialog_remembers_a_missing_gpsoauth(self):
+        dialog_class = dialogs.TokenGeneratorDialog
+        with mock.patch.object(dialog_class, "_gpsoauth", None), \
+                mock.patch.dict(sys.modules, {"gpsoauth": None}):
+            self.assertIsNone(dialog_class._load_gpsoauth())
+            self.assertIs(dialog_class._gpsoauth, False)
+            with mock.patch("builtins.__import__", side_effect=AssertionError("import retried")):
+                self.assertIsNone(dialog_class._load_gpsoauth())
+
+
+    def test_takeout_dialog_is_reshown_for_the_same_parent(self):
+        dialog_class = dialogs.TakeoutInstructionsDialog
+        parent = object()
+        cached = mock.Mock(master=parent, winfo_exists=mock.Mock(return_value=True))
+        with mock.patch.object(dialog_class, "_instance", cached), \
+                mock.patch.object(dialog_class, "__init__", side_effect=AssertionError("dialog rebuilt")):
+            self.assertIs(dialog_class.show(parent), cached)
+
+        cached.deiconify.assert_called_once_with()
+        cached.transient.assert_called_once_with(parent)
+        cached.grab_set.assert_called_once_with()
+
+    def test_takeout_dialog_hides_instead_of_destroying(self):
+        dialog = mock.Mock()
+
+        dialogs.TakeoutInstructionsDialog.hide(dialog)
+
+        dialog.grab_release.assert_called_once_with()
+        dialog.withdraw.assert_called_once_with()
+        dialog.master.focus_set.assert_called_once_with()
+        dialog.destroy.assert_not_called()
+
+
+    def test_cloud_connect_runs_off_the_ui_thread_and_reports_back_on_it(self):
+        panel = mock.Mock()
+        panel.cloud_sync.connect_gdrive.return_value = (False, "offline")
+        started = []
+
+        class RecordingThread:
+            def __init__(self, target, daemon):
+                self.target = target
+                started.append(self)
+
+            def start(self):
+                pass
+
+        with mock.patch.object(settings_dialog.threading, "Thread", RecordingThread):
+            settings_dialog.SettingsDialog._connect_gdrive(panel)
+
+        panel.gdrive_connect_btn.configure.assert_called_once_with(state="disabled", text="Connecting...")
+        panel.cloud_sync.connect_gdrive.assert_not_called()
+        panel.update.assert_not_called()
+
+        started[0].target()
+        panel._on_ui_thread.assert_called_once_with(panel._on_gdrive_connected, False, "offline")
+
+    def test_ui_thread_calls_run_inline_on_tk_thread_and_are_queued_from_workers(self):
+        panel = mock.Mock()
+        callback = mock.Mock()
+
+        settings_dialog.SettingsDialog._on_ui_thread(panel, callback, "now", state="ok")
+        callback.assert_called_once_with("now", state="ok")
+        panel.after.assert_not_called()
+
+        worker = settings_dialog.threading.Thread(
+            target=settings_dialog.SettingsDialog._on_ui_thread, args=(panel, callback, "later")
+        )
+        worker.start()
+        worker.join()
+        self.assertEqual(callback.call_count, 1)
+        delay, queued = panel.after.call_args.args
+        self.assertEqual(delay, 0)
+        queued()
+        callback.assert_called_with("later")
+
+
+    def test_json_import_saves_conflict_free_notes_in_one_batch(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = app.DatabaseManager(str(Path(tmp) / "notes.db"))
+            try:
+                db.save_note(app.Note(id="existing", title="Groceries", content="milk"))
+                panel = mock.Mock(db=db)
+                panel._save_imported_note_status.return_value = "imported"
+                panel._save_imported_note_statuses.side_effect = (
+                    lambda notes, known=None: settings_dialog.SettingsDialog._save_imported_note_statuses(panel, notes, known)
+                )
+                panel._save_uncontested_imported_notes.side_effect = (
+                    lambda notes, known=None: settings_dialog.SettingsDialog._save_uncontested_imported_notes(panel, notes, known)
+                )
+                notes = [
+                    app.Note(id="a", title="Ideas", content="", labels=["work"]),
+                    app.Note(id="b", title="Groceries", content="eggs"),
+                    app.Note(id="c", title="ideas", content="again"),
+                    None,
+                    app.Note(id="d", title="", content="untitled"),
+                ]
+
+                with mock.patch.object(db, "save_notes", wraps=db.save_notes) as save_notes:
+                    imported = settings_dialog.SettingsDialog._save_imported_notes(panel, notes)
+
+                self.assertEqual(imported, 4)
+                self.assertEqual([note.id for note in save_notes.call_args.args[0]], ["a", "d"])
+                self.assertEqual([call.args[0].id for call in panel._save_imported_note_status.call_args_list], ["b", "c"])
+                self.assertEqual([label.name for label in db.get_all_labels()], ["work"])
+            finally:
+                db.close()
+
+
+    def test_json_export_streams_every_note_into_one_document(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = app.DatabaseManager(str(Path(tmp) / "notes.db"))
+            try:
+                db.save_note(app.Note(id="a", title="Kept", content="", labels=["work"]))
+                db.save_note(app.Note(id="b", title="Binned", content="", trashed=True))
+                db.save_note(app.Note(id="c", title="Shelved", content="", archived=True))
+                db.ensure_labels(["work"])
+                panel = mock.Mock(db=db, db_version=3)
+                stream = io.BytesIO()
+
+                count = settings_dialog.SettingsDialog._write_json_export(panel, stream)
+
+                expected = [note.id for note in db.get_all_notes(include_trashed=True, include_archived=True)]
+                batched = [note.id for note in db.iter_all_notes(include_trashed=True, include_archived=True, batch_size=1)]
+            finally:
+                db.close()
+
+        document = app.json_loads(stream.getvalue())
+        self.assertEqual(count, 3)
+        self.assertEqual(batched, expected)
+        self.assertEqual(document["version"], 3)
+        self.assertEqual([note["id"] for note in document["notes"]], expected)
+        self.assertEqual([label["name"] for label in document["labels"]], ["work"])
+
+
+    def test_json_export_writes_through_a_large_binary_buffer(self):
+        panel = mock.Mock(EXPORT_BUFFER_SIZE=settings_dialog.SettingsDialog.EXPORT_BUFFER_SIZE)
+        panel._write_json_export.return_value = 2
+        with mock.patch.object(settings_dialog.filedialog, "asksaveasfilename", return_value="/tmp/export.json"), \
+                mock.patch.object(settings_dialog, "open", mock.mock_open(), create=True) as opener, \
+                mock.patch.object(settings_dialog.messagebox, "showinfo") as showinfo:
+            settings_dialog.SettingsDialog._export_notes(panel)
+
+        opener.assert_called_once_with("/tmp/export.json", "wb", buffering=1 << 20)
+        panel._write_json_export.assert_called_once_with(opener.return_value)
+        self.assertIn("Exported 2 notes", showinfo.call_args.args[1])
+
+    def test_takeout_parser_builds_notes_from_one_set_of_lookups(self):
+        panel = mock.Mock()
+        panel.db.db_path = str(Path("data") / "notes.db")
+        parse = settings_dialog.SettingsDialog._takeout_note_parser(panel, None)
+
+        checklist = parse({
+            "title": "Shopping",
+            "listContent": [{"text": "milk", "isChecked": True}, {}],
+            "labels": [{"name": "home"}, {"name": ""}, {}],
+            "isPinned": True,
+        })
+        text = parse({"textContent": "body", "isArchived": True})
+
+        self.assertEqual(checklist.note_type, app.NoteType.CHECKLIST)
+        self.assertEqual([(item.text, item.checked) for item in checklist.checklist_items], [("milk", True), ("", False)])
+        self.assertEqual(checklist.labels, ["home"])
+        self.assertTrue(checklist.pinned)
+        self.assertEqual((text.note_type, text.title, text.content, text.archived), (app.NoteType.NOTE, "", "body", True))
+        self.assertEqual(text.sync_status, app.SyncStatus.LOCAL_ONLY)
+        self.assertNotEqual(checklist.id, text.id)
+        self.assertIsNone(parse({"listContent": None}))
+
+    def test_json_import_yields_notes_from_each_file_shape(self):
+        panel = mock.Mock()
+        panel._parse_takeout_note.side_effect = lambda data, base: app.Note(id="keep", title=data["title"], content="")
+        panel._takeout_note_parser.side_effect = lambda base: lambda data: panel._parse_takeout_note(data, base)
+        panel._native_import_note.side_effect = lambda data: settings_dialog.SettingsDialog._native_import_note(panel, data)
+        base = Path(".")
+
+        def titles(document):
+            notes = settings_dialog.SettingsDialog._iter_json_import_notes(panel, io.BytesIO(document), base)
+            return [note.title if note else None for note in notes]
+
+        self.assertEqual(titles(b'[3, {"title": "Takeout", "textContent": ""}, {"title": "More", "listContent": []}]'), [None, "Takeout", "More"])
+        self.assertEqual(titles(b'[{"id": "x", "title": "Ours", "content": ""}, {"id": "y", "content": "untitled"}]'), ["Ours", ""])
+        self.assertEqual(panel._takeout_note_parser.call_count, 1)
+        # Mixed shapes are parsed item by item, and a malformed item is skipped rather than raising
+        self.assertEqual(
+            titles(b'[{"title": "Ours", "content": ""}, {"title": "Keep", "textContent": ""}, {"title": "Bad", "checklist_items": 5}]'),
+            ["Ours", "Keep", None],
+        )
+        self.assertEqual(titles(b'{"notes": [{"title": "Bad", "checklist_items": 5}, {"title": "Fine", "content": ""}]}'), [None, "Fine"])
+        self.assertEqual(titles(b'{"version": 1, "notes": [{"id": "x", "title": "Wrapped", "content": ""}]}'), ["Wrapped"])
+        self.assertEqual(titles(b'{"title": "Single", "textContent": "body"}'), ["Single"])
+        self.assertEqual(titles(b'{"version": 1}'), [])
+
+    def test_json_import_reports_malformed_items_as_skipped(self):
+        panel = mock.Mock(IMPORT_BATCH_SIZE=100)
+        panel.db.get_all_labels.return_value = []
+        good = app.Note(id="a", title="Good", content="")
+        panel._iter_json_import_notes.return_value = iter([good, None, None])
+        panel._save_imported_notes.return_value = 1
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "notes.json"
+            path.write_bytes(b"[]")
+            with mock.patch.object(settings_dialog.filedialog, "askopenfilename", return_value=str(path)), \
+                    mock.patch.object(settings_dialog, "LocalBackupManager"), \
+                    mock.patch.object(settings_dialog.messagebox, "showinfo") as showinfo:
+                settings_dialog.SettingsDialog._import_notes(panel)
+
+        panel._save_imported_notes.assert_called_once_with([good], set())
+        showinfo.assert_called_once_with("Import Complete", "Imported 1 notes\nSkipped 2 that could not be read")
+
+
+    def test_settings_tabs_are_built_once_on_first_reveal(self):
+        data_builder = mock.Mock()
+        panel = mock.Mock(_tab_builders={"📦 Data": data_builder})
+        panel.tabview.get.return_value = "📦 Data"
+
+        settings_dialog.SettingsDialog._on_tab_changed(panel)
+        settings_dialog.SettingsDialog._on_tab_changed(panel)
+        panel.tabview.get.return_value = "☁️ Cloud Sync"
+        settings_dialog.SettingsDialog._on_tab_changed(panel)
+
+        data_builder.assert_called_once_with()
+        self.assertEqual(panel._tab_builders, {})
+
+
+    def test_cloud_disconnect_button_is_built_on_first_connect_and_hidden_after(self):
+        panel = mock.Mock(cloud_disconnect_btn=None, _cloud_disconnect_visible=False)
+
+        settings_dialog.SettingsDialog._show_cloud_disconnect(panel, False)
+        self.assertIsNone(panel.cloud_disconnect_btn)
+
+        with mock.patch.object(settings_dialog.ctk, "CTkButton") as button_class, \
+                mock.patch.object(settings_dialog, "ui_font"):
+            settings_dialog.SettingsDialog._show_cloud_disconnect(panel, True)
+            settings_dialog.SettingsDialog._show_cloud_disconnect(panel, True)
+            settings_dialog.SettingsDialog._show_cloud_disconnect(panel, False)
+
+        button_class.assert_called_once()
+        self.assertIs(button_class.call_args.args[0], panel.cloud_scroll)
+        panel.cloud_disconnect_btn.pack.assert_called_once_with(fill="x", pady=(0, 15))
+        panel.cloud_disconnect_btn.pack_forget.assert_called_once_with()
+
+
+    def test_settings_dialog_builds_fonts_through_the_shared_cache(self):
+        source = Path(settings_dialog.__file__).read_text(encoding="utf-8")
+
+        self.assertNotIn("ctk.CTkFont(", source)
+        self.assertIs(settings_dialog.ui_font, dialogs.ui_font)
+
+
+    def test_autosync_changes_are_coalesced_into_one_write(self):
+        panel = mock.Mock(_autosync_save_after_id=None, AUTOSYNC_SAVE_DELAY_MS=200)
+        panel.after.side_effect = ["after#1", "after#2"]
+        panel.cloud_autosync_var.get.return_value = False
+        panel.cloud_sync_interval.get.return_value = "30"
+
+        settings_dialog.SettingsDialog._save_autosync_settings(panel)
+        settings_dialog.SettingsDialog._save_autosync_settings(panel)
+
+        panel.after_cancel.assert_called_once_with("after#1")
+        panel.after.assert_called_with(200, panel._save_autosync_settings_now)
+        panel.db.set_settings_many.assert_not_called()
+
+        panel.cloud_sync_interval.get.return_value = "soon"
+        settings_dialog.SettingsDialog._save_autosync_settings_now(panel)
+
+        self.assertIsNone(panel._autosync_save_after_id)
+        panel.db.set_settings_many.assert_called_once_with({"cloud_auto_sync": False})
+        panel.db.set_setting.assert_not_called()
+
+    def test_gdrive_instructions_fill_in_the_credentials_path(self):
+        with mock.patch.object(settings_dialog, "get_google_drive_credentials_path", return_value="/creds.json"), \
+                mock.patch.object(settings_dialog.messagebox, "showinfo") as showinfo:
+            settings_dialog.SettingsDialog._show_gdrive_instructions(mock.Mock())
+
+        title, text = showinfo.call_args.args
+        self.assertEqual(title, "Google Drive Setup")
+        self.assertIn("5. Save the JSON file as:\n   /creds.json\n", text)
+
+    def test_loading_settings_writes_each_widget_once(self):
+        settings = {"cloud_auto_sync": True, "cloud_sync_interval": 30, "github_repo": "notes"}
+        panel = mock.Mock()
+        panel.db.get_settings_many.side_effect = lambda defaults: {**defaults, **settings}
+
+        settings_dialog.SettingsDialog._load_settings(panel)
+
+        panel.db.get_settings_many.assert_called_once()
+        panel.db.get_setting.assert_not_called()
+
+        panel.cloud_autosync_var.set.assert_not_called()
+        panel.cloud_sync_interval.delete.assert_not_called()
+        panel.cloud_sync_interval.insert.assert_called_once_with(0, "30")
+        panel.github_repo_entry.insert.assert_called_once_with(0, "notes")
+        panel._update_cloud_status.assert_called_once_with()
+
+
+    def test_cloud_status_label_is_reconfigured_only_when_its_text_changes(self):
+        panel = mock.Mock(_cloud_status_display=("Not connected to any cloud service", theme.COLORS["text_muted"]))
+        panel.cloud_sync.is_connected.return_value = False
+
+        settings_dialog.SettingsDialog._update_cloud_status(panel)
+        panel.cloud_status_label.configure.assert_not_called()
+        panel._show_cloud_disconnect.assert_called_once_with(False)
+
+        panel.cloud_sync.is_connected.return_value = True
+        panel.cloud_sync.get_status.return_value = {"provider": "GitHub", "last_sync": None}
+        settings_dialog.SettingsDialog._update_cloud_status(panel)
+        settings_dialog.SettingsDialog._update_cloud_status(panel)
+
+        panel.cloud_status_label.configure.assert_called_once_with(
+            text="✓ Connected to GitHub", text_color=theme.COLORS["accent_green"]
+        )
+
+    def test_cloud_status_formats_last_sync_without_reparsing(self):
+        panel = mock.Mock(_cloud_status_display=None)
+        panel.cloud_sync.is_connected.return_value = True
+        last_sync = datetime(2026, 3, 4, 5, 6, 7, 890, tzinfo=timezone.utc)
+
+        for stored in (last_sync.isoformat(), "2026-03-04"):
+            panel.cloud_sync.get_status.return_value = {"provider": "GitHub", "last_sync": stored}
+            settings_dialog.SettingsDialog._update_cloud_status(panel)
+            expected = datetime.fromisoformat(stored).strftime("%Y-%m-%d %H:%M")
+            self.assertEqual(
+                panel.cloud_status_label.configure.call_args.kwargs["text"],
+                f"✓ Connected to GitHub\nLast sync: {expected}",
+            )
+
+
+    def test_json_import_batches_only_ensure_labels_not_seen_yet(self):
+        panel = mock.Mock()
+        panel.db.find_import_conflict.return_value = None
+        panel.db.save_notes.return_value = True
+        panel.db.ensure_labels.return_value = True
+        panel._save_imported_note_statuses.side_effect = (
+            lambda notes, known=None: settings_dialog.SettingsDialog._save_imported_note_statuses(panel, notes, known)
+        )
+        panel._save_uncontested_imported_notes.side_effect = (
+            lambda notes, known=None: settings_dialog.SettingsDialog._save_uncontested_imported_notes(panel, notes, known)
+        )
+        known = {"work"}
+
+        settings_dialog.SettingsDialog._save_imported_notes(
+            panel, [app.Note(id="a", title="A", content="", labels=["work", "home"])], known
+        )
+        settings_dialog.SettingsDialog._save_imported_notes(
+            panel, [app.Note(id="b", title="B", content="", labels=["home", "work"])], known
+        )
+
+        panel.db.ensure_labels.assert_called_once_with({"home"})
+        self.assertEqual(known, {"work", "home"})
+
+    def test_import_statuses_keep_note_order_with_one_batch_save(self):
+        panel = mock.Mock()
+        panel.db.find_import_conflict.side_effect = lambda note: note if note.id == "dup" else None
+        panel.db.save_notes.return_value = True
+        panel._save_imported_note_status.return_value = "skipped"
+        panel._save_uncontested_imported_notes.side_effect = (
+            lambda notes, known=None: settings_dialog.SettingsDialog._save_uncontested_imported_notes(panel, notes, known)
+        )
+        notes = [
+            app.Note(id="a", title="A", content=""),
+            None,
+            app.Note(id="dup", title="Old", content=""),
+            app.Note(id="b", title="B", content=""),
+        ]
+
+        statuses = settings_dialog.SettingsDialog._save_imported_note_statuses(panel, notes)
+
+        self.assertEqual(statuses, ["imported", "failed", "skipped", "imported"])
+        panel.db.save_notes.assert_called_once_with([notes[0], notes[3]])
+        panel._save_imported_note_status.assert_called_once_with(notes[2])
+
+        panel.db.save_notes.return_value = False
+        self.assertEqual(
+            settings_dialog.SettingsDialog._save_imported_note_statuses(panel, [app.Note(id="c", title="C", content="")]),
+            ["failed"],
+        )
+
+    def test_import_worker_saves_clean_notes_and_leaves_conflicts_to_the_ui_thread(self):
+        notes = [app.Note(id="a", title="A", content=""), app.Note(id="dup", title="Old", content="")]
+        panel = mock.Mock(app_name="KeepSync", app_version="1")
+        panel._save_uncontested_imported_notes.return_value = (["imported", None], [1])
+        panel._save_imported_note_status.return_value = "skipped"
+        ui_calls = []
+        panel._on_ui_thread.side_effect = lambda fn, *args, **kwargs: (ui_calls.append(fn), fn(*args, **kwargs))
+
+        class InlineThread:
+            def __init__(self, target, daemon):
+                self.target = target
+
+            def start(self):
+                self.target()
+
+        with mock.patch.object(settings_dialog, "ImportProgressDialog"), \
+                mock.patch.object(settings_dialog, "LocalBackupManager"), \
+                mock.patch.object(settings_dialog, "MultiSourceImporter"), \
+                mock.patch.object(settings_dialog.threading, "Thread", InlineThread):
+            settings_dialog.SettingsDialog._run_import_with_progress(
+                panel, "Importing", "Google Takeout", lambda importer: notes, "empty"
+            )
+
+        panel._save_uncontested_imported_notes.assert_called_once_with(notes)
+        panel._save_imported_note_status.assert_called_once_with(notes[1])
+        panel._show_import_summary.assert_called_once_with("Google Takeout", notes, ["imported", "skipped"])
+        self.assertEqual(ui_calls[-1].__name__, "complete")
+
+    def test_static_label_helper_builds_and_packs_in_one_call(self):
+        parent = object()
+        with mock.patch.object(settings_dialog.ctk, "CTkLabel") as label_cls, \
+                mock.patch.object(settings_dialog, "ui_font", return_value="font") as font:
+            label = settings_dialog._static_label(parent, "Title", 14, "text_primary", weight="bold", anchor="w", pady=4)
+
+        font.assert_called_once_with(size=14, weight="bold")
+        label_cls.assert_called_once_with(
+            parent, text="Title", font="font", text_color=theme.COLORS["text_primary"], justify="center"
+        )
+        label.pack.assert_called_once_with(anchor="w", pady=4)
+
 
 if __name__ == "__main__":
     unittest.main()
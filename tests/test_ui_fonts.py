@@ -0,0 +1,48 @@
+import importlib.util
+import sys
+import unittest
+from unittest import mock
+
+import keepsync_note_editor as note_editor
+import keepsync_ui_fonts as fonts
+
+
+class UIFontTests(unittest.TestCase):
+    def setUp(self):
+        fonts.ui_font.cache_clear()
+        self.addCleanup(fonts.ui_font.cache_clear)
+
+    def test_fonts_are_built_once_per_size_weight_and_family(self):
+        with mock.patch.object(fonts.ctk, "CTkFont", side_effect=lambda **kwargs: object()) as font_class:
+            body = fonts.ui_font(size=12)
+            self.assertIs(fonts.ui_font(size=12), body)
+            bold = fonts.ui_font(size=12, weight="bold")
+            mono = fonts.ui_font(size=12, family="Consolas")
+
+        self.assertEqual(len({id(body), id(bold), id(mono)}), 3)
+        self.assertEqual(font_class.call_count, 3)
+        font_class.assert_any_call(family="Consolas", size=12, weight=None)
+
+    def test_monospace_family_matches_the_platform(self):
+        for platform, family in (("win32", "Consolas"), ("darwin", "Menlo"), ("linux", "DejaVu Sans Mono")):
+            with self.subTest(platform=platform), mock.patch.object(sys, "platform", platform):
+                # A private copy, so the imported module and its font cache stay untouched
+                spec = importlib.util.spec_from_file_location("_keepsync_ui_fonts_probe", fonts.__file__)
+                probe = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(probe)
+                self.assertEqual(probe.MONO_FAMILY, family)
+
+    def test_markdown_code_tags_use_the_monospace_family(self):
+        widget = mock.Mock()
+        editor = mock.Mock()
+        editor._markdown_preview_widget.return_value = widget
+
+        note_editor.NoteEditor._configure_markdown_preview_tags(editor)
+
+        fonts_by_tag = {call.args[0]: call.kwargs.get("font") for call in widget.tag_configure.call_args_list}
+        self.assertEqual(fonts_by_tag["code_block"], (fonts.MONO_FAMILY, 12))
+        self.assertEqual(fonts_by_tag["inline_code"], (fonts.MONO_FAMILY, 12))
+        self.assertIs(note_editor.MONO_FAMILY, fonts.MONO_FAMILY)
+
+if __name__ == "__main__":
+    unittest.main()